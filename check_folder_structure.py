@@ -7,9 +7,18 @@ output 폴더의 각 Minor 폴더 구조 확인 스크립트
 import os
 from pathlib import Path
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
 
 OUTPUT_DIR = Path("output")
-image_extensions = {'.jpg', '.jpeg', '.png', '.JPG', '.JPEG', '.PNG'}
+image_extensions = {'.jpg', '.jpeg', '.png'}  # 소문자로 비교
+
+def count_images(folder_path):
+    """폴더의 이미지 파일 개수를 셉니다 (os.scandir의 캐시된 파일 타입 사용)"""
+    with os.scandir(folder_path) as entries:
+        return sum(1 for entry in entries
+                   if entry.is_file() and os.path.splitext(entry.name)[1].lower() in image_extensions)
 
 def check_folder_structure():
     """
@@ -30,28 +39,29 @@ def check_folder_structure():
     
     # Minor 폴더들 찾기 및 번호 추출
     minor_folders = []
-    for f in OUTPUT_DIR.iterdir():
-        if f.is_dir() and f.name.startswith('Minor_'):
-            try:
-                # Minor_XXXX 형식에서 숫자 추출
-                minor_num = int(f.name.replace('Minor_', ''))
-                minor_folders.append((minor_num, f))
-            except ValueError:
-                # 숫자가 아닌 경우 (예: Minor_Unknown 등)
-                print(f"⚠️  숫자가 아닌 폴더명: {f.name}")
-                continue
+    with os.scandir(OUTPUT_DIR) as entries:
+        for f in entries:
+            if f.name.startswith('Minor_') and f.is_dir():
+                try:
+                    # Minor_XXXX 형식에서 숫자 추출
+                    minor_num = int(f.name.replace('Minor_', ''))
+                    minor_folders.append((minor_num, f))
+                except ValueError:
+                    # 숫자가 아닌 경우 (예: Minor_Unknown 등)
+                    print(f"⚠️  숫자가 아닌 폴더명: {f.name}")
+                    continue
     
     # 번호순으로 정렬
     minor_folders.sort(key=lambda x: x[0])
     
     print(f"\n📁 총 {len(minor_folders)}개 Minor 폴더 확인 중...\n")
     
-    # 각 폴더의 이미지 개수 확인
-    for minor_num, folder in minor_folders:
-        # 이미지 파일 개수 세기
-        image_files = [f for f in folder.iterdir() 
-                      if f.is_file() and f.suffix in image_extensions]
-        count = len(image_files)
+    # 각 폴더의 이미지 개수 확인 (디렉토리 읽기는 I/O 대기이므로 스레드로 동시 처리)
+    max_workers = min(32, (os.cpu_count() or 4) * 4)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        counts = list(executor.map(count_images, [folder.path for _, folder in minor_folders]))
+    
+    for (minor_num, folder), count in zip(minor_folders, counts):
         folder_counts[minor_num] = count
         
         if count != 2:
@@ -63,15 +73,14 @@ def check_folder_structure():
         max_num = minor_folders[-1][0]
         existing_nums = set([num for num, _ in minor_folders])
         
-        # 빠진 번호 찾기
-        missing_nums = []
-        for num in range(min_num, max_num + 1):
-            if num not in existing_nums:
-                missing_nums.append(num)
+        # 빠진 번호 찾기 (NumPy 집합 차집합, 결과는 정렬된 배열)
+        all_nums = np.arange(min_num, max_num + 1, dtype=np.int64)
+        existing_arr = np.fromiter(existing_nums, dtype=np.int64, count=len(existing_nums))
+        missing_nums = np.setdiff1d(all_nums, existing_arr, assume_unique=True)
     else:
         min_num = max_num = 0
         existing_nums = set()
-        missing_nums = []
+        missing_nums = np.empty(0, dtype=np.int64)
     
     # 결과 출력
     print(f"\n📊 폴더 순서 확인:")
@@ -80,35 +89,23 @@ def check_folder_structure():
     print(f"  총 폴더 수: {len(minor_folders)}개")
     print(f"  예상 폴더 수: {max_num - min_num + 1}개")
     
-    if missing_nums:
+    if len(missing_nums):
         print(f"  ❌ 빠진 번호: {len(missing_nums)}개")
         print(f"\n⚠️  빠진 Minor 번호들:")
-        # 연속된 구간으로 그룹화
-        if missing_nums:
-            ranges = []
-            start = missing_nums[0]
-            end = missing_nums[0]
-            
-            for num in missing_nums[1:]:
-                if num == end + 1:
-                    end = num
-                else:
-                    if start == end:
-                        ranges.append(f"Minor_{start:04d}")
-                    else:
-                        ranges.append(f"Minor_{start:04d} ~ Minor_{end:04d}")
-                    start = num
-                    end = num
-            
+        # 연속된 구간으로 그룹화 (차이가 1이 아닌 지점에서 분할)
+        groups = np.split(missing_nums, np.where(np.diff(missing_nums) != 1)[0] + 1)
+        ranges = []
+        for group in groups:
+            start, end = int(group[0]), int(group[-1])
             if start == end:
                 ranges.append(f"Minor_{start:04d}")
             else:
                 ranges.append(f"Minor_{start:04d} ~ Minor_{end:04d}")
-            
-            for i, range_str in enumerate(ranges[:50]):  # 처음 50개만 표시
-                print(f"    {range_str}")
-            if len(ranges) > 50:
-                print(f"    ... 외 {len(ranges) - 50}개")
+        
+        for i, range_str in enumerate(ranges[:50]):  # 처음 50개만 표시
+            print(f"    {range_str}")
+        if len(ranges) > 50:
+            print(f"    ... 외 {len(ranges) - 50}개")
     else:
         print(f"  ✅ 모든 번호가 연속적으로 존재합니다!")
     
@@ -151,10 +148,10 @@ def check_folder_structure():
     print(f"\n" + "="*70)
     print("단계 3: 구조 확인 완료")
     print("="*70)
-    print(f"  폴더 순서: {'✅ 정상' if not missing_nums else f'❌ {len(missing_nums)}개 빠짐'}")
+    print(f"  폴더 순서: {'✅ 정상' if not len(missing_nums) else f'❌ {len(missing_nums)}개 빠짐'}")
     print(f"  이미지 개수: {'✅ 모두 2장' if not folders_with_wrong_count else f'❌ {len(folders_with_wrong_count)}개 폴더 이상'}")
     print("="*70)
-    if not missing_nums and not folders_with_wrong_count:
+    if not len(missing_nums) and not folders_with_wrong_count:
         print("\n✅ 모든 폴더가 정상입니다!")
         print("다음 단계: create_pdf.py 실행하여 PDF 생성")
     else:
@@ -24,16 +24,22 @@ PRETENDARD_BOLD = "Pretendard-Bold"
 PRETENDARD_FONT_REGULAR_PATH = FONTS_DIR / "Pretendard-Regular.ttf"
 PRETENDARD_FONT_BOLD_PATH = FONTS_DIR / "Pretendard-Bold.ttf"
 
+# 파일 존재 여부 (모듈 로드 시 한 번만 확인하여 페이지마다 stat 호출 방지)
+FONT_REGULAR_AVAILABLE = PRETENDARD_FONT_REGULAR_PATH.exists()
+LOGO_AVAILABLE = LOGO_PATH.exists()
+
 # PDF 기본 치수
 PAGE_WIDTH, PAGE_HEIGHT = A4
 MARGIN = 20 * mm
 FOOTER_HEIGHT = 15 * mm
 FOOTER_BOTTOM_MARGIN = 15 * mm
+WATERMARK_ROTATION = 45
+WATERMARK_FORM_NAME = "watermark"
 
 def setup_fonts():
     """Pretendard 폰트 설정"""
     try:
-        if PRETENDARD_FONT_REGULAR_PATH.exists():
+        if FONT_REGULAR_AVAILABLE:
             pdfmetrics.registerFont(TTFont(PRETENDARD_REGULAR, str(PRETENDARD_FONT_REGULAR_PATH), subfontIndex=0))
         if PRETENDARD_FONT_BOLD_PATH.exists():
             pdfmetrics.registerFont(TTFont(PRETENDARD_BOLD, str(PRETENDARD_FONT_BOLD_PATH), subfontIndex=0))
@@ -46,65 +52,101 @@ def convert_to_rgb(img):
     """이미지를 RGB 모드로 변환"""
     if img.mode == 'RGB':
         return img
-    try:
-        if img.mode == 'RGBA':
-            background = Image.new('RGB', img.size, (255, 255, 255))
-            background.paste(img, mask=img.split()[3])
-            return background
-        else:
-            return img.convert('RGB')
-    except:
+    if img.mode in ('RGBA', 'LA'):
+        # 알파 채널이 있는 경우에만 흰 배경에 합성
         background = Image.new('RGB', img.size, (255, 255, 255))
-        background.paste(img)
+        background.paste(img, mask=img.getchannel('A'))
         return background
+    return img.convert('RGB')
+
+# 로고 캐시 (첫 사용 시 한 번만 디코드/인코딩하여 모든 페이지에서 재사용)
+_logo_cache = None
+
+def load_logos():
+    """로고 이미지를 한 번만 읽어 워터마크/푸터용 ImageReader와 치수를 캐시"""
+    global _logo_cache
+    if _logo_cache is not None:
+        return _logo_cache
+    
+    logo_img = Image.open(LOGO_PATH)
+    
+    # 워터마크: 그레이스케일 1채널(DeviceGray) 그대로 사용 (PIL 이미지를 ImageReader에 바로 전달, PNG 인코딩/디코딩 생략)
+    watermark_img = logo_img.convert('L')
+    watermark_width = 35 * mm
+    watermark_height = watermark_width * watermark_img.height / watermark_img.width
+    
+    # 워터마크 타일 중심 좌표 (페이지와 무관하므로 한 번만 계산)
+    spacing_x = 55 * mm
+    spacing_y = 35 * mm
+    half_diag = math.sqrt(watermark_width**2 + watermark_height**2) / 2
+    start_x = half_diag - watermark_width/2 - spacing_x
+    end_x = PAGE_WIDTH + spacing_x
+    end_y = PAGE_HEIGHT + 100 * mm
+    watermark_positions = []
+    y = -100 * mm
+    row = 0
+    while y < end_y:
+        x = start_x if row % 2 == 0 else start_x + (spacing_x / 2)
+        while x < end_x:
+            watermark_positions.append((x + watermark_width/2, y + watermark_height/2))
+            x += spacing_x
+        y += spacing_y
+        row += 1
+    
+    # 푸터 로고: 목표 크기로 리사이즈 후 JPEG로 한 번만 인코딩
+    logo_max_width = 35 * mm
+    logo_max_height = FOOTER_HEIGHT - 5 * mm
+    ratio = min(logo_max_width / logo_img.width, logo_max_height / logo_img.height, 1.0)
+    footer_width = logo_img.width * ratio * 0.75
+    footer_height = logo_img.height * ratio * 0.75
+    # 알파 합성은 축소된 이미지에서 수행 (원본 크기 RGB 변환 생략)
+    footer_img = logo_img.resize((int(logo_img.width * ratio), int(logo_img.height * ratio)), Image.Resampling.LANCZOS)
+    footer_buffer = BytesIO()
+    convert_to_rgb(footer_img).save(footer_buffer, format='JPEG', quality=95)
+    footer_buffer.seek(0)
+    
+    _logo_cache = {
+        'watermark_reader': ImageReader(watermark_img),
+        'watermark_size': (watermark_width, watermark_height),
+        'watermark_positions': watermark_positions,
+        'footer_reader': ImageReader(footer_buffer),
+        'footer_box': (PAGE_WIDTH - MARGIN - footer_width, FOOTER_BOTTOM_MARGIN, footer_width, footer_height),
+    }
+    return _logo_cache
 
 def draw_watermark(canvas_obj, doc):
     """워터마크 그리기"""
-    if not LOGO_PATH.exists():
+    if not LOGO_AVAILABLE:
         return
     
     c = canvas_obj
     try:
-        logo_img = Image.open(LOGO_PATH).convert('L').convert('RGB')
-        watermark_width = 35 * mm
-        watermark_height = watermark_width * logo_img.height / logo_img.width
-        
-        rotation = 45
-        spacing_x = 55 * mm
-        spacing_y = 35 * mm
+        # 타일 전체를 Form XObject로 한 번만 기록하고 이후 페이지는 참조만 함
+        if not c.hasForm(WATERMARK_FORM_NAME):
+            logos = load_logos()
+            img_reader = logos['watermark_reader']
+            watermark_width, watermark_height = logos['watermark_size']
+            
+            # 좌표계를 한 번만 회전하고, 각 타일 중심을 회전된 좌표로 변환해서 그림 (타일마다 q/cm/Q 생략)
+            theta = math.radians(WATERMARK_ROTATION)
+            cos_t, sin_t = math.cos(theta), math.sin(theta)
+            
+            c.beginForm(WATERMARK_FORM_NAME, 0, 0, PAGE_WIDTH, PAGE_HEIGHT)
+            c.saveState()
+            c.rotate(WATERMARK_ROTATION)
+            for center_x, center_y in logos['watermark_positions']:
+                rotated_x = center_x * cos_t + center_y * sin_t
+                rotated_y = center_y * cos_t - center_x * sin_t
+                c.drawImage(img_reader, rotated_x - watermark_width/2, rotated_y - watermark_height/2,
+                            width=watermark_width, height=watermark_height, mask='auto')
+            c.restoreState()
+            c.endForm()
         
+        # 투명도는 Form 바깥(페이지 그래픽 상태)에서 설정 - Form에는 타일 배치만 기록
         c.saveState()
         c.setFillAlpha(0.08)
         c.setStrokeAlpha(0.08)
-        
-        diagonal = math.sqrt(watermark_width**2 + watermark_height**2)
-        half_diag = diagonal / 2
-        
-        start_x = half_diag - watermark_width/2 - spacing_x
-        end_x = PAGE_WIDTH + spacing_x
-        start_y = -100 * mm
-        end_y = PAGE_HEIGHT + 100 * mm
-        
-        buffer = BytesIO()
-        logo_img.save(buffer, format='PNG')
-        buffer.seek(0)
-        img_reader = ImageReader(buffer)
-        
-        y = start_y
-        row = 0
-        while y < end_y:
-            x = start_x if row % 2 == 0 else start_x + (spacing_x / 2)
-            while x < end_x:
-                c.saveState()
-                c.translate(x + watermark_width/2, y + watermark_height/2)
-                c.rotate(rotation)
-                c.drawImage(img_reader, -watermark_width/2, -watermark_height/2, 
-                          width=watermark_width, height=watermark_height, mask='auto')
-                c.restoreState()
-                x += spacing_x
-            y += spacing_y
-            row += 1
-            
+        c.doForm(WATERMARK_FORM_NAME)
         c.restoreState()
     except Exception as e:
         print(f"  ⚠ 워터마크 오류: {e}")
@@ -115,9 +157,8 @@ def draw_footer(canvas_obj, doc, page_num):
     footer_y = FOOTER_BOTTOM_MARGIN
     
     # Page Number
-    fonts_available = PRETENDARD_FONT_REGULAR_PATH.exists()
     try:
-        if fonts_available:
+        if FONT_REGULAR_AVAILABLE:
             c.setFont(PRETENDARD_REGULAR, 8)
         else:
             c.setFont("Helvetica", 8)
@@ -127,286 +168,245 @@ def draw_footer(canvas_obj, doc, page_num):
     c.drawString(MARGIN, footer_y, f"Page {page_num}")
     
     # Logo
-    if LOGO_PATH.exists():
+    if LOGO_AVAILABLE:
         try:
-            logo_img = Image.open(LOGO_PATH)
-            logo_max_width = 35 * mm
-            logo_max_height = FOOTER_HEIGHT - 5 * mm
-            
-            ratio = min(logo_max_width / logo_img.width, logo_max_height / logo_img.height, 1.0)
-            logo_width = logo_img.width * ratio * 0.75
-            logo_height = logo_img.height * ratio * 0.75
-            
-            logo_x = PAGE_WIDTH - MARGIN - logo_width
-            
-            buffer = BytesIO()
-            logo_img = convert_to_rgb(logo_img)
-            logo_img.resize((int(logo_img.width * ratio), int(logo_img.height * ratio)), Image.Resampling.LANCZOS).save(buffer, format='JPEG', quality=95)
-            buffer.seek(0)
-            
-            c.drawImage(ImageReader(buffer), logo_x, footer_y, width=logo_width, height=logo_height, preserveAspectRatio=True)
+            logos = load_logos()
+            logo_x, logo_y, logo_width, logo_height = logos['footer_box']
+            c.drawImage(logos['footer_reader'], logo_x, logo_y, width=logo_width, height=logo_height, preserveAspectRatio=True)
         except Exception as e:
             print(f"  ⚠ 로고 오류: {e}")
 
-def create_filename_guide_pdf():
-    """파일명 규칙 가이드 PDF 생성"""
-    output_path = Path("파일명_규칙_가이드.pdf")
-    print(f"📄 PDF 생성 시작: {output_path.absolute()}")
+# 스타일 캐시 (폰트 등록과 스타일 생성은 한 번만 수행)
+_guide_styles = None
+
+def get_guide_styles():
+    """가이드 문서용 스타일 생성 (한글 폰트가 있으면 사용, 없으면 기본 폰트)"""
+    global _guide_styles
+    if _guide_styles is not None:
+        return _guide_styles
     
-    try:
-        # PDF 문서 생성
-        doc = SimpleDocTemplate(
-            str(output_path),
-            pagesize=A4,
-            rightMargin=20*mm,
-            leftMargin=20*mm,
-            topMargin=20*mm,
-            bottomMargin=20*mm
-        )
-        
-        # 스타일 설정
-        styles = getSampleStyleSheet()
-        fonts_available = setup_fonts()
-        
-        # 한글 폰트가 있으면 사용, 없으면 기본 폰트
-        if fonts_available:
-            title_style = ParagraphStyle(
-                'CustomTitle',
-                parent=styles['Heading1'],
-                fontName=PRETENDARD_BOLD,
-                fontSize=20,
-                textColor=black,
-                spaceAfter=12,
-                alignment=TA_CENTER
-            )
-            heading_style = ParagraphStyle(
-                'CustomHeading',
-                parent=styles['Heading2'],
-                fontName=PRETENDARD_BOLD,
-                fontSize=14,
-                textColor=black,
-                spaceAfter=8,
-                spaceBefore=12
-            )
-            body_style = ParagraphStyle(
-                'CustomBody',
-                parent=styles['Normal'],
-                fontName=PRETENDARD_REGULAR,
-                fontSize=10,
-                textColor=black,
-                spaceAfter=6,
-                leading=14
-            )
-            code_style = ParagraphStyle(
-                'CustomCode',
-                parent=styles['Normal'],
-                fontName=PRETENDARD_REGULAR,
-                fontSize=9,
-                textColor=black,
-                backColor=HexColor('#F5F5F5'),
-                leftIndent=10,
-                rightIndent=10,
-                spaceAfter=6,
-                leading=12
-            )
-            example_style = ParagraphStyle(
-                'CustomExample',
-                parent=styles['Normal'],
-                fontName=PRETENDARD_REGULAR,
-                fontSize=9,
-                textColor=black,
-                leftIndent=5,
-                spaceAfter=4,
-                leading=13
-            )
-        else:
-            title_style = styles['Heading1']
-            heading_style = styles['Heading2']
-            body_style = styles['Normal']
-            code_style = ParagraphStyle(
-                'CustomCode',
-                parent=styles['Normal'],
-                fontSize=9,
-                textColor=black,
-                backColor=HexColor('#F5F5F5'),
-                leftIndent=10,
-                rightIndent=10,
-                spaceAfter=6
-            )
-            example_style = ParagraphStyle(
-                'CustomExample',
-                parent=styles['Normal'],
-                fontSize=9,
-                textColor=black,
-                leftIndent=5,
-                spaceAfter=4
-            )
-        
-        # 내용 구성
-        story = []
-        
-        # 제목
-        story.append(Paragraph("파일명 규칙 가이드", title_style))
-        story.append(Spacer(1, 10*mm))
+    styles = getSampleStyleSheet()
+    fonts_available = setup_fonts()
     
-    # 기본 규칙
-        story.append(Paragraph("기본 규칙", heading_style))
-        story.append(Paragraph(
-        "파일명 형식은 다음 두 가지를 지원합니다:",
-        body_style
-        ))
-        story.append(Spacer(1, 3*mm))
+    if fonts_available:
+        title_style = ParagraphStyle(
+            'CustomTitle',
+            parent=styles['Heading1'],
+            fontName=PRETENDARD_BOLD,
+            fontSize=20,
+            textColor=black,
+            spaceAfter=12,
+            alignment=TA_CENTER
+        )
+        heading_style = ParagraphStyle(
+            'CustomHeading',
+            parent=styles['Heading2'],
+            fontName=PRETENDARD_BOLD,
+            fontSize=14,
+            textColor=black,
+            spaceAfter=8,
+            spaceBefore=12
+        )
+        body_style = ParagraphStyle(
+            'CustomBody',
+            parent=styles['Normal'],
+            fontName=PRETENDARD_REGULAR,
+            fontSize=10,
+            textColor=black,
+            spaceAfter=6,
+            leading=14
+        )
+        code_style = ParagraphStyle(
+            'CustomCode',
+            parent=styles['Normal'],
+            fontName=PRETENDARD_REGULAR,
+            fontSize=9,
+            textColor=black,
+            backColor=HexColor('#F5F5F5'),
+            leftIndent=10,
+            rightIndent=10,
+            spaceAfter=6,
+            leading=12
+        )
+        example_style = ParagraphStyle(
+            'CustomExample',
+            parent=styles['Normal'],
+            fontName=PRETENDARD_REGULAR,
+            fontSize=9,
+            textColor=black,
+            leftIndent=5,
+            spaceAfter=4,
+            leading=13
+        )
+    else:
+        title_style = styles['Heading1']
+        heading_style = styles['Heading2']
+        body_style = styles['Normal']
+        code_style = ParagraphStyle(
+            'CustomCode',
+            parent=styles['Normal'],
+            fontSize=9,
+            textColor=black,
+            backColor=HexColor('#F5F5F5'),
+            leftIndent=10,
+            rightIndent=10,
+            spaceAfter=6
+        )
+        example_style = ParagraphStyle(
+            'CustomExample',
+            parent=styles['Normal'],
+            fontSize=9,
+            textColor=black,
+            leftIndent=5,
+            spaceAfter=4
+        )
     
-        story.append(Paragraph("<b>형식 1: \"설치\" 포함 형식 (권장)</b>", body_style))
-        story.append(Paragraph(
-        "[텍스트]설치[Minor번호][날짜].jpg",
-        code_style
-        ))
-        story.append(Spacer(1, 2*mm))
+    _guide_styles = {
+        'title': title_style,
+        'heading': heading_style,
+        'body': body_style,
+        'code': code_style,
+        'example': example_style,
+    }
+    return _guide_styles
+
+# 가이드 문서 내용: (스타일 키, 텍스트) 또는 ('spacer', 높이)
+GUIDE_CONTENT = [
+    # 제목
+    ('title', "파일명 규칙 가이드"),
+    ('spacer', 10*mm),
     
-        story.append(Paragraph("<b>형식 2: \"설치\" 없이 \"비콘\" 다음 숫자 형식</b>", body_style))
-        story.append(Paragraph(
-        "비콘[Minor번호][날짜].jpg",
-        code_style
-        ))
-        story.append(Spacer(1, 5*mm))
+    # 기본 규칙
+    ('heading', "기본 규칙"),
+    ('body', "파일명 형식은 다음 두 가지를 지원합니다:"),
+    ('spacer', 3*mm),
+    ('body', "<b>형식 1: \"설치\" 포함 형식 (권장)</b>"),
+    ('code', "[텍스트]설치[Minor번호][날짜].jpg"),
+    ('spacer', 2*mm),
+    ('body', "<b>형식 2: \"설치\" 없이 \"비콘\" 다음 숫자 형식</b>"),
+    ('code', "비콘[Minor번호][날짜].jpg"),
+    ('spacer', 5*mm),
     
     # 상세 설명
-        story.append(Paragraph("상세 설명", heading_style))
-    
-        story.append(Paragraph("<b>1. 필수 요소</b>", body_style))
-        story.append(Spacer(1, 2*mm))
-    
-        story.append(Paragraph("<b>형식 1 (설치 포함):</b>", body_style))
-        story.append(Paragraph(
-        "- \"설치\" 텍스트: Minor 번호 앞에 \"설치\"가 있어야 합니다<br/>"
-        "- Minor 번호: \"설치\" 바로 다음에 오는 숫자 (1~4자리 권장)<br/>"
-        "- 날짜: 파일명 끝에 날짜 숫자 (6자리 이상)",
-        body_style
-        ))
-        story.append(Spacer(1, 3*mm))
-    
-        story.append(Paragraph("<b>형식 2 (비콘 직접):</b>", body_style))
-        story.append(Paragraph(
-        "- \"비콘\" 텍스트: Minor 번호 앞에 \"비콘\"이 있어야 합니다<br/>"
-        "- Minor 번호: \"비콘\" 바로 다음에 오는 숫자 (1~4자리 권장, 앞에 0 포함 가능)<br/>"
-        "- 날짜: 파일명 끝에 날짜 숫자 (6자리 이상)",
-        body_style
-        ))
-        story.append(Spacer(1, 5*mm))
+    ('heading', "상세 설명"),
+    ('body', "<b>1. 필수 요소</b>"),
+    ('spacer', 2*mm),
+    ('body', "<b>형식 1 (설치 포함):</b>"),
+    ('body',
+     "- \"설치\" 텍스트: Minor 번호 앞에 \"설치\"가 있어야 합니다<br/>"
+     "- Minor 번호: \"설치\" 바로 다음에 오는 숫자 (1~4자리 권장)<br/>"
+     "- 날짜: 파일명 끝에 날짜 숫자 (6자리 이상)"),
+    ('spacer', 3*mm),
+    ('body', "<b>형식 2 (비콘 직접):</b>"),
+    ('body',
+     "- \"비콘\" 텍스트: Minor 번호 앞에 \"비콘\"이 있어야 합니다<br/>"
+     "- Minor 번호: \"비콘\" 바로 다음에 오는 숫자 (1~4자리 권장, 앞에 0 포함 가능)<br/>"
+     "- 날짜: 파일명 끝에 날짜 숫자 (6자리 이상)"),
+    ('spacer', 5*mm),
     
     # 파일명 예시
-        story.append(Paragraph("파일명 예시", heading_style))
-    
-        story.append(Paragraph("<b>형식 1 예시 (설치 포함):</b>", body_style))
-        examples1 = [
-            "장호원비콘설치10251104130.jpg -> Minor 번호: 10",
-            "장호원비콘설치1251104120.jpg -> Minor 번호: 1",
-            "장호원비콘설치49251104077.jpg -> Minor 번호: 49",
-            "설치100251104130.jpg -> Minor 번호: 100"
-        ]
-        for ex in examples1:
-            story.append(Paragraph(ex, example_style))
-        story.append(Spacer(1, 3*mm))
-    
-        story.append(Paragraph("<b>형식 2 예시 (비콘 직접):</b>", body_style))
-        examples2 = [
-            "비콘0001251127000.jpg -> Minor 번호: 0001 (1로 처리됨)",
-            "비콘10251104130.jpg -> Minor 번호: 10",
-            "비콘250251104130.jpg -> Minor 번호: 250"
-        ]
-        for ex in examples2:
-            story.append(Paragraph(ex, example_style))
-        story.append(Spacer(1, 3*mm))
-        
-        story.append(Paragraph("<b>잘못된 예시:</b>", body_style))
-        wrong_examples = [
-            "1764849216211.jpg -> \"설치\" 또는 \"비콘\"이 없어서 인식 불가",
-            "장호원비콘설치12345251104130.jpg -> Minor 번호가 5자리 이상 -> 오류 처리됨",
-            "비콘12345251104130.jpg -> Minor 번호가 5자리 이상 -> 오류 처리됨",
-            "비콘10.jpg -> 날짜가 없어서 인식 불가"
-        ]
-        for ex in wrong_examples:
-            story.append(Paragraph(ex, example_style))
-        story.append(Spacer(1, 5*mm))
+    ('heading', "파일명 예시"),
+    ('body', "<b>형식 1 예시 (설치 포함):</b>"),
+    ('example', "장호원비콘설치10251104130.jpg -> Minor 번호: 10"),
+    ('example', "장호원비콘설치1251104120.jpg -> Minor 번호: 1"),
+    ('example', "장호원비콘설치49251104077.jpg -> Minor 번호: 49"),
+    ('example', "설치100251104130.jpg -> Minor 번호: 100"),
+    ('spacer', 3*mm),
+    ('body', "<b>형식 2 예시 (비콘 직접):</b>"),
+    ('example', "비콘0001251127000.jpg -> Minor 번호: 0001 (1로 처리됨)"),
+    ('example', "비콘10251104130.jpg -> Minor 번호: 10"),
+    ('example', "비콘250251104130.jpg -> Minor 번호: 250"),
+    ('spacer', 3*mm),
+    ('body', "<b>잘못된 예시:</b>"),
+    ('example', "1764849216211.jpg -> \"설치\" 또는 \"비콘\"이 없어서 인식 불가"),
+    ('example', "장호원비콘설치12345251104130.jpg -> Minor 번호가 5자리 이상 -> 오류 처리됨"),
+    ('example', "비콘12345251104130.jpg -> Minor 번호가 5자리 이상 -> 오류 처리됨"),
+    ('example', "비콘10.jpg -> 날짜가 없어서 인식 불가"),
+    ('spacer', 5*mm),
     
     # 권장 파일명 형식
-        story.append(Paragraph("권장 파일명 형식", heading_style))
-    
-        story.append(Paragraph("<b>형식 1 (권장):</b>", body_style))
-        story.append(Paragraph(
-        "[장소명]비콘설치[Minor번호][날짜].jpg",
-        code_style
-        ))
-        story.append(Paragraph("예시:", body_style))
-        story.append(Paragraph("- 장호원비콘설치10251104130.jpg", example_style))
-        story.append(Paragraph("- 안양비콘설치250251104130.jpg", example_style))
-        story.append(Spacer(1, 3*mm))
+    ('heading', "권장 파일명 형식"),
+    ('body', "<b>형식 1 (권장):</b>"),
+    ('code', "[장소명]비콘설치[Minor번호][날짜].jpg"),
+    ('body', "예시:"),
+    ('example', "- 장호원비콘설치10251104130.jpg"),
+    ('example', "- 안양비콘설치250251104130.jpg"),
+    ('spacer', 3*mm),
+    ('body', "<b>형식 2:</b>"),
+    ('code', "비콘[Minor번호][날짜].jpg"),
+    ('body', "예시:"),
+    ('example', "- 비콘0001251127000.jpg"),
+    ('example', "- 비콘10251104130.jpg"),
+    ('example', "- 비콘250251104130.jpg"),
+    ('spacer', 5*mm),
     
-        story.append(Paragraph("<b>형식 2:</b>", body_style))
-        story.append(Paragraph(
-        "비콘[Minor번호][날짜].jpg",
-        code_style
-        ))
-        story.append(Paragraph("예시:", body_style))
-        story.append(Paragraph("- 비콘0001251127000.jpg", example_style))
-        story.append(Paragraph("- 비콘10251104130.jpg", example_style))
-        story.append(Paragraph("- 비콘250251104130.jpg", example_style))
-        story.append(Spacer(1, 5*mm))
-    
-        # 주의사항
-        story.append(Paragraph("주의사항", heading_style))
-        notes = [
-            "<b>1. Minor 번호는 1~4자리 권장</b><br/>"
-            "&nbsp;&nbsp;&nbsp;&nbsp;- 5자리 이상이면 오류 처리되어 Unknown 폴더로 이동합니다<br/>"
-            "&nbsp;&nbsp;&nbsp;&nbsp;- 형식 2에서 비콘0001처럼 앞에 0이 있어도 정상 처리됩니다",
-            "<b>2. \"설치\" 또는 \"비콘\" 텍스트 필수</b><br/>"
-            "&nbsp;&nbsp;&nbsp;&nbsp;- 둘 중 하나는 반드시 포함되어야 합니다",
-            "<b>3. 날짜는 파일명 끝에 위치</b><br/>"
-            "&nbsp;&nbsp;&nbsp;&nbsp;- 6자리 이상 숫자를 날짜로 인식합니다<br/>"
-            "&nbsp;&nbsp;&nbsp;&nbsp;- 예: 251104130 (9자리), 51104130 (8자리), 251104 (6자리)",
-            "<b>4. 확장자</b><br/>"
-            "&nbsp;&nbsp;&nbsp;&nbsp;- 지원: .jpg, .jpeg, .png (대소문자 구분 없음)"
-        ]
-        for note in notes:
-            story.append(Paragraph(note, body_style))
-        story.append(Spacer(1, 2*mm))
-        story.append(Spacer(1, 3*mm))
+    # 주의사항
+    ('heading', "주의사항"),
+    ('body',
+     "<b>1. Minor 번호는 1~4자리 권장</b><br/>"
+     "&nbsp;&nbsp;&nbsp;&nbsp;- 5자리 이상이면 오류 처리되어 Unknown 폴더로 이동합니다<br/>"
+     "&nbsp;&nbsp;&nbsp;&nbsp;- 형식 2에서 비콘0001처럼 앞에 0이 있어도 정상 처리됩니다"),
+    ('body',
+     "<b>2. \"설치\" 또는 \"비콘\" 텍스트 필수</b><br/>"
+     "&nbsp;&nbsp;&nbsp;&nbsp;- 둘 중 하나는 반드시 포함되어야 합니다"),
+    ('body',
+     "<b>3. 날짜는 파일명 끝에 위치</b><br/>"
+     "&nbsp;&nbsp;&nbsp;&nbsp;- 6자리 이상 숫자를 날짜로 인식합니다<br/>"
+     "&nbsp;&nbsp;&nbsp;&nbsp;- 예: 251104130 (9자리), 51104130 (8자리), 251104 (6자리)"),
+    ('body',
+     "<b>4. 확장자</b><br/>"
+     "&nbsp;&nbsp;&nbsp;&nbsp;- 지원: .jpg, .jpeg, .png (대소문자 구분 없음)"),
+    ('spacer', 2*mm),
+    ('spacer', 3*mm),
     
     # 빠른 체크리스트
-        story.append(Paragraph("빠른 체크리스트", heading_style))
-        checklist = [
-            "[ ] \"설치\" 또는 \"비콘\" 텍스트가 포함되어 있나요?",
-            "[ ] \"설치\"/\"비콘\" 바로 다음에 Minor 번호(1~4자리)가 있나요?",
-            "[ ] 파일명 끝에 날짜 숫자(6자리 이상)가 있나요?",
-            "[ ] 확장자가 .jpg, .jpeg, .png 중 하나인가요?"
-        ]
-        for item in checklist:
-            story.append(Paragraph(item, body_style))
-        story.append(Spacer(1, 5*mm))
+    ('heading', "빠른 체크리스트"),
+    ('body', "[ ] \"설치\" 또는 \"비콘\" 텍스트가 포함되어 있나요?"),
+    ('body', "[ ] \"설치\"/\"비콘\" 바로 다음에 Minor 번호(1~4자리)가 있나요?"),
+    ('body', "[ ] 파일명 끝에 날짜 숫자(6자리 이상)가 있나요?"),
+    ('body', "[ ] 확장자가 .jpg, .jpeg, .png 중 하나인가요?"),
+    ('spacer', 5*mm),
     
     # 예시 템플릿
-        story.append(Paragraph("예시 템플릿", heading_style))
-    
-        story.append(Paragraph("<b>형식 1 (권장):</b>", body_style))
-        story.append(Paragraph(
-        "[장소명]비콘설치[번호][날짜].jpg",
-        code_style
-        ))
-        story.append(Paragraph("예시:", body_style))
-        story.append(Paragraph("- 장호원비콘설치10251104130.jpg", example_style))
-        story.append(Paragraph("- 안양비콘설치250251104130.jpg", example_style))
-        story.append(Spacer(1, 3*mm))
+    ('heading', "예시 템플릿"),
+    ('body', "<b>형식 1 (권장):</b>"),
+    ('code', "[장소명]비콘설치[번호][날짜].jpg"),
+    ('body', "예시:"),
+    ('example', "- 장호원비콘설치10251104130.jpg"),
+    ('example', "- 안양비콘설치250251104130.jpg"),
+    ('spacer', 3*mm),
+    ('body', "<b>형식 2:</b>"),
+    ('code', "비콘[번호][날짜].jpg"),
+    ('body', "예시:"),
+    ('example', "- 비콘0001251127000.jpg"),
+    ('example', "- 비콘10251104130.jpg"),
+    ('example', "- 비콘250251104130.jpg"),
+]
+
+def create_filename_guide_pdf():
+    """파일명 규칙 가이드 PDF 생성"""
+    output_path = Path("파일명_규칙_가이드.pdf")
+    print(f"📄 PDF 생성 시작: {output_path.absolute()}")
     
-        story.append(Paragraph("<b>형식 2:</b>", body_style))
-        story.append(Paragraph(
-        "비콘[번호][날짜].jpg",
-        code_style
-        ))
-        story.append(Paragraph("예시:", body_style))
-        story.append(Paragraph("- 비콘0001251127000.jpg", example_style))
-        story.append(Paragraph("- 비콘10251104130.jpg", example_style))
-        story.append(Paragraph("- 비콘250251104130.jpg", example_style))
+    try:
+        # PDF 문서 생성
+        doc = SimpleDocTemplate(
+            str(output_path),
+            pagesize=A4,
+            rightMargin=20*mm,
+            leftMargin=20*mm,
+            topMargin=20*mm,
+            bottomMargin=20*mm,
+            pageCompression=1
+        )
+        
+        # 스타일 설정 및 내용 구성 (표 형태의 GUIDE_CONTENT에서 생성)
+        styles = get_guide_styles()
+        story = []
+        story.extend(
+            Spacer(1, value) if kind == 'spacer' else Paragraph(value, styles[kind])
+            for kind, value in GUIDE_CONTENT
+        )
         
         # PDF 생성 (워터마크 및 푸터 포함)
         def on_first_page(canvas_obj, doc):
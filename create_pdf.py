@@ -6,16 +6,23 @@ output 폴더의 Minor별 이미지들을 PDF로 변환하는 스크립트 (Refa
 - 각 Beacon별로 사진들을 배열하여 출력
 - PDFLayoutManager 클래스를 통해 레이아웃 및 페이지 관리
 """
+import argparse
 import os
 import re
-import time
 import shutil
+import hashlib
+import time
 import urllib.request
 import zipfile
 import math
+from dataclasses import dataclass, replace
+from functools import lru_cache
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from io import BytesIO
+
+import numpy as np
 from PIL import Image
 
 try:
@@ -31,12 +38,24 @@ try:
         USE_HEXCOLOR = False
     from reportlab.pdfbase import pdfmetrics
     from reportlab.pdfbase.ttfonts import TTFont
+    from reportlab import rl_config
+    # 이미지/콘텐츠 스트림을 ASCII85로 감싸지 않고 바이너리로 기록 (순수 Python 인코딩 생략, 파일 크기 약 20% 감소)
+    rl_config.useA85 = 0
     USE_REPORTLAB = True
 except ImportError:
     print("Error: reportlab이 설치되지 않았습니다.")
     print("설치: pip3 install reportlab pillow")
     exit(1)
 
+# 선택: SIMD 기반 리사이즈 (설치되어 있으면 Pillow LANCZOS 대신 사용, 동일한 Lanczos3 필터)
+try:
+    from cykooz_resizer import FilterType, ResizeAlg, ResizeOptions, Resizer
+    FAST_RESIZER = Resizer()
+    FAST_RESIZE_OPTIONS = ResizeOptions(resize_alg=ResizeAlg.convolution(FilterType.lanczos3))
+    USE_FAST_RESIZER = True
+except ImportError:
+    USE_FAST_RESIZER = False
+
 # ============================================================================
 # 상수 및 설정
 # ============================================================================
@@ -49,6 +68,7 @@ FONTS_DIR = Path("fonts")
 # PDF 제목 설정
 FACILITY_NAME = "안양 박달 하수도 사업소"
 PDF_TITLE_TEMPLATE = f"{FACILITY_NAME} 설치된 Beacon"
+JR_TEXT = "JRIndustry"
 
 # 폰트 설정
 PRETENDARD_REGULAR = "Pretendard-Regular"
@@ -56,6 +76,14 @@ PRETENDARD_BOLD = "Pretendard-Bold"
 PRETENDARD_FONT_REGULAR_PATH = FONTS_DIR / "Pretendard-Regular.ttf"
 PRETENDARD_FONT_BOLD_PATH = FONTS_DIR / "Pretendard-Bold.ttf"
 
+# Minor 폴더명 패턴 (방폭비콘_Minor_XXXX 등)
+MINOR_FOLDER_PATTERN = re.compile(r'Minor_(\d+)')
+
+# 이미지 확장자 (소문자로 변환 후 endswith로 비교)
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png')
+# Image.open 시 형식 판별을 이 두 플러그인으로 제한 (전체 플러그인 순회 생략)
+IMAGE_FORMATS = ('JPEG', 'PNG')
+
 # PDF 기본 치수
 PAGE_WIDTH, PAGE_HEIGHT = A4
 MARGIN = 20 * mm
@@ -63,6 +91,23 @@ HEADER_HEIGHT = 25 * mm
 FOOTER_HEIGHT = 15 * mm
 FOOTER_BOTTOM_MARGIN = 15 * mm
 
+# 페이지 공통 요소(워터마크/헤더/푸터 로고) Form XObject 이름 (PDF 내에 한 번만 저장되고 각 페이지에서 참조)
+PAGE_CHROME_FORM_NAME = "page_chrome"
+WATERMARK_OPACITY = 0.08
+WATERMARK_ROTATION = 45
+
+# 로고/워터마크 사용 여부 (모듈 로드 시 한 번만 결정, PDF_WATERMARK=0 이면 워터마크 끔)
+LOGO_AVAILABLE = LOGO_PATH.exists()
+WATERMARK_ENABLED = LOGO_AVAILABLE and os.environ.get('PDF_WATERMARK', '1') != '0'
+
+# 진행 로그를 모아서 출력하는 간격 (비콘마다 print 하지 않고 N줄씩 한 번에 출력)
+LOG_FLUSH_LINES = 50
+
+# 비콘 박스 스타일
+BOX_BG_COLOR = HexColor('#F5F5F5') if USE_HEXCOLOR else white
+BOX_BORDER_COLOR = HexColor('#E0E0E0') if USE_HEXCOLOR else black
+BOX_CORNER_RADIUS = 1.5 * mm
+
 # 헤더 위치
 HEADER_TEXT_Y = PAGE_HEIGHT - MARGIN - 5 * mm
 HEADER_LINE_Y = HEADER_TEXT_Y - 3 * mm
@@ -77,11 +122,20 @@ CONTENT_HEIGHT = CONTENT_START_Y - FOOTER_HEIGHT - FOOTER_BOTTOM_MARGIN
 # 유틸리티 함수
 # ============================================================================
 
+@lru_cache(maxsize=1)
 def setup_pretendard_font():
     """Pretendard 폰트를 다운로드하고 reportlab에 등록"""
     FONTS_DIR.mkdir(exist_ok=True)
     
-    if PRETENDARD_FONT_REGULAR_PATH.exists() and PRETENDARD_FONT_BOLD_PATH.exists():
+    # 두 폰트 파일 존재 여부를 os.stat 한 번씩으로 확인
+    try:
+        os.stat(PRETENDARD_FONT_REGULAR_PATH)
+        os.stat(PRETENDARD_FONT_BOLD_PATH)
+        fonts_present = True
+    except FileNotFoundError:
+        fonts_present = False
+    
+    if fonts_present:
         try:
             pdfmetrics.registerFont(TTFont(PRETENDARD_REGULAR, str(PRETENDARD_FONT_REGULAR_PATH)))
             pdfmetrics.registerFont(TTFont(PRETENDARD_BOLD, str(PRETENDARD_FONT_BOLD_PATH)))
@@ -93,46 +147,38 @@ def setup_pretendard_font():
     try:
         print("Pretendard 폰트 다운로드 중...")
         font_zip_url = "https://github.com/orioncactus/pretendard/releases/download/v1.3.9/Pretendard-1.3.9.zip"
-        zip_path = FONTS_DIR / "Pretendard.zip"
-        
-        urllib.request.urlretrieve(font_zip_url, zip_path)
-        
-        extract_dir = FONTS_DIR / "extract_temp"
-        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-            zip_ref.extractall(extract_dir)
-        
-        ttf_files = list(extract_dir.rglob("*.ttf"))
-        regular_found = False
-        bold_found = False
-        
-        # 정확한 파일명으로 찾기
-        for ttf_file in ttf_files:
-            name_lower = ttf_file.name.lower()
-            if ttf_file.name == "Pretendard-Regular.ttf" or name_lower == "pretendard-regular.ttf":
-                shutil.copy2(ttf_file, PRETENDARD_FONT_REGULAR_PATH)
-                regular_found = True
-            elif ttf_file.name == "Pretendard-Bold.ttf" or name_lower == "pretendard-bold.ttf":
-                shutil.copy2(ttf_file, PRETENDARD_FONT_BOLD_PATH)
-                bold_found = True
-                
-        # 부분 매칭으로 찾기
-        if not regular_found:
-            for ttf_file in ttf_files:
-                if "regular" in ttf_file.name.lower() and "pretendard" in ttf_file.name.lower():
-                    shutil.copy2(ttf_file, PRETENDARD_FONT_REGULAR_PATH)
-                    break
-        if not bold_found:
-            for ttf_file in ttf_files:
-                if "bold" in ttf_file.name.lower() and "pretendard" in ttf_file.name.lower():
-                    shutil.copy2(ttf_file, PRETENDARD_FONT_BOLD_PATH)
-                    break
-        
-        if extract_dir.exists(): shutil.rmtree(extract_dir)
-        if zip_path.exists(): zip_path.unlink()
-        
-        if PRETENDARD_FONT_REGULAR_PATH.exists():
+        
+        # ZIP은 디스크에 저장하지 않고 메모리에서 바로 열기
+        with urllib.request.urlopen(font_zip_url, timeout=60) as response:
+            zip_buffer = BytesIO(response.read())
+        
+        # 필요한 TTF 두 개만 한 번의 순회로 찾아서 저장 (정확한 파일명 우선, 없으면 부분 매칭)
+        font_targets = {'regular': PRETENDARD_FONT_REGULAR_PATH, 'bold': PRETENDARD_FONT_BOLD_PATH}
+        exact_matches = {}
+        partial_matches = {}
+        written_fonts = set()
+        with zipfile.ZipFile(zip_buffer) as zip_ref:
+            for member_name in zip_ref.namelist():
+                name_lower = member_name.rsplit('/', 1)[-1].lower()
+                if not name_lower.endswith('.ttf') or 'pretendard' not in name_lower:
+                    continue
+                for weight in font_targets:
+                    if name_lower == f"pretendard-{weight}.ttf":
+                        exact_matches.setdefault(weight, member_name)
+                    elif weight in name_lower:
+                        partial_matches.setdefault(weight, member_name)
+            
+            for weight, font_path in font_targets.items():
+                member_name = exact_matches.get(weight) or partial_matches.get(weight)
+                if member_name:
+                    with zip_ref.open(member_name) as src, open(font_path, 'wb') as dst:
+                        shutil.copyfileobj(src, dst, 1 << 20)
+                    written_fonts.add(weight)
+        
+        # 방금 저장한 파일만 등록 (다시 stat 하지 않음)
+        if 'regular' in written_fonts:
             pdfmetrics.registerFont(TTFont(PRETENDARD_REGULAR, str(PRETENDARD_FONT_REGULAR_PATH)))
-        if PRETENDARD_FONT_BOLD_PATH.exists():
+        if 'bold' in written_fonts:
             pdfmetrics.registerFont(TTFont(PRETENDARD_BOLD, str(PRETENDARD_FONT_BOLD_PATH)))
             
         print("✓ Pretendard 폰트 다운로드 및 등록 완료")
@@ -141,9 +187,20 @@ def setup_pretendard_font():
         print(f"⚠ Pretendard 폰트 다운로드 실패: {e}")
         return False
 
+def resolve_font(font_name, fallback_font_name):
+    """등록된 폰트면 그 이름을, 아니면 기본 폰트 이름을 반환"""
+    if font_name in pdfmetrics.getRegisteredFontNames():
+        return font_name
+    return fallback_font_name
+
 def get_beacon_number(minor_folder_name):
     """Minor 폴더명에서 Beacon 번호 추출"""
-    match = re.search(r'Minor_(\d+)', minor_folder_name)
+    # 일반적인 Minor_XXXX 형식은 정규식 없이 바로 변환
+    if minor_folder_name.startswith('Minor_'):
+        digits = minor_folder_name[6:]
+        if digits.isascii() and digits.isdigit():
+            return int(digits)
+    match = MINOR_FOLDER_PATTERN.search(minor_folder_name)
     if match:
         return int(match[1])
     return None
@@ -152,43 +209,166 @@ def convert_to_rgb(img):
     """이미지를 RGB 모드로 변환"""
     if img.mode == 'RGB':
         return img
-    try:
-        if img.mode == 'RGBA':
-            background = Image.new('RGB', img.size, (255, 255, 255))
-            background.paste(img, mask=img.split()[3])
-            return background
-        else:
-            return img.convert('RGB')
-    except:
+    if img.mode == 'RGBA':
+        # RGBA 이미지를 그대로 마스크로 넘기면 알파 채널을 직접 사용 (split()의 밴드 4개 복사 생략)
         background = Image.new('RGB', img.size, (255, 255, 255))
-        background.paste(img)
+        background.paste(img, mask=img)
         return background
+    if img.mode == 'LA' or (img.mode == 'P' and 'transparency' in img.info):
+        # 투명도가 있는 그레이스케일/팔레트 이미지도 흰 배경에 합성
+        return convert_to_rgb(img.convert('RGBA'))
+    return img.convert('RGB')
+
+def lanczos_resize(img, size):
+    """Lanczos 리사이즈 (cykooz.resizer가 있으면 SIMD 구현, 없으면 Pillow LANCZOS)"""
+    if USE_FAST_RESIZER:
+        resized = Image.new(img.mode, size)
+        FAST_RESIZER.resize_pil(img, resized, FAST_RESIZE_OPTIONS)
+        return resized
+    return img.resize(size, Image.Resampling.LANCZOS)
+
+@dataclass(frozen=True)
+class LogoAssets:
+    """미리 인코딩된 워터마크/푸터 로고와 그릴 위치/크기 (모든 페이지에서 공유)"""
+    watermark_reader: ImageReader
+    watermark_width: float
+    watermark_height: float
+    footer_reader: ImageReader
+    footer_x: float
+    footer_y: float
+    footer_width: float
+    footer_height: float
+
+# 로고 캐시 (첫 사용 시 한 번만 디코드/인코딩하여 모든 페이지에서 재사용)
+_logo_assets = None
+
+def load_logos():
+    """로고 이미지를 한 번만 읽어 LogoAssets로 캐시"""
+    global _logo_assets
+    if _logo_assets is None:
+        with Image.open(LOGO_PATH) as logo_img:
+            _logo_assets = build_logo_assets(logo_img)
+    return _logo_assets
+
+def build_logo_assets(logo_img):
+    """로고의 모든 PIL 작업(변환/블렌딩/리사이즈/인코딩)을 한 번에 수행"""
+    # 워터마크: 그레이스케일(1채널, DeviceGray) 그대로 흰 배경에 미리 블렌딩 (PIL 이미지를 ImageReader에 바로 전달, PNG 인코딩/디코딩 생략)
+    # (PDF 알파 합성 없이 투명도 WATERMARK_OPACITY와 동일한 결과)
+    watermark_img = logo_img.convert('L')
+    watermark_img = Image.blend(Image.new('L', watermark_img.size, 255), watermark_img, WATERMARK_OPACITY)
+    watermark_width = 35 * mm
+    watermark_height = watermark_width * watermark_img.height / watermark_img.width
+    
+    # 푸터 로고: 목표 크기로 리사이즈 후 JPEG로 한 번만 인코딩
+    logo_max_width = 35 * mm
+    logo_max_height = FOOTER_HEIGHT - 5 * mm
+    ratio = min(logo_max_width / logo_img.width, logo_max_height / logo_img.height, 1.0)
+    footer_width = logo_img.width * ratio * 0.75
+    footer_height = logo_img.height * ratio * 0.75
+    footer_buffer = BytesIO()
+    footer_img = convert_to_rgb(logo_img)
+    footer_img = lanczos_resize(footer_img, (int(footer_img.width * ratio), int(footer_img.height * ratio)))
+    footer_img.save(footer_buffer, format='JPEG', quality=95)
+    footer_buffer.seek(0)
+    
+    # 리사이즈된 픽셀 비율에 맞춰 그릴 크기/위치를 미리 계산 (drawImage의 preserveAspectRatio 대체, 중앙 정렬)
+    fit = min(footer_width / footer_img.width, footer_height / footer_img.height)
+    fitted_width = footer_img.width * fit
+    fitted_height = footer_img.height * fit
+    footer_x = PAGE_WIDTH - MARGIN - footer_width + (footer_width - fitted_width) / 2
+    footer_y = FOOTER_BOTTOM_MARGIN + (footer_height - fitted_height) / 2
+    
+    return LogoAssets(
+        watermark_reader=ImageReader(watermark_img),
+        watermark_width=watermark_width,
+        watermark_height=watermark_height,
+        footer_reader=ImageReader(footer_buffer),
+        footer_x=footer_x,
+        footer_y=footer_y,
+        footer_width=fitted_width,
+        footer_height=fitted_height,
+    )
+
+# 원본(또는 draft 디코딩 결과)이 목표 픽셀 크기의 이 배수 이내면 리샘플링/재인코딩 생략
+PDF_RESAMPLE_THRESHOLD = 1.25
+PDF_IMAGE_DPI = 300
+
+def fit_image_size(orig_width, orig_height, target_width_pt, target_height_pt):
+    """원본 픽셀 크기를 목표 칸(pt)에 PDF_IMAGE_DPI 기준으로 맞춘 (비율, 너비 px, 높이 px)"""
+    ratio = min(int(target_width_pt * PDF_IMAGE_DPI / 72) / orig_width, int(target_height_pt * PDF_IMAGE_DPI / 72) / orig_height)
+    return ratio, int(orig_width * ratio), int(orig_height * ratio)
+
+def resize_opened_image(img, new_width, new_height):
+    """열려 있는 이미지를 (new_width, new_height)로 리사이즈 (JPEG는 draft 디코딩)"""
+    # JPEG는 디코딩 단계에서 1/2, 1/4, 1/8로 축소 (목표 크기 이상은 유지되므로 화질 영향 없음)
+    if img.format == 'JPEG':
+        img.draft('RGB', (new_width, new_height))
+    # 그레이스케일(L)은 RGB로 늘리지 않고 1채널 그대로 리사이즈/인코딩 (데이터 1/3)
+    rgb_img = img if img.mode == 'L' else convert_to_rgb(img)
+    
+    if rgb_img.width <= new_width * PDF_RESAMPLE_THRESHOLD and rgb_img.height <= new_height * PDF_RESAMPLE_THRESHOLD:
+        # 목표 크기와 거의 같으면 Lanczos 생략 (PDF에서 표시 크기로 축소됨)
+        return rgb_img.copy() if rgb_img is img else rgb_img
+    return lanczos_resize(rgb_img, (new_width, new_height))
 
-def resize_image_for_pdf(image_path, target_width_pt, target_height_pt):
-    """이미지를 PDF에 맞게 리사이즈"""
+def image_content_keys(image_paths):
+    """
+    이미지별 내용 키 계산 (중복 이미지 검출용)
+    - 파일 크기가 같은 파일이 있을 때만 blake2b 해시로 비교하고, 나머지는 경로를 키로 사용
+    """
+    sizes = {}
+    for image_path in set(image_paths):
+        sizes.setdefault(os.stat(image_path).st_size, []).append(image_path)
+    
+    keys = {}
+    for same_size_paths in sizes.values():
+        if len(same_size_paths) == 1:
+            keys[same_size_paths[0]] = same_size_paths[0]
+            continue
+        for image_path in same_size_paths:
+            keys[image_path] = hashlib.blake2b(Path(image_path).read_bytes(), digest_size=16).digest()
+    return keys
+
+# JPEG 인코딩 설정 (optimize/progressive 없이 단일 패스 인코딩)
+PDF_JPEG_QUALITY = 85
+PDF_JPEG_SUBSAMPLING = 2  # 4:2:0
+
+# 인코딩 버퍼 (프로세스마다 하나를 재사용)
+_encode_buffer = BytesIO()
+
+def encode_image_for_pdf(job):
+    """
+    이미지를 리사이즈하고 JPEG 바이트로 인코딩 (프로세스 풀 작업 함수)
+    job: (이미지 경로, 목표 너비 pt, 목표 높이 pt)
+    반환: (JPEG 바이트 또는 None, 실제 너비 pt, 실제 높이 pt)
+    """
+    image_path, target_width_pt, target_height_pt = job
+    
+    # 파일은 한 번만 열어서 크기 확인, 원본 사용 여부 판단, 리사이즈까지 처리
     try:
-        img = Image.open(image_path)
-        img = convert_to_rgb(img)
-        
-        orig_width, orig_height = img.size
-        
-        # 300 DPI 기준 픽셀 계산
-        target_width_px = int(target_width_pt * 300 / 72)
-        target_height_px = int(target_height_pt * 300 / 72)
-        
-        ratio = min(target_width_px / orig_width, target_height_px / orig_height)
-        new_width = int(orig_width * ratio)
-        new_height = int(orig_height * ratio)
-        
-        resized = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
-        
-        actual_width_pt = new_width * 72 / 300
-        actual_height_pt = new_height * 72 / 300
-        
-        return resized, actual_width_pt, actual_height_pt
+        with Image.open(image_path, formats=IMAGE_FORMATS) as img:
+            ratio, new_width, new_height = fit_image_size(*img.size, target_width_pt, target_height_pt)
+            width_pt, height_pt = new_width * 72 / PDF_IMAGE_DPI, new_height * 72 / PDF_IMAGE_DPI
+            
+            # 원본이 JPEG이고 축소가 거의 필요 없으면 디코딩/재인코딩 없이 원본 바이트를 그대로 사용
+            if img.format == 'JPEG' and img.mode in ('RGB', 'L') and ratio * PDF_RESAMPLE_THRESHOLD >= 1:
+                return Path(image_path).read_bytes(), width_pt, height_pt
+            resized = resize_opened_image(img, new_width, new_height)
     except Exception as e:
-        print(f"  ⚠ 이미지 처리 오류 ({image_path.name}): {e}")
+        print(f"  ⚠ 이미지 처리 오류 ({os.path.basename(image_path)}): {e}")
         return None, 0, 0
+    
+    _encode_buffer.seek(0)
+    _encode_buffer.truncate(0)
+    resized.save(_encode_buffer, format='JPEG', quality=PDF_JPEG_QUALITY, subsampling=PDF_JPEG_SUBSAMPLING)
+    return _encode_buffer.getvalue(), width_pt, height_pt
+
+# 이미지 개수별 배치 (열, 행) - 5장 이상은 2열
+IMAGE_GRID_TABLE = {0: (0, 0), 1: (1, 1), 2: (2, 1), 3: (3, 1), 4: (4, 1)}
+
+def image_grid(num_images):
+    """이미지 개수에 따른 배치 (열, 행) 반환"""
+    return IMAGE_GRID_TABLE.get(num_images) or (2, (num_images + 1) // 2)
 
 def get_layout_settings(high_density=False):
     """레이아웃 모드에 따른 설정값 반환"""
@@ -222,10 +402,21 @@ def get_layout_settings(high_density=False):
 # PDF Layout Manager Class
 # ============================================================================
 
+@dataclass(frozen=True)
+class PlacedBeacon:
+    """위치가 확정된 비콘 박스 (레이아웃 계획 결과, 그리기는 finish에서 한 번에)"""
+    beacon_info: dict
+    x: float
+    y: float
+    width: float
+    fixed_height: float = None
+
 class PDFLayoutManager:
-    def __init__(self, canvas_obj, layout_settings):
+    def __init__(self, canvas_obj, layout_settings, watermark=WATERMARK_ENABLED, verbose=False):
         self.c = canvas_obj
         self.layout = layout_settings
+        self.watermark_enabled = watermark and LOGO_AVAILABLE
+        self.verbose = verbose # 비콘별 배치 로그 출력 여부
         
         # 설정값 언패킹
         self.BEACON_MARGIN = layout_settings['BEACON_MARGIN']
@@ -238,235 +429,234 @@ class PDFLayoutManager:
         self.MAX_COLUMN_SLOTS = layout_settings['MAX_COLUMN_SLOTS_PER_PAGE']
         self.MIN_Y_MARGIN = layout_settings['MIN_Y_MARGIN']
         
+        # 박스/이미지 영역 높이 (레이아웃 설정에만 의존하므로 한 번만 계산)
+        self.image_area_height = min(CONTENT_HEIGHT - self.BEACON_TITLE_HEIGHT - self.BOX_PADDING * 2, self.MAX_IMAGE_HEIGHT)
+        self.box_height_with_images = self.BEACON_TITLE_HEIGHT + self.image_area_height + (self.BOX_PADDING * 2)
+        self.box_height_without_images = self.BEACON_TITLE_HEIGHT + 15 * mm + (self.BOX_PADDING * 2)
+        self.min_y = FOOTER_HEIGHT + FOOTER_BOTTOM_MARGIN + self.MIN_Y_MARGIN
+        
+        # 폰트 결정 및 고정 텍스트 폭 (페이지마다 다시 계산하지 않도록 한 번만)
+        self.bold_font = resolve_font(PRETENDARD_BOLD, "Helvetica-Bold")
+        self.regular_font = resolve_font(PRETENDARD_REGULAR, "Helvetica")
+        self.jr_text_width = pdfmetrics.stringWidth(JR_TEXT, self.bold_font, 11)
+        
         # 상태 변수
         self.page_number = 1
+        self.pages = [[]] # 페이지별 PlacedBeacon 목록 (배치 계획)
         self.col_y_positions = [CONTENT_START_Y, CONTENT_START_Y] # [Left Y, Right Y]
         self.current_col = 0 # 0: Left, 1: Right
-        self.row_heights = [] # 현재 행의 박스 높이들
         self.column_slots_used = 0 # 현재 페이지에서 사용된 슬롯 수
-        self.left_beacon_data = None # 왼쪽 열 비콘 데이터 (재그리기용)
-        self.left_beacon_box_info = None # 왼쪽 열 비콘 박스 정보 (위치 등)
+        self.left_beacon_data = None # 오른쪽 대기 중인 왼쪽 열 비콘 데이터
+        self.left_beacon_height = 0 # 왼쪽 열 비콘 박스 높이
+        self.left_beacon_index = None # 현재 페이지 목록에서 왼쪽 열 비콘의 위치 (행 높이 맞추기용)
+        self.image_cache = {} # (경로, 셀 너비, 셀 높이) -> (JPEG 바이트 또는 공유 ImageReader, 너비, 높이)
         
-        # 통계
+        # 통계 및 진행 로그 버퍼
         self.success_count = 0
-        
-        # 첫 페이지 시작
-        self._start_new_page(first_page=True)
+        self.log_lines = []
 
-    def _start_new_page(self, first_page=False):
-        """새 페이지 시작 및 헤더/푸터/워터마크 출력"""
-        if not first_page:
-            self.c.showPage()
-            self.page_number += 1
-            
-        self._draw_header()
-        self._draw_watermark()
-        self._draw_footer()
-        
-        # 상태 초기화
+    def _start_new_page(self):
+        """배치 계획에 새 페이지를 추가하고 열/슬롯 상태 초기화"""
+        self.pages.append([])
         self.col_y_positions = [CONTENT_START_Y, CONTENT_START_Y]
         self.current_col = 0
-        self.row_heights = []
         self.column_slots_used = 0
         self.left_beacon_data = None
-        self.left_beacon_box_info = None
+        self.left_beacon_index = None
+
+    def _draw_page_chrome(self):
+        """워터마크/헤더/푸터 출력 (페이지마다 같은 부분은 Form XObject로 한 번만 기록하고 참조)"""
+        c = self.c
+        if not c.hasForm(PAGE_CHROME_FORM_NAME):
+            self._build_page_chrome_form()
+        c.doForm(PAGE_CHROME_FORM_NAME)
+        self._draw_page_number()
+
+    def _build_page_chrome_form(self):
+        """워터마크, 헤더, 푸터 로고를 하나의 Form XObject로 기록"""
+        c = self.c
+        c.beginForm(PAGE_CHROME_FORM_NAME, 0, 0, PAGE_WIDTH, PAGE_HEIGHT)
+        c.saveState()
+        # 워터마크는 불투명 이미지이므로 헤더/푸터보다 먼저 그림
+        if self.watermark_enabled:
+            self._draw_watermark()
+        self._draw_header()
+        self._draw_footer_logo()
+        c.restoreState()
+        c.endForm()
+
+    def _set_font(self, font_name, size):
+        """현재 폰트와 다를 때만 setFont 호출 (같은 폰트 반복 설정 생략)"""
+        c = self.c
+        if c._fontname != font_name or c._fontsize != size:
+            c.setFont(font_name, size)
 
     def _draw_header(self):
         """헤더 그리기"""
         c = self.c
-        try:
-            c.setFont(PRETENDARD_BOLD, 14)
-            font_name = PRETENDARD_BOLD
-        except:
-            c.setFont("Helvetica-Bold", 14)
-            font_name = "Helvetica-Bold"
-            
+        self._set_font(self.bold_font, 14)
         c.setFillColor(black)
         c.drawString(MARGIN, HEADER_TEXT_Y, FACILITY_NAME)
         
         # JRIndustry
-        jr_text = "JRIndustry"
-        try:
-            c.setFont(PRETENDARD_BOLD, 11)
-        except:
-            c.setFont("Helvetica-Bold", 11)
-            
-        text_width = c.stringWidth(jr_text, c._fontname, 11)
-        c.drawString(PAGE_WIDTH - MARGIN - text_width, HEADER_TEXT_Y, jr_text)
+        self._set_font(self.bold_font, 11)
+        c.drawString(PAGE_WIDTH - MARGIN - self.jr_text_width, HEADER_TEXT_Y, JR_TEXT)
         
         # Line
         c.setStrokeColor(black)
         c.setLineWidth(0.5)
         c.line(MARGIN, HEADER_LINE_Y, PAGE_WIDTH - MARGIN, HEADER_LINE_Y)
 
-    def _draw_footer(self):
-        """푸터 그리기"""
+    def _draw_page_number(self):
+        """푸터 페이지 번호 그리기"""
         c = self.c
-        footer_y = FOOTER_BOTTOM_MARGIN
-        
-        # Page Number
-        try:
-            c.setFont(PRETENDARD_REGULAR, 8)
-        except:
-            c.setFont("Helvetica", 8)
+        self._set_font(self.regular_font, 8)
         c.setFillColor(black)
-        c.drawString(MARGIN, footer_y, f"Page {self.page_number}")
-        
-        # Logo
-        if LOGO_PATH.exists():
-            try:
-                logo_img = Image.open(LOGO_PATH)
-                logo_max_width = 35 * mm
-                logo_max_height = FOOTER_HEIGHT - 5 * mm
-                
-                ratio = min(logo_max_width / logo_img.width, logo_max_height / logo_img.height, 1.0)
-                logo_width = logo_img.width * ratio * 0.75
-                logo_height = logo_img.height * ratio * 0.75
-                
-                logo_x = PAGE_WIDTH - MARGIN - logo_width
-                
-                buffer = BytesIO()
-                logo_img = convert_to_rgb(logo_img)
-                logo_img.resize((int(logo_img.width * ratio), int(logo_img.height * ratio)), Image.Resampling.LANCZOS).save(buffer, format='JPEG', quality=95)
-                buffer.seek(0)
-                
-                c.drawImage(ImageReader(buffer), logo_x, footer_y, width=logo_width, height=logo_height, preserveAspectRatio=True)
-            except Exception as e:
-                print(f"  ⚠ 로고 오류: {e}")
+        c.drawString(MARGIN, FOOTER_BOTTOM_MARGIN, f"Page {self.page_number}")
+
+    def _draw_footer_logo(self):
+        """푸터 로고 그리기"""
+        if not LOGO_AVAILABLE:
+            return
+        try:
+            logo = load_logos()
+            self.c.drawImage(logo.footer_reader, logo.footer_x, logo.footer_y, width=logo.footer_width, height=logo.footer_height)
+        except Exception as e:
+            print(f"  ⚠ 로고 오류: {e}")
 
     def _draw_watermark(self):
-        """워터마크 그리기"""
-        if not LOGO_PATH.exists(): return
-        
-        c = self.c
+        """워터마크 타일 그리기"""
         try:
-            logo_img = Image.open(LOGO_PATH).convert('L').convert('RGB')
-            watermark_width = 35 * mm
-            watermark_height = watermark_width * logo_img.height / logo_img.width
-            
-            rotation = 45
-            spacing_x = 55 * mm
-            spacing_y = 35 * mm
-            
-            c.saveState()
-            c.setFillAlpha(0.08)
-            c.setStrokeAlpha(0.08)
-            
-            diagonal = math.sqrt(watermark_width**2 + watermark_height**2)
-            half_diag = diagonal / 2
-            
-            start_x = half_diag - watermark_width/2 - spacing_x
-            end_x = PAGE_WIDTH + spacing_x
-            start_y = -100 * mm
-            end_y = PAGE_HEIGHT + 100 * mm
-            
-            buffer = BytesIO()
-            logo_img.save(buffer, format='PNG')
-            buffer.seek(0)
-            img_reader = ImageReader(buffer)
-            
-            y = start_y
-            row = 0
-            while y < end_y:
-                x = start_x if row % 2 == 0 else start_x + (spacing_x / 2)
-                while x < end_x:
-                    c.saveState()
-                    c.translate(x + watermark_width/2, y + watermark_height/2)
-                    c.rotate(rotation)
-                    c.drawImage(img_reader, -watermark_width/2, -watermark_height/2, 
-                              width=watermark_width, height=watermark_height, mask='auto')
-                    c.restoreState()
-                    x += spacing_x
-                y += spacing_y
-                row += 1
-                
-            c.restoreState()
+            self._draw_watermark_tiles()
         except Exception as e:
             print(f"  ⚠ 워터마크 오류: {e}")
 
+    def _draw_watermark_tiles(self):
+        """회전된 워터마크 로고를 페이지 전체에 타일 형태로 그림"""
+        c = self.c
+        logo = load_logos()
+        img_reader = logo.watermark_reader
+        watermark_width, watermark_height = logo.watermark_width, logo.watermark_height
+        
+        spacing_x = 55 * mm
+        spacing_y = 35 * mm
+        
+        diagonal = math.sqrt(watermark_width**2 + watermark_height**2)
+        half_diag = diagonal / 2
+        
+        start_x = half_diag - watermark_width/2 - spacing_x
+        end_x = PAGE_WIDTH + spacing_x
+        start_y = -100 * mm
+        end_y = PAGE_HEIGHT + 100 * mm
+        
+        # 타일 중심 좌표를 NumPy로 한 번에 계산 (홀수 행은 반 칸 밀림)
+        grid_x, grid_y = np.meshgrid(np.arange(start_x, end_x, spacing_x), np.arange(start_y, end_y, spacing_y))
+        grid_x[1::2] += spacing_x / 2
+        inside = grid_x < end_x
+        center_x = grid_x[inside] + watermark_width / 2
+        center_y = grid_y[inside] + watermark_height / 2
+        
+        # 좌표계를 한 번만 회전하고, 각 타일 중심을 회전된 좌표로 변환해서 그림 (타일마다 q/cm/Q 생략)
+        theta = math.radians(WATERMARK_ROTATION)
+        cos_t, sin_t = math.cos(theta), math.sin(theta)
+        tile_xs = (center_x * cos_t + center_y * sin_t - watermark_width / 2).tolist()
+        tile_ys = (center_y * cos_t - center_x * sin_t - watermark_height / 2).tolist()
+        
+        c.saveState()
+        c.rotate(WATERMARK_ROTATION)
+        for tile_x, tile_y in zip(tile_xs, tile_ys):
+            c.drawImage(img_reader, tile_x, tile_y, width=watermark_width, height=watermark_height, mask='auto')
+        c.restoreState()
+
     def _calculate_box_height(self, num_images, fixed_height=None):
-        """비콘 박스의 높이 계산"""
-        available_width = self.BEACON_BOX_WIDTH - (self.BOX_PADDING * 2)
-        available_height = CONTENT_HEIGHT - self.BEACON_TITLE_HEIGHT - self.BOX_PADDING * 2
-        
-        # 이미지 레이아웃 결정
-        if num_images == 4: # Full width
-             # Full width logic handled separately usually, but here for height calc
-             # If full width, width is larger
-             available_width = CONTENT_WIDTH - (self.BOX_PADDING * 2)
-             image_layout = (4, 1)
-        elif num_images == 0: image_layout = (0, 0)
-        elif num_images <= 3: image_layout = (num_images, 1)
-        else: image_layout = (2, (num_images + 1) // 2)
-        
-        cols, rows = image_layout
-        
-        if num_images == 0:
-            image_area_height = 15 * mm
-        else:
-            image_area_height = min(available_height, self.MAX_IMAGE_HEIGHT)
-            
+        """비콘 박스의 높이 계산 (이미지 유무에 따라 두 가지 값뿐이므로 미리 계산된 값 사용)"""
         if fixed_height is not None:
             return fixed_height
-            
-        return self.BEACON_TITLE_HEIGHT + image_area_height + (self.BOX_PADDING * 2)
+        return self.box_height_with_images if num_images else self.box_height_without_images
+
+    def _image_cell_size(self, num_images, box_width, fixed_height=None):
+        """박스 안의 이미지 배치 (열, 행)과 이미지 셀 크기 계산"""
+        cols, rows = image_grid(num_images)
+        available_width = box_width - (self.BOX_PADDING * 2)
+        
+        if fixed_height is not None:
+            image_area_height = fixed_height - self.BEACON_TITLE_HEIGHT - (self.BOX_PADDING * 2)
+        else:
+            image_area_height = self.image_area_height
+        
+        img_cell_w = (available_width - (self.IMAGE_MARGIN * (cols - 1))) / cols if cols > 0 else available_width
+        img_cell_h = (image_area_height - (self.IMAGE_MARGIN * (rows - 1))) / rows if rows > 1 else image_area_height
+        return cols, rows, img_cell_w, img_cell_h
+
+    def preresize_images(self, beacon_list):
+        """
+        모든 비콘 이미지를 그리기 전에 프로세스 풀로 병렬 리사이즈/인코딩하여 캐시
+        (LANCZOS 리사이즈는 CPU 작업이므로 스레드 대신 프로세스 사용)
+        """
+        jobs = []
+        for beacon_info in beacon_list:
+            image_files = beacon_info['images']
+            num_images = len(image_files)
+            if num_images == 0:
+                continue
+            box_width = CONTENT_WIDTH if num_images == 4 else self.BEACON_BOX_WIDTH
+            _, _, img_cell_w, img_cell_h = self._image_cell_size(num_images, box_width)
+            jobs.extend((img_path, img_cell_w, img_cell_h) for img_path in image_files)
+        
+        if not jobs:
+            return
+        
+        # 내용이 같은 이미지는 한 번만 처리 (같은 셀 크기 기준)
+        digests = image_content_keys([img_path for img_path, _, _ in jobs])
+        unique_jobs = {}
+        for job in jobs:
+            img_path, img_cell_w, img_cell_h = job
+            unique_jobs.setdefault((digests[img_path], img_cell_w, img_cell_h), job)
+        
+        print(f"🖼  이미지 {len(unique_jobs)}장 병렬 리사이즈 중... (전체 {len(jobs)}장)")
+        results = {}
+        # 작업 수보다 많은 프로세스는 띄우지 않음 (프로세스 생성 비용 절약)
+        max_workers = min(os.cpu_count() or 1, len(unique_jobs))
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            for key, result in zip(unique_jobs, executor.map(encode_image_for_pdf, unique_jobs.values(), chunksize=4)):
+                results[key] = result
+        
+        # 여러 번 그려지는 이미지는 ImageReader를 하나만 만들어 공유
+        # (reportlab이 XObject 중복 확인용으로 디코딩한 데이터를 재사용, 한 번만 쓰이는 이미지는 메모리 절약을 위해 바이트로 유지)
+        use_counts = {}
+        for img_path, img_cell_w, img_cell_h in jobs:
+            key = (digests[img_path], img_cell_w, img_cell_h)
+            use_counts[key] = use_counts.get(key, 0) + 1
+        for key, count in use_counts.items():
+            jpeg_bytes, w, h = results[key]
+            if count > 1 and jpeg_bytes:
+                results[key] = (ImageReader(BytesIO(jpeg_bytes)), w, h)
+        
+        for job in jobs:
+            img_path, img_cell_w, img_cell_h = job
+            self.image_cache[job] = results[(digests[img_path], img_cell_w, img_cell_h)]
 
     def _draw_beacon_box_content(self, beacon_number, image_files, box_x, box_y_top, box_width, fixed_height=None, is_방폭=False):
         """실제 비콘 박스 그리기 로직"""
         c = self.c
         num_images = len(image_files)
         
-        # 레이아웃 계산
-        available_width = box_width - (self.BOX_PADDING * 2)
-        available_height = CONTENT_HEIGHT - self.BEACON_TITLE_HEIGHT - self.BOX_PADDING * 2
-        
-        if num_images == 0:
-            image_layout = (0, 0)
-            image_area_height = 15 * mm
-        elif num_images <= 3:
-            image_layout = (num_images, 1)
-            image_area_height = min(available_height, self.MAX_IMAGE_HEIGHT)
-        elif num_images == 4:
-            image_layout = (4, 1)
-            image_area_height = min(available_height, self.MAX_IMAGE_HEIGHT)
-        else:
-            image_layout = (2, (num_images + 1) // 2)
-            image_area_height = min(available_height, self.MAX_IMAGE_HEIGHT)
-            
-        # 고정 높이가 있으면 재조정
+        # 박스 높이 계산 (고정 높이가 있으면 그 높이 사용)
         if fixed_height is not None:
             box_height = fixed_height
-            image_area_height = box_height - self.BEACON_TITLE_HEIGHT - (self.BOX_PADDING * 2)
         else:
-            box_height = self.BEACON_TITLE_HEIGHT + image_area_height + (self.BOX_PADDING * 2)
+            box_height = self._calculate_box_height(num_images)
             
         box_y_bottom = box_y_top - box_height
         
-        # 배경 및 테두리
-        bg_color = HexColor('#F5F5F5') if USE_HEXCOLOR else white
-        border_color = HexColor('#E0E0E0') if USE_HEXCOLOR else black
-        
-        c.setFillColor(bg_color)
-        c.setStrokeColor(bg_color)
-        
-        # Rounded Rect simulation
-        r = 1.5 * mm
-        c.circle(box_x + r, box_y_top - r, r, fill=1, stroke=0)
-        c.circle(box_x + box_width - r, box_y_top - r, r, fill=1, stroke=0)
-        c.circle(box_x + r, box_y_bottom + r, r, fill=1, stroke=0)
-        c.circle(box_x + box_width - r, box_y_bottom + r, r, fill=1, stroke=0)
-        c.rect(box_x, box_y_bottom + r, box_width, box_height - 2*r, fill=1, stroke=0)
-        c.rect(box_x + r, box_y_bottom, box_width - 2*r, box_height, fill=1, stroke=0)
-        
-        c.setStrokeColor(border_color)
+        # 배경 및 테두리 (둥근 사각형 경로 하나로 채우기와 선을 함께 그림)
+        c.setFillColor(BOX_BG_COLOR)
+        c.setStrokeColor(BOX_BORDER_COLOR)
         c.setLineWidth(0.8)
-        c.rect(box_x, box_y_bottom, box_width, box_height, fill=0, stroke=1)
+        c.roundRect(box_x, box_y_bottom, box_width, box_height, BOX_CORNER_RADIUS, stroke=1, fill=1)
         
         # Title
-        try:
-            c.setFont(PRETENDARD_BOLD, 7)
-        except:
-            c.setFont("Helvetica-Bold", 7)
+        self._set_font(self.bold_font, 7)
         c.setFillColor(black)
         # 방폭비콘인 경우 "방폭비콘 Beacon {번호}" 형식으로 표시
         if is_방폭:
@@ -477,9 +667,7 @@ class PDFLayoutManager:
         
         # Images
         if num_images > 0:
-            cols, rows = image_layout
-            img_cell_w = (available_width - (self.IMAGE_MARGIN * (cols - 1))) / cols if cols > 0 else available_width
-            img_cell_h = (image_area_height - (self.IMAGE_MARGIN * (rows - 1))) / rows if rows > 1 else image_area_height
+            cols, rows, img_cell_w, img_cell_h = self._image_cell_size(num_images, box_width, fixed_height)
             
             img_start_y = box_y_top - self.BEACON_TITLE_HEIGHT - self.BOX_PADDING
             
@@ -487,146 +675,146 @@ class PDFLayoutManager:
                 r_idx = i // cols
                 c_idx = i % cols
                 
-                resized, w, h = resize_image_for_pdf(img_path, img_cell_w, img_cell_h)
+                # 미리 리사이즈된 결과가 있으면 사용, 없으면 (재그리기 등) 즉시 처리
+                job = (img_path, img_cell_w, img_cell_h)
+                cached = self.image_cache.get(job)
+                image_data, w, h = cached if cached is not None else encode_image_for_pdf(job)
                 
-                if resized:
+                if image_data:
                     ix = box_x + self.BOX_PADDING + c_idx * (img_cell_w + self.IMAGE_MARGIN) + (img_cell_w - w)/2
                     iy = img_start_y - (r_idx + 1) * img_cell_h - r_idx * self.IMAGE_MARGIN + (img_cell_h - h)/2
                     
-                    buffer = BytesIO()
-                    resized.save(buffer, format='JPEG', quality=98)
-                    buffer.seek(0)
-                    c.drawImage(ImageReader(buffer), ix, iy, width=w, height=h)
+                    reader = image_data if isinstance(image_data, ImageReader) else ImageReader(BytesIO(image_data))
+                    c.drawImage(reader, ix, iy, width=w, height=h)
         else:
             # No Image Text
-            try: c.setFont(PRETENDARD_REGULAR, 10)
-            except: c.setFont("Helvetica", 10)
+            self._set_font(self.regular_font, 10)
             c.drawCentredString(box_x + box_width/2, box_y_top - box_height/2, "이미지 없음")
             
         return box_height
 
     def add_beacon(self, beacon_info):
-        """비콘 하나를 레이아웃에 배치"""
-        beacon_number = beacon_info['number']
-        image_files = beacon_info['images']
-        is_방폭 = beacon_info.get('is_방폭', False)
-        num_images = len(image_files)
-        is_full_width = (num_images == 4)
-        
-        # 1. 공간 확인 및 페이지 넘김 결정
-        
-        # 4개 이미지(Full Width)인 경우
-        if is_full_width:
-            # 왼쪽 열에 대기중인 비콘이 있으면 먼저 처리 완료해야 함
-            if self.current_col == 1:
-                self.current_col = 0
-                self.row_heights = []
-                self.column_slots_used += 1
-                # Y 위치 조정 (왼쪽 비콘 높이만큼)
-                left_h = self.left_beacon_box_info['height']
-                self.col_y_positions[0] -= (left_h + self.BEACON_MARGIN)
-                self.col_y_positions[1] = min(self.col_y_positions[0], self.col_y_positions[1])
-                self.left_beacon_data = None
-            
-            # 새 페이지 필요 여부 체크
-            est_height = self._calculate_box_height(num_images)
-            next_y = min(self.col_y_positions) - est_height - self.BEACON_MARGIN
-            min_y = FOOTER_HEIGHT + FOOTER_BOTTOM_MARGIN + self.MIN_Y_MARGIN
-            
-            if next_y < min_y or self.column_slots_used + 2 > self.MAX_COLUMN_SLOTS:
-                self._start_new_page()
-                
-            # 그리기
-            box_y = min(self.col_y_positions)
-            height = self._draw_beacon_box_content(
-                beacon_number, image_files, 
-                MARGIN, box_y, CONTENT_WIDTH, is_방폭=is_방폭
-            )
-            
-            # 상태 업데이트
-            self.col_y_positions[0] = box_y - height - self.BEACON_MARGIN
-            self.col_y_positions[1] = self.col_y_positions[0]
-            self.column_slots_used += 2
-            self.success_count += 1
-            print(f"  Beacon {beacon_number}: Full Width 배치 완료")
-            
-        # 일반 비콘 (Half Width)
+        """비콘 하나를 레이아웃에 배치 (4장이면 전체 폭, 아니면 반쪽 폭)"""
+        num_images = len(beacon_info['images'])
+        box_height = self._calculate_box_height(num_images)
+        if num_images == 4:
+            self._place_full_width(beacon_info, box_height)
         else:
-            # 현재 열 위치 계산
-            box_y = self.col_y_positions[self.current_col]
-            min_y = FOOTER_HEIGHT + FOOTER_BOTTOM_MARGIN + self.MIN_Y_MARGIN
-            
-            # 페이지 넘김 체크
-            # 왼쪽 열일 때만 체크 (오른쪽은 왼쪽과 같은 행이므로 공간이 있다고 가정하되, 너무 좁으면 넘김)
-            if self.current_col == 0:
-                if box_y < min_y or self.column_slots_used + 2 > self.MAX_COLUMN_SLOTS:
-                    self._start_new_page()
-                    box_y = self.col_y_positions[0]
-            else:
-                # 오른쪽 열인데 공간 부족하면? -> 왼쪽만 그리고 다음 페이지로
-                # (이전 로직 유지: 오른쪽 공간 부족시 왼쪽만 카운트하고 페이지 넘김)
-                if box_y < min_y or self.column_slots_used + 2 > self.MAX_COLUMN_SLOTS:
-                    # 왼쪽 비콘은 이미 그려짐. 페이지 넘기고 초기화
-                    self._start_new_page()
-                    box_y = self.col_y_positions[0]
-                    # 왼쪽 비콘 데이터는 날아감 (이미 전 페이지에 그려짐)
-                    self.left_beacon_data = None 
-            
-            # 그리기
-            box_x = MARGIN + self.current_col * (self.BEACON_BOX_WIDTH + self.BEACON_COLUMN_MARGIN)
-            height = self._draw_beacon_box_content(
-                beacon_number, image_files,
-                box_x, box_y, self.BEACON_BOX_WIDTH, is_방폭=is_방폭
-            )
-            
-            if self.current_col == 0:
-                # 왼쪽 열: 대기
-                self.row_heights = [height]
-                self.left_beacon_data = beacon_info
-                self.left_beacon_box_info = {'x': box_x, 'y': box_y, 'height': height}
-                self.current_col = 1
-                print(f"  Beacon {beacon_number}: 왼쪽 배치 (오른쪽 대기 중)")
-            else:
-                # 오른쪽 열: 높이 맞추기 및 확정
-                self.row_heights.append(height)
-                max_h = max(self.row_heights)
-                
-                # 높이가 다르면 다시 그리기
-                if self.left_beacon_data and max_h > self.left_beacon_box_info['height']:
-                    # 왼쪽 다시 그리기
-                    left_is_방폭 = self.left_beacon_data.get('is_방폭', False)
-                    self._draw_beacon_box_content(
-                        self.left_beacon_data['number'], self.left_beacon_data['images'],
-                        self.left_beacon_box_info['x'], self.left_beacon_box_info['y'],
-                        self.BEACON_BOX_WIDTH, fixed_height=max_h, is_방폭=left_is_방폭
-                    )
-                if max_h > height:
-                    # 오른쪽 다시 그리기
-                    self._draw_beacon_box_content(
-                        beacon_number, image_files,
-                        box_x, box_y, self.BEACON_BOX_WIDTH, fixed_height=max_h, is_방폭=is_방폭
-                    )
-                
-                # 상태 업데이트
-                next_y = min(self.col_y_positions) - max_h - self.BEACON_MARGIN
-                self.col_y_positions[0] = next_y
-                self.col_y_positions[1] = next_y
-                self.column_slots_used += 2
-                self.success_count += 2 # 왼쪽 + 오른쪽
-                self.current_col = 0
-                self.row_heights = []
-                self.left_beacon_data = None
-                print(f"  Beacon {beacon_number}: 오른쪽 배치 완료 (행 높이: {int(max_h/mm)}mm)")
+            self._place_half_width(beacon_info, box_height)
+
+    def _log(self, message):
+        """진행 로그를 버퍼에 모으고 LOG_FLUSH_LINES줄마다 한 번에 출력"""
+        self.log_lines.append(message)
+        if len(self.log_lines) >= LOG_FLUSH_LINES:
+            self._flush_log()
+
+    def _flush_log(self):
+        """버퍼에 모인 진행 로그를 한 번의 print로 출력"""
+        if self.log_lines:
+            print("\n".join(self.log_lines))
+            self.log_lines.clear()
+
+    def _needs_new_page(self, y):
+        """y 위치가 하단 여백을 넘었거나 이번 페이지의 슬롯이 모자라면 True"""
+        return y < self.min_y or self.column_slots_used + 2 > self.MAX_COLUMN_SLOTS
+
+    def _place(self, beacon_info, x, y, width):
+        """현재 페이지 계획에 비콘 박스 위치를 기록"""
+        self.pages[-1].append(PlacedBeacon(beacon_info, x, y, width))
+
+    def _close_left_only_row(self):
+        """오른쪽 없이 왼쪽 비콘만 있는 행을 확정하고 다음 행으로 이동"""
+        self.col_y_positions[0] -= (self.left_beacon_height + self.BEACON_MARGIN)
+        self.col_y_positions[1] = min(self.col_y_positions[0], self.col_y_positions[1])
+        self.column_slots_used += 1
+        self.current_col = 0
+        self.left_beacon_data = None
+
+    def _place_full_width(self, beacon_info, box_height):
+        """4개 이미지 비콘을 전체 폭으로 배치"""
+        # 왼쪽 열에 대기중인 비콘이 있으면 그 행을 먼저 확정
+        if self.current_col == 1:
+            self._close_left_only_row()
+        
+        if self._needs_new_page(min(self.col_y_positions) - box_height - self.BEACON_MARGIN):
+            self._start_new_page()
+        
+        box_y = min(self.col_y_positions)
+        self._place(beacon_info, MARGIN, box_y, CONTENT_WIDTH)
+        
+        self.col_y_positions[0] = box_y - box_height - self.BEACON_MARGIN
+        self.col_y_positions[1] = self.col_y_positions[0]
+        self.column_slots_used += 2
+        self.success_count += 1
+        if self.verbose:
+            self._log(f"  Beacon {beacon_info['number']}: Full Width 배치 완료")
+
+    def _place_half_width(self, beacon_info, box_height):
+        """일반 비콘을 왼쪽/오른쪽 열에 배치"""
+        beacon_number = beacon_info['number']
+        
+        # 왼쪽 열은 새 행의 시작 위치로, 오른쪽 열은 왼쪽과 같은 행으로 공간 확인
+        # (오른쪽 공간이 부족하면 왼쪽은 이전 페이지에 남겨두고 새 페이지의 왼쪽으로)
+        box_y = self.col_y_positions[self.current_col]
+        if self._needs_new_page(box_y):
+            self._start_new_page()
+            box_y = self.col_y_positions[0]
+        
+        box_x = MARGIN + self.current_col * (self.BEACON_BOX_WIDTH + self.BEACON_COLUMN_MARGIN)
+        
+        if self.current_col == 0:
+            # 왼쪽 열: 오른쪽 비콘 대기
+            self.left_beacon_data = beacon_info
+            self.left_beacon_height = box_height
+            self.left_beacon_index = len(self.pages[-1])
+            self._place(beacon_info, box_x, box_y, self.BEACON_BOX_WIDTH)
+            self.current_col = 1
+            if self.verbose:
+                self._log(f"  Beacon {beacon_number}: 왼쪽 배치 (오른쪽 대기 중)")
+            return
+        
+        # 오른쪽 열: 행 높이를 정하고 낮은 쪽 박스를 행 높이에 맞춤
+        max_h = max(self.left_beacon_height, box_height) if self.left_beacon_data else box_height
+        page = self.pages[-1]
+        if self.left_beacon_data and max_h > self.left_beacon_height:
+            page[self.left_beacon_index] = replace(page[self.left_beacon_index], fixed_height=max_h)
+        page.append(PlacedBeacon(beacon_info, box_x, box_y, self.BEACON_BOX_WIDTH,
+                                 fixed_height=max_h if max_h > box_height else None))
+        
+        next_y = min(self.col_y_positions) - max_h - self.BEACON_MARGIN
+        self.col_y_positions[0] = next_y
+        self.col_y_positions[1] = next_y
+        self.column_slots_used += 2
+        self.success_count += 2 # 왼쪽 + 오른쪽
+        self.current_col = 0
+        self.left_beacon_data = None
+        if self.verbose:
+            self._log(f"  Beacon {beacon_number}: 오른쪽 배치 완료 (행 높이: {int(max_h/mm)}mm)")
 
     def finish(self):
-        """마지막 남은 비콘 처리 및 저장"""
+        """마지막 남은 비콘 처리 후 계획된 페이지를 순서대로 그리고 저장"""
         if self.current_col == 1 and self.left_beacon_data:
             # 왼쪽 비콘만 있고 오른쪽이 없는 상태로 종료됨
             self.success_count += 1
-            print(f"  Beacon {self.left_beacon_data['number']}: 마지막 왼쪽 배치 완료")
-            
-        self.c.save()
-        return self.success_count, self.page_number
+            if self.verbose:
+                self._log(f"  Beacon {self.left_beacon_data['number']}: 마지막 왼쪽 배치 완료")
+        self._flush_log()
+        
+        c = self.c
+        for page_number, placements in enumerate(self.pages, 1):
+            if page_number > 1:
+                c.showPage()
+            self.page_number = page_number
+            self._draw_page_chrome()
+            for placed in placements:
+                beacon_info = placed.beacon_info
+                self._draw_beacon_box_content(
+                    beacon_info['number'], beacon_info['images'], placed.x, placed.y, placed.width,
+                    fixed_height=placed.fixed_height, is_방폭=beacon_info.get('is_방폭', False)
+                )
+        
+        c.save()
+        return self.success_count, len(self.pages)
 
 
 # ============================================================================
@@ -638,48 +826,39 @@ def collect_beacon_data_by_minor():
     import os
     import unicodedata
     
-    # glob을 사용하여 폴더 찾기
+    # os.scandir로 한 번만 읽고 캐시된 파일 타입 사용 (항목마다 stat 호출 없음)
+    # Minor_ 폴더 + 방폭비콘_Minor 폴더 (조합형/완성형 모두 인식)
     minor_folders = []
+    if not OUTPUT_DIR.is_dir():
+        print("❌ Minor 폴더를 찾을 수 없습니다.")
+        return {}
+    with os.scandir(OUTPUT_DIR) as entries:
+        for entry in entries:
+            folder_name = entry.name
+            if 'Minor_' not in folder_name or not entry.is_dir():
+                continue
+            if folder_name.startswith('Minor_') or '방폭비콘' in unicodedata.normalize('NFC', folder_name):
+                minor_folders.append(entry)
     
-    # Minor_로 시작하는 폴더 찾기
-    minor_folders.extend([f for f in OUTPUT_DIR.glob('Minor_*') if f.is_dir()])
-    
-    # *Minor_* 패턴으로 모든 Minor 폴더 찾기 (방폭비콘_Minor 포함)
-    all_minor_folders = [f for f in OUTPUT_DIR.glob('*Minor_*') if f.is_dir()]
-    
-    # 방폭비콘_Minor 폴더 찾기 (조합형/완성형 모두 인식)
-    for folder in all_minor_folders:
-        folder_name = folder.name
-        # 완성형 또는 조합형으로 '방폭비콘'이 포함되어 있는지 확인
-        # 정규화하여 비교
-        normalized_name = unicodedata.normalize('NFC', folder_name)
-        if '방폭비콘' in normalized_name or '방폭비콘' in folder_name:
-            if folder not in minor_folders:
-                minor_folders.append(folder)
-    
-    minor_folders = sorted(minor_folders, key=lambda x: x.name)
+    minor_folders.sort(key=lambda entry: entry.name)
     
     if not minor_folders:
         print("❌ Minor 폴더를 찾을 수 없습니다.")
         return {}
         
     minor_data = {}
-    image_extensions = {'.jpg', '.jpeg', '.png', '.JPG', '.JPEG', '.PNG'}
     
     for folder in minor_folders:
         minor_name = folder.name  # Minor_0001 또는 방폭비콘_Minor_0001 형식
         b_num = get_beacon_number(minor_name)
         if b_num is None: continue
         
-        images = [f for f in folder.iterdir() if f.is_file() and f.suffix in image_extensions]
-        
-        # 정렬 로직
-        def sort_key(p):
-            n = p.name
-            is_eng_num = all(ord(c) < 128 for c in n.replace('.', '').replace('_', '').replace('-', ''))
-            return (0 if is_eng_num else 1, n)
-            
-        images.sort(key=sort_key)
+        # 정렬: 영문/숫자(ASCII) 파일명 먼저, 그 다음 한글 등 (정렬 키는 파일마다 한 번만 계산)
+        with os.scandir(folder.path) as entries:
+            decorated = [(0 if entry.name.isascii() else 1, entry.name, entry.path) for entry in entries
+                         if entry.name.lower().endswith(IMAGE_EXTENSIONS) and entry.is_file()]
+        decorated.sort()
+        images = [image_path for _, _, image_path in decorated]
         
         if images:
             if minor_name not in minor_data:
@@ -725,9 +904,10 @@ def collect_beacon_data():
     
     return beacon_list
 
-def create_all_pdfs():
+def create_all_pdfs(verbose=False):
     """
     [단계 4] output 폴더의 Minor별 이미지들을 PDF로 변환합니다.
+    verbose: True면 비콘별 배치 로그 출력
     """
     print("="*70)
     print("단계 4: PDF 생성")
@@ -743,6 +923,13 @@ def create_all_pdfs():
         high_density = (choice == '2')
     except:
         high_density = False
+    
+    watermark = WATERMARK_ENABLED
+    if watermark:
+        try:
+            watermark = input("워터마크 포함 (y/n, 기본 y): ").strip().lower() != 'n'
+        except:
+            watermark = True
         
     layout_settings = get_layout_settings(high_density)
     
@@ -762,11 +949,15 @@ def create_all_pdfs():
     pdf_filename = f"{FACILITY_NAME.replace(' ', '_')}_Beacon_설치현황.pdf"
     pdf_path = PDF_OUTPUT_DIR / pdf_filename
     
-    c = canvas.Canvas(str(pdf_path), pagesize=A4)
-    manager = PDFLayoutManager(c, layout_settings)
+    # 페이지 콘텐츠 스트림 zlib 압축 (rl_config 기본값에 의존하지 않도록 명시)
+    c = canvas.Canvas(str(pdf_path), pagesize=A4, pageCompression=1)
+    manager = PDFLayoutManager(c, layout_settings, watermark=watermark, verbose=verbose)
     
     start_time = time.time()
     
+    # 이미지 병렬 리사이즈
+    manager.preresize_images(beacon_data)
+    
     # 비콘 추가
     for info in beacon_data:
         manager.add_beacon(info)
@@ -787,4 +978,7 @@ def create_all_pdfs():
     print("="*70)
 
 if __name__ == "__main__":
-    create_all_pdfs()
+    parser = argparse.ArgumentParser(description="output 폴더의 Minor별 이미지들을 PDF로 변환")
+    parser.add_argument('--verbose', action='store_true', help="비콘별 배치 로그 출력")
+    args = parser.parse_args()
+    create_all_pdfs(verbose=args.verbose)
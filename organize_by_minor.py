@@ -9,34 +9,158 @@
 import os
 import re
 import shutil
+import sys
 import time
 from pathlib import Path
 from datetime import datetime
 
+import numpy as np
+from PIL import Image as PILImage
+
 try:
-    import easyocr
     import cv2
-    import numpy as np
-    from PIL import Image as PILImage
-    USE_EASYOCR = True
     USE_IMAGE_PREPROCESSING = True
-    print("EasyOCR과 이미지 전처리를 사용합니다...")
-    reader = easyocr.Reader(['ko', 'en'], gpu=False)
-except ImportError as e:
-    if 'easyocr' in str(e):
-        print("Error: easyocr이 설치되지 않았습니다.")
-        print("설치: pip3 install easyocr")
-    elif 'cv2' in str(e):
-        print("Warning: opencv-python이 설치되지 않았습니다. 이미지 전처리 기능이 제한됩니다.")
-        print("설치: pip3 install opencv-python")
-        USE_IMAGE_PREPROCESSING = False
-    else:
-        USE_IMAGE_PREPROCESSING = False
-    if not USE_EASYOCR:
-        exit(1)
+except ImportError:
+    print("Warning: opencv-python이 설치되지 않았습니다. 이미지 전처리 기능이 제한됩니다.")
+    print("설치: pip3 install opencv-python")
+    USE_IMAGE_PREPROCESSING = False
+
+# EasyOCR Reader는 모델 로드에 수 초가 걸리므로 OCR이 실제로 필요할 때 get_reader()에서 생성
+# (easyocr/torch import도 그때까지 미룸 - 파일명으로 모두 분류되면 로드하지 않음)
+reader = None
+
+def gpu_available():
+    """CUDA 또는 Apple MPS GPU 사용 가능 여부"""
+    try:
+        import torch
+    except ImportError:
+        return False
+    return torch.cuda.is_available() or torch.backends.mps.is_available()
+
+def get_reader():
+    """EasyOCR Reader를 처음 호출될 때 한 번만 생성하여 반환"""
+    global reader
+    if reader is None:
+        try:
+            import easyocr
+            import torch
+        except ImportError:
+            print("Error: easyocr이 설치되지 않았습니다.")
+            print("설치: pip3 install easyocr")
+            exit(1)
+        # GPU가 있으면 GPU로 OCR (CPU에서는 INT8 양자화 인식 모델 사용, quantize=True는 EasyOCR 기본값이지만 명시)
+        use_gpu = gpu_available()
+        print(f"EasyOCR Reader를 로드합니다... ({'GPU' if use_gpu else 'CPU'})")
+        reader = easyocr.Reader(['ko', 'en'], gpu=use_gpu, quantize=True,
+                                cudnn_benchmark=torch.cuda.is_available())
+    return reader
 
 SOURCE_DIR = Path("source")
 OUTPUT_DIR = Path("output")
+IMAGE_EXTENSIONS = frozenset({'.jpg', '.jpeg', '.png'})  # 소문자로 비교 (.JPG 등 대소문자 무관)
+# ORGANIZE_HARDLINK=1 이면 output 파일을 복사 대신 하드링크로 생성 (기본은 복사)
+# 하드링크는 source 원본과 데이터를 공유하므로 output 이미지를 직접 수정(회전, 보정 등)하면 원본도 함께 바뀜
+USE_HARDLINKS = os.environ.get('ORGANIZE_HARDLINK', '0') == '1'
+
+# OCR 전처리 시 이미지 긴 변의 최대 픽셀 (CRAFT 감지 연산량은 픽셀 수에 비례)
+OCR_MAX_SIDE = 1280
+
+# OCR 텍스트의 '설치' / 'Minor' 옆 숫자 패턴 (우선순위 순서, 모듈 로드 시 한 번만 컴파일)
+INSTALL_FOUR_DIGIT_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r'설치\s*[:：]?\s*([0-9OoIl|]{4})',  # 설치: 0019 (4자리)
+    r'설치\s+([0-9OoIl|]{4})',  # 설치 0019
+    r'설치([0-9OoIl|]{4})',  # 설치0019 (공백 없음)
+    r'([0-9OoIl|]{4})\s*설치',  # 0019 설치 (순서 반대)
+))
+# 설치 패턴 (4자리 미만도 시도 - 4자리로 패딩)
+INSTALL_FLEXIBLE_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r'설치\s*(\d{1,3})(?=25\d{4,})',  # 설치10251104 (날짜 패턴)
+    r'설치\s*(\d{1,3})(?=\d{6})',    # 설치 + 숫자 + 6자리 이상
+    r'설치\s*[:：]?\s*(\d{1,4})',    # 설치: 10 또는 설치: 0019
+    r'설치\s*[:：]?\s*([0-9OoIl|]{1,4})',  # 설치: OO19 (OCR 오류 포함)
+    r'설치\s+([0-9OoIl|]+)',  # 설치 001
+    r'설치([0-9OoIl|]+)',  # 설치001
+))
+# Minor 패턴 (Mnor, Inor 등 OCR 오인식 포함, 대소문자 무시)
+MINOR_FOUR_DIGIT_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'(?:Minor|Mnor|Inor|Mior|Mmor|M1nor|M|nor)\s*[:：]?\s*([0-9OoIl|]{4})',  # Minor: 0019 (4자리)
+    r'(?:Minor|Mnor|Inor)\s+([0-9OoIl|]{4})',  # Minor 0019
+    r'(?:Minor|Mnor|Inor)([0-9OoIl|]{4})',  # Minor0019 (공백 없음)
+    r'([0-9OoIl|]{4})\s*(?:Minor|Mnor|Inor)',  # 0019 Minor (순서 반대)
+))
+MINOR_FLEXIBLE_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'(?:Minor|Mnor|Inor|Mior|Mmor|M1nor)\s*[:：]?\s*([0-9OoIl|]+)',  # Minor: 001
+    r'(?:Minor|Mnor|Inor)\s+([0-9OoIl|]+)',  # Minor 001
+    r'(?:Minor|Mnor|Inor)([0-9OoIl|]+)',  # Minor001 (공백 없음)
+))
+
+# 파일명 규칙 정규식 (파일마다 호출되므로 미리 컴파일)
+FILENAME_EXT_RE = re.compile(r'\.(?:jpe?g|png)$', re.IGNORECASE)
+FILENAME_DATE9_RE = re.compile(r'^(.+?)(25\d{7})$')
+FILENAME_DATE8_RE = re.compile(r'^(.+?)(\d{8})$')
+FILENAME_DATE6_RE = re.compile(r'^(.+?)(\d{6,})$')
+FILENAME_INSTALL_RE = re.compile(r'설치(\d+)')
+DIGITS_RE = re.compile(r'\d+')
+
+# OCR 숫자 오인식 보정표: O, o -> 0
+# I, l, | -> 1 / S -> 5 / Z -> 2 등은 문맥에 따라 다를 수 있어 너무 공격적으로 바꾸면
+# 오히려 문제가 될 수 있으므로 넣지 않음
+OCR_DIGIT_FIX = str.maketrans({'O': '0', 'o': '0'})
+
+# OCR 텍스트의 '비콘' 옆 숫자 패턴 (우선순위 순서, 모듈 로드 시 한 번만 컴파일)
+BEACON_FOUR_DIGIT_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    # 정확한 '비콘' 패턴 (직접 인접) - 최우선
+    r'비콘\s+([0-9OoIl|]{4})',  # 비콘 0019 (가장 일반적인 형식)
+    r'비콘\s*[:：]?\s*([0-9OoIl|]{4})',  # 비콘: 0019
+    r'비콘\s*[:\s]*([0-9OoIl|]{4})',  # 비콘: 0019 또는 비콘 0019 (더 유연한 공백 처리)
+    r'비콘([0-9OoIl|]{4})',  # 비콘0019 (공백 없음)
+    r'([0-9OoIl|]{4})\s*비콘',  # 0019 비콘 (순서 반대)
+    # '비콘' 앞에 단어가 있는 경우 (예: "공종 비콘 0281") - 중요!
+    r'\S+\s+비콘\s+([0-9OoIl|]{4})',  # 공종 비콘 0281 또는 XXX 비콘 0281
+    r'\S+\s+비콘\s*[:：]?\s*([0-9OoIl|]{4})',  # 공종 비콘: 0281
+    r'\S+\s+비콘\s*[:\s]*([0-9OoIl|]{4})',  # 공종 비콘: 0281 (더 유연한 공백 처리)
+    # '비콘'과 숫자 사이에 다른 단어가 있는 경우 (예: "비콘 공종 0293")
+    r'비콘\s+\S+\s+([0-9OoIl|]{4})',  # 비콘 공종 0293 또는 비콘 XXX 0293
+    # OCR 오류 패턴 (비콕 등)
+    r'비[콘콕]\s+([0-9OoIl|]{4})',  # 비콘 0019 또는 비콕 0019
+    r'비[콘콕]\s*[:：]?\s*([0-9OoIl|]{4})',  # 비콘: 0019 또는 비콕: 0019
+    r'비[콘콕]\s*[:\s]*([0-9OoIl|]{4})',  # 비콘: 0019 (더 유연한 공백 처리)
+    r'비[콘콕]([0-9OoIl|]{4})',  # 비콘0019 또는 비콕0019
+    r'([0-9OoIl|]{4})\s*비[콘콕]',  # 0019 비콘 또는 0019 비콕
+    r'\S+\s+비[콘콕]\s+([0-9OoIl|]{4})',  # 공종 비콘 0281 (OCR 오류 포함)
+    r'비[콘콕]\s+\S+\s+([0-9OoIl|]{4})',  # 비콘 공종 0293 (OCR 오류 포함)
+    # 더 유연한 패턴 (한 글자 오류 허용)
+    r'비[콘콕콘]\s+([0-9OoIl|]{4})',  # 비콘 0019 (다양한 변형)
+    r'비[콘콕콘]\s*[:：]?\s*([0-9OoIl|]{4})',  # 비콘: 0019
+    r'비[콘콕콘]\s*[:\s]*([0-9OoIl|]{4})',  # 비콘: 0019 (더 유연한 공백 처리)
+    r'비[콘콕콘]([0-9OoIl|]{4})',  # 비콘0019
+    r'\S+\s+비[콘콕콘]\s+([0-9OoIl|]{4})',  # 공종 비콘 0281 (유연한 변형)
+    r'비[콘콕콘]\s+\S+\s+([0-9OoIl|]{4})',  # 비콘 공종 0293 (유연한 변형)
+))
+# 비콘 패턴 (4자리 미만도 시도 - 4자리로 패딩)
+BEACON_FLEXIBLE_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    # 정확한 '비콘' 패턴 (직접 인접) - 최우선
+    r'비콘\s+([0-9OoIl|]+)',  # 비콘 001 (가장 일반적인 형식)
+    r'비콘\s*[:：]?\s*([0-9OoIl|]+)',  # 비콘: 001
+    r'비콘([0-9OoIl|]+)',  # 비콘001
+    # '비콘' 앞에 단어가 있는 경우 (예: "공종 비콘 0281") - 중요!
+    r'\S+\s+비콘\s+([0-9OoIl|]+)',  # 공종 비콘 0281 또는 XXX 비콘 0281
+    r'\S+\s+비콘\s*[:：]?\s*([0-9OoIl|]+)',  # 공종 비콘: 0281
+    # '비콘'과 숫자 사이에 다른 단어가 있는 경우 (예: "비콘 공종 0293")
+    r'비콘\s+\S+\s+([0-9OoIl|]+)',  # 비콘 공종 0293 또는 비콘 XXX 0293
+    # OCR 오류 패턴
+    r'비[콘콕]\s+([0-9OoIl|]+)',  # 비콘 001 또는 비콕 001
+    r'비[콘콕]\s*[:：]?\s*([0-9OoIl|]+)',  # 비콘: 001 또는 비콕: 001
+    r'비[콘콕]([0-9OoIl|]+)',  # 비콘001 또는 비콕001
+    r'\S+\s+비[콘콕]\s+([0-9OoIl|]+)',  # 공종 비콘 0281 (OCR 오류 포함)
+    r'비[콘콕]\s+\S+\s+([0-9OoIl|]+)',  # 비콘 공종 0293 (OCR 오류 포함)
+    # 더 유연한 패턴
+    r'비[콘콕콘]\s+([0-9OoIl|]+)',  # 비콘 001 (다양한 변형)
+    r'비[콘콕콘]\s*[:：]?\s*([0-9OoIl|]+)',  # 비콘: 001
+    r'비[콘콕콘]([0-9OoIl|]+)',  # 비콘001
+    r'\S+\s+비[콘콕콘]\s+([0-9OoIl|]+)',  # 공종 비콘 0281 (유연한 변형)
+    r'비[콘콕콘]\s+\S+\s+([0-9OoIl|]+)',  # 비콘 공종 0293 (유연한 변형)
+))
 
 def extract_minor_from_filename(filename):
     """
@@ -58,61 +182,52 @@ def extract_minor_from_filename(filename):
     - 8자리: 8자리 숫자 (예: 51104130)
     """
     # 확장자 제거
-    name_without_ext = re.sub(r'\.(jpg|jpeg|png|JPG|JPEG|PNG)$', '', filename)
+    name_without_ext = FILENAME_EXT_RE.sub('', filename)
     
     # 우선순위 1: 우측에서 9자리 날짜 패턴 제거 (25로 시작하는 9자리)
     # 예: 251104130, 251104077, 251104125
-    match = re.search(r'^(.+?)(25\d{7})$', name_without_ext)
+    match = FILENAME_DATE9_RE.search(name_without_ext)
     if match:
-        prefix = match.group(1)  # 날짜 제거 후 나머지
-        # "설치" 다음의 숫자 추출
-        install_match = re.search(r'설치(\d+)', prefix)
-        if install_match:
-            return install_match.group(1)
-        # "설치"가 없으면 마지막 숫자 추출
-        numbers = re.findall(r'\d+', prefix)
-        if numbers:
-            return numbers[-1]
+        minor = minor_from_filename_prefix(match.group(1))  # 날짜 제거 후 나머지
+        if minor:
+            return minor
     
     # 우선순위 2: 우측에서 8자리 날짜 패턴 제거
     # 예: 51104130, 1104120
-    match = re.search(r'^(.+?)(\d{8})$', name_without_ext)
-    if match:
-        prefix = match.group(1)
-        date = match.group(2)
-        # 날짜가 25로 시작하지 않는 경우만 (25로 시작하면 9자리 패턴에서 처리됨)
-        if not date.startswith('25'):
-            # "설치" 다음의 숫자 추출
-            install_match = re.search(r'설치(\d+)', prefix)
-            if install_match:
-                return install_match.group(1)
-            # "설치"가 없으면 마지막 숫자 추출
-            numbers = re.findall(r'\d+', prefix)
-            if numbers:
-                return numbers[-1]
+    match = FILENAME_DATE8_RE.search(name_without_ext)
+    # 날짜가 25로 시작하지 않는 경우만 (25로 시작하면 9자리 패턴에서 처리됨)
+    if match and not match.group(2).startswith('25'):
+        minor = minor_from_filename_prefix(match.group(1))
+        if minor:
+            return minor
     
     # 우선순위 3: 우측에서 6자리 이상 숫자 패턴 제거 (날짜로 추정)
     # 예: 251104, 51104130
-    match = re.search(r'^(.+?)(\d{6,})$', name_without_ext)
+    match = FILENAME_DATE6_RE.search(name_without_ext)
     if match:
-        prefix = match.group(1)
-        # "설치" 다음의 숫자 추출
-        install_match = re.search(r'설치(\d+)', prefix)
-        if install_match:
-            return install_match.group(1)
-        # "설치"가 없으면 마지막 숫자 추출
-        numbers = re.findall(r'\d+', prefix)
-        if numbers:
-            return numbers[-1]
+        minor = minor_from_filename_prefix(match.group(1))
+        if minor:
+            return minor
     
     return None
 
+def minor_from_filename_prefix(prefix):
+    """날짜를 제거한 파일명에서 "설치" 다음의 숫자, 없으면 마지막 숫자 반환"""
+    install_match = FILENAME_INSTALL_RE.search(prefix)
+    if install_match:
+        return install_match.group(1)
+    numbers = DIGITS_RE.findall(prefix)
+    if numbers:
+        return numbers[-1]
+    return None
+
 def preprocess_image(image_path):
     """
     OCR 정확도를 높이기 위한 이미지 전처리
+    반환: 전처리된 그레이스케일 numpy 배열 (전처리를 못 하면 원본 경로 문자열)
     
     처리 내용:
-    1. 그레이스케일 변환
+    1. 그레이스케일로 읽기 (긴 변 OCR_MAX_SIDE 이하로 축소)
     2. 대비 향상 (CLAHE)
     3. 노이즈 제거
     4. 이진화 (OTSU)
@@ -122,13 +237,16 @@ def preprocess_image(image_path):
         return str(image_path)
     
     try:
-        # 이미지 읽기
-        img = cv2.imread(str(image_path))
-        if img is None:
+        # 그레이스케일로 바로 디코딩 (BGR 3채널 디코딩 + 변환 생략)
+        # imdecode + np.fromfile은 한글 경로도 읽을 수 있음 (Windows의 cv2.imread는 실패)
+        gray = cv2.imdecode(np.fromfile(str(image_path), dtype=np.uint8), cv2.IMREAD_GRAYSCALE)
+        if gray is None:
             return str(image_path)
         
-        # 그레이스케일 변환
-        gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+        # 긴 변이 OCR_MAX_SIDE보다 크면 축소 (Minor 라벨은 크게 찍혀 있어 인식에 지장 없음, 이후 연산량도 감소)
+        scale = OCR_MAX_SIDE / max(gray.shape[:2])
+        if scale < 1:
+            gray = cv2.resize(gray, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
         
         # CLAHE (Contrast Limited Adaptive Histogram Equalization)로 대비 향상
         clahe = cv2.createCLAHE(clipLimit=2.0, tileGridSize=(8, 8))
@@ -144,11 +262,8 @@ def preprocess_image(image_path):
         kernel = np.ones((2, 2), np.uint8)
         processed = cv2.morphologyEx(binary, cv2.MORPH_CLOSE, kernel)
         
-        # 임시 파일로 저장
-        temp_path = image_path.parent / f"_temp_{image_path.name}"
-        cv2.imwrite(str(temp_path), processed)
-        
-        return str(temp_path)
+        # 임시 파일 없이 배열 그대로 반환 (EasyOCR은 numpy 배열을 바로 입력으로 받음)
+        return processed
     except Exception as e:
         # 전처리 실패시 원본 이미지 사용
         return str(image_path)
@@ -165,18 +280,13 @@ def normalize_four_digit_minor(value_str):
     if not value_str:
         return None
     
-    # 일반적인 OCR 오류 패턴 수정
-    # O, o -> 0
-    value_str = value_str.replace('O', '0').replace('o', '0')
-    # I, l, | -> 1 (문맥에 따라 다를 수 있음)
-    # S -> 5
-    # Z -> 2
-    # 하지만 너무 공격적으로 바꾸면 오히려 문제가 될 수 있으므로 신중하게
+    # 일반적인 OCR 오류 패턴 수정 (OCR_DIGIT_FIX 참고, 한 번에 변환)
+    value_str = value_str.translate(OCR_DIGIT_FIX)
     
-    # 숫자만 추출
-    numbers = re.findall(r'\d+', value_str)
-    if numbers:
-        num_str = numbers[0]
+    # 숫자만 추출 (첫 번째 숫자 묶음)
+    number_match = DIGITS_RE.search(value_str)
+    if number_match:
+        num_str = number_match.group()
         # 4자리로 패딩하여 반환 (그대로 사용)
         if len(num_str) >= 4:
             # 4자리 이상이면 앞 4자리만 사용
@@ -187,6 +297,25 @@ def normalize_four_digit_minor(value_str):
     
     return None
 
+def first_valid_minor(patterns, text):
+    """패턴 목록을 우선순위대로 적용하여 각 패턴의 첫 매치가 "0000"이 아닌 Minor 값 반환"""
+    for pattern in patterns:
+        match = pattern.search(text)
+        if match:
+            result = normalize_four_digit_minor(match.group(1))
+            if result and result != "0000":
+                return result
+    return None
+
+def first_beacon_minor(patterns, text):
+    """
+    '비콘' 패턴 목록을 우선순위대로 적용하여 첫 매치가 "0000"이 아닌 Minor 값 반환
+    모든 패턴에 '비' 또는 '콘' 글자가 들어가므로, 둘 다 없는 텍스트는 정규식 없이 바로 건너뜀
+    """
+    if '비' not in text and '콘' not in text:
+        return None
+    return first_valid_minor(patterns, text)
+
 def extract_minor_value(image_path):
     """
     이미지에서 Minor 값을 추출합니다. (개선된 OCR 정밀도)
@@ -232,15 +361,17 @@ def extract_minor_value(image_path):
         except:
             img_width, img_height = 0, 0
         
-        # 이미지 전처리 적용
-        processed_image_path = preprocess_image(image_path)
+        # 이미지 전처리 적용 (축소된 경우 bbox 좌표도 전처리된 이미지 기준)
+        processed_image = preprocess_image(image_path)
+        if not isinstance(processed_image, str):
+            img_height, img_width = processed_image.shape[:2]
         
         # OCR 수행 (최적화된 파라미터 사용 - 더 많은 텍스트 감지)
         # detail=1: 바운딩 박스와 신뢰도 정보 포함
         # text_threshold: 텍스트 감지 임계값 (낮을수록 더 많은 텍스트 감지)
         # contrast_ths: 대비 임계값
-        results = reader.readtext(
-            processed_image_path,
+        results = get_reader().readtext(
+            processed_image,
             detail=1,
             paragraph=False,
             text_threshold=0.5,  # 더 낮춰서 더 많은 텍스트 감지 (특히 숫자)
@@ -250,23 +381,12 @@ def extract_minor_value(image_path):
             height_ths=0.4,     # 텍스트 높이 임계값 (더 낮게)
         )
         
-        # 전처리된 임시 파일 삭제
-        if USE_IMAGE_PREPROCESSING and processed_image_path != str(image_path):
-            try:
-                temp_path = Path(processed_image_path)
-                if temp_path.exists():
-                    temp_path.unlink()
-            except:
-                pass
-        
         # 신뢰도 기반으로 텍스트 필터링 및 정렬
         # 신뢰도가 높은 텍스트를 우선 사용 (임계값을 낮춰서 더 많은 텍스트 포함)
-        filtered_results = []
-        for result in results:
-            if len(result) >= 3:  # (bbox, text, confidence) 형식
-                confidence = result[2]
-                if confidence >= 0.2:  # 신뢰도 20% 이상 사용 (더 낮게 설정하여 숫자도 포함)
-                    filtered_results.append(result)
+        # 결과는 (bbox, text, confidence) 형식 - 신뢰도만 배열로 모아 한 번에 비교
+        confidences = np.fromiter((result[2] for result in results), dtype=np.float64, count=len(results))
+        kept_indices = np.flatnonzero(confidences >= 0.2)  # 신뢰도 20% 이상 사용 (더 낮게 설정하여 숫자도 포함)
+        filtered_results = [results[i] for i in kept_indices]
         
         # 좌측 하단 영역 정의 (이미지의 하단 30%, 좌측 60% - 박스 영역에 맞게 더 넓게 조정)
         if img_width > 0 and img_height > 0 and filtered_results:
@@ -336,24 +456,20 @@ def extract_minor_value(image_path):
                             if distance <= max_distance:
                                 # "비콘"과 숫자를 조합하여 패턴 매칭 시도
                                 combined_text = f"{beacon_text} {num_text}"
-                                for pattern in beacon_patterns_four_digit:
-                                    matches = re.findall(pattern, combined_text)
-                                    if matches:
-                                        value_str = matches[0]
-                                        result = normalize_four_digit_minor(value_str)
-                                        if result and result != "0000":
-                                            return result
+                                result = first_beacon_minor(BEACON_FOUR_DIGIT_PATTERNS, combined_text)
+                                if result:
+                                    return result
         else:
             bottom_left_text = ""
         
-        # 신뢰도 순으로 정렬 (높은 것부터)
-        filtered_results.sort(key=lambda x: x[2] if len(x) >= 3 else 0, reverse=True)
+        # 신뢰도 순으로 정렬 (높은 것부터, 같은 신뢰도는 원래 순서 유지)
+        sorted_indices = kept_indices[np.argsort(-confidences[kept_indices], kind='stable')]
         
         # 모든 텍스트를 하나의 문자열로 합치기 (신뢰도 높은 순서)
-        full_text = ' '.join([result[1] for result in filtered_results])
+        full_text = ' '.join([results[i][1] for i in sorted_indices])
         
         # 신뢰도가 높은 텍스트만 별도로 추출
-        high_confidence_text = ' '.join([result[1] for result in filtered_results if len(result) >= 3 and result[2] >= 0.5])
+        high_confidence_text = ' '.join([results[i][1] for i in sorted_indices if confidences[i] >= 0.5])
         
         # 검색할 텍스트 목록 (좌측 하단 영역 우선, 그 다음 신뢰도 높은 텍스트, 마지막 전체 텍스트)
         search_texts = []
@@ -366,49 +482,15 @@ def extract_minor_value(image_path):
         # ===== 우선순위 1: '비콘' 옆에 숫자 4자리 패턴 =====
         # 다양한 OCR 오류 패턴 고려 (비콘, 비콕, 비콘, 비콕 등)
         # "공종 비콘 0293" 같은 형식도 인식하도록 유연한 패턴 추가
-        beacon_patterns_four_digit = [
-            # 정확한 '비콘' 패턴 (직접 인접) - 최우선
-            r'비콘\s+([0-9OoIl|]{4})',  # 비콘 0019 (가장 일반적인 형식)
-            r'비콘\s*[:：]?\s*([0-9OoIl|]{4})',  # 비콘: 0019
-            r'비콘\s*[:\s]*([0-9OoIl|]{4})',  # 비콘: 0019 또는 비콘 0019 (더 유연한 공백 처리)
-            r'비콘([0-9OoIl|]{4})',  # 비콘0019 (공백 없음)
-            r'([0-9OoIl|]{4})\s*비콘',  # 0019 비콘 (순서 반대)
-            # '비콘' 앞에 단어가 있는 경우 (예: "공종 비콘 0281") - 중요!
-            r'\S+\s+비콘\s+([0-9OoIl|]{4})',  # 공종 비콘 0281 또는 XXX 비콘 0281
-            r'\S+\s+비콘\s*[:：]?\s*([0-9OoIl|]{4})',  # 공종 비콘: 0281
-            r'\S+\s+비콘\s*[:\s]*([0-9OoIl|]{4})',  # 공종 비콘: 0281 (더 유연한 공백 처리)
-            # '비콘'과 숫자 사이에 다른 단어가 있는 경우 (예: "비콘 공종 0293")
-            r'비콘\s+\S+\s+([0-9OoIl|]{4})',  # 비콘 공종 0293 또는 비콘 XXX 0293
-            # OCR 오류 패턴 (비콕 등)
-            r'비[콘콕]\s+([0-9OoIl|]{4})',  # 비콘 0019 또는 비콕 0019
-            r'비[콘콕]\s*[:：]?\s*([0-9OoIl|]{4})',  # 비콘: 0019 또는 비콕: 0019
-            r'비[콘콕]\s*[:\s]*([0-9OoIl|]{4})',  # 비콘: 0019 (더 유연한 공백 처리)
-            r'비[콘콕]([0-9OoIl|]{4})',  # 비콘0019 또는 비콕0019
-            r'([0-9OoIl|]{4})\s*비[콘콕]',  # 0019 비콘 또는 0019 비콕
-            r'\S+\s+비[콘콕]\s+([0-9OoIl|]{4})',  # 공종 비콘 0281 (OCR 오류 포함)
-            r'비[콘콕]\s+\S+\s+([0-9OoIl|]{4})',  # 비콘 공종 0293 (OCR 오류 포함)
-            # 더 유연한 패턴 (한 글자 오류 허용)
-            r'비[콘콕콘]\s+([0-9OoIl|]{4})',  # 비콘 0019 (다양한 변형)
-            r'비[콘콕콘]\s*[:：]?\s*([0-9OoIl|]{4})',  # 비콘: 0019
-            r'비[콘콕콘]\s*[:\s]*([0-9OoIl|]{4})',  # 비콘: 0019 (더 유연한 공백 처리)
-            r'비[콘콕콘]([0-9OoIl|]{4})',  # 비콘0019
-            r'\S+\s+비[콘콕콘]\s+([0-9OoIl|]{4})',  # 공종 비콘 0281 (유연한 변형)
-            r'비[콘콕콘]\s+\S+\s+([0-9OoIl|]{4})',  # 비콘 공종 0293 (유연한 변형)
-        ]
-        
         # 좌측 하단 영역에서 먼저 검색 (우선순위 최고)
         if bottom_left_text:
             # 좌측 하단 영역 텍스트를 디버깅용으로 출력 (선택적)
             # print(f"  [DEBUG] 좌측 하단 텍스트: {bottom_left_text[:100]}")
             
             # 4자리 숫자 패턴 우선 검색
-            for pattern in beacon_patterns_four_digit:
-                matches = re.findall(pattern, bottom_left_text)
-                if matches:
-                    value_str = matches[0]
-                    result = normalize_four_digit_minor(value_str)
-                    if result and result != "0000":
-                        return result
+            result = first_beacon_minor(BEACON_FOUR_DIGIT_PATTERNS, bottom_left_text)
+            if result:
+                return result
             
             # 좌측 하단 영역에서 "비콘"과 숫자가 분리되어 있는 경우 직접 찾기
             # "비콘" 텍스트와 4자리 숫자를 각각 찾아서 조합
@@ -436,129 +518,33 @@ def extract_minor_value(image_path):
         for search_text in search_texts:
             if search_text == bottom_left_text:
                 continue  # 이미 검색했으므로 스킵
-            for pattern in beacon_patterns_four_digit:
-                matches = re.findall(pattern, search_text)
-                if matches:
-                    value_str = matches[0]
-                    result = normalize_four_digit_minor(value_str)
-                    if result and result != "0000":
-                        return result
+            result = first_beacon_minor(BEACON_FOUR_DIGIT_PATTERNS, search_text)
+            if result:
+                return result
         
         # 비콘 패턴 (4자리 미만도 시도 - 4자리로 패딩)
-        beacon_patterns_flexible = [
-            # 정확한 '비콘' 패턴 (직접 인접) - 최우선
-            r'비콘\s+([0-9OoIl|]+)',  # 비콘 001 (가장 일반적인 형식)
-            r'비콘\s*[:：]?\s*([0-9OoIl|]+)',  # 비콘: 001
-            r'비콘([0-9OoIl|]+)',  # 비콘001
-            # '비콘' 앞에 단어가 있는 경우 (예: "공종 비콘 0281") - 중요!
-            r'\S+\s+비콘\s+([0-9OoIl|]+)',  # 공종 비콘 0281 또는 XXX 비콘 0281
-            r'\S+\s+비콘\s*[:：]?\s*([0-9OoIl|]+)',  # 공종 비콘: 0281
-            # '비콘'과 숫자 사이에 다른 단어가 있는 경우 (예: "비콘 공종 0293")
-            r'비콘\s+\S+\s+([0-9OoIl|]+)',  # 비콘 공종 0293 또는 비콘 XXX 0293
-            # OCR 오류 패턴
-            r'비[콘콕]\s+([0-9OoIl|]+)',  # 비콘 001 또는 비콕 001
-            r'비[콘콕]\s*[:：]?\s*([0-9OoIl|]+)',  # 비콘: 001 또는 비콕: 001
-            r'비[콘콕]([0-9OoIl|]+)',  # 비콘001 또는 비콕001
-            r'\S+\s+비[콘콕]\s+([0-9OoIl|]+)',  # 공종 비콘 0281 (OCR 오류 포함)
-            r'비[콘콕]\s+\S+\s+([0-9OoIl|]+)',  # 비콘 공종 0293 (OCR 오류 포함)
-            # 더 유연한 패턴
-            r'비[콘콕콘]\s+([0-9OoIl|]+)',  # 비콘 001 (다양한 변형)
-            r'비[콘콕콘]\s*[:：]?\s*([0-9OoIl|]+)',  # 비콘: 001
-            r'비[콘콕콘]([0-9OoIl|]+)',  # 비콘001
-            r'\S+\s+비[콘콕콘]\s+([0-9OoIl|]+)',  # 공종 비콘 0281 (유연한 변형)
-            r'비[콘콕콘]\s+\S+\s+([0-9OoIl|]+)',  # 비콘 공종 0293 (유연한 변형)
-        ]
-        
         # 좌측 하단 영역에서 먼저 검색 (우선순위 최고)
         if bottom_left_text:
-            for pattern in beacon_patterns_flexible:
-                matches = re.findall(pattern, bottom_left_text)
-                if matches:
-                    value_str = matches[0]
-                    result = normalize_four_digit_minor(value_str)
-                    if result and result != "0000":
-                        return result
+            result = first_beacon_minor(BEACON_FLEXIBLE_PATTERNS, bottom_left_text)
+            if result:
+                return result
         
         # 전체 텍스트에서도 검색
         for search_text in search_texts:
             if search_text == bottom_left_text:
                 continue  # 이미 검색했으므로 스킵
-            for pattern in beacon_patterns_flexible:
-                matches = re.findall(pattern, search_text)
-                if matches:
-                    value_str = matches[0]
-                    result = normalize_four_digit_minor(value_str)
-                    if result and result != "0000":
-                        return result
-        
-        # ===== 우선순위 2: '설치' 옆에 숫자 4자리 패턴 =====
-        install_patterns_four_digit = [
-            r'설치\s*[:：]?\s*([0-9OoIl|]{4})',  # 설치: 0019 (4자리)
-            r'설치\s+([0-9OoIl|]{4})',  # 설치 0019
-            r'설치([0-9OoIl|]{4})',  # 설치0019 (공백 없음)
-            r'([0-9OoIl|]{4})\s*설치',  # 0019 설치 (순서 반대)
-        ]
-        
-        for search_text in search_texts:
-            for pattern in install_patterns_four_digit:
-                matches = re.findall(pattern, search_text)
-                if matches:
-                    value_str = matches[0]
-                    result = normalize_four_digit_minor(value_str)
-                    if result and result != "0000":
-                        return result
-        
-        # 설치 패턴 (4자리 미만도 시도 - 4자리로 패딩)
-        install_patterns_flexible = [
-            r'설치\s*(\d{1,3})(?=25\d{4,})',  # 설치10251104 (날짜 패턴)
-            r'설치\s*(\d{1,3})(?=\d{6})',    # 설치 + 숫자 + 6자리 이상
-            r'설치\s*[:：]?\s*(\d{1,4})',    # 설치: 10 또는 설치: 0019
-            r'설치\s*[:：]?\s*([0-9OoIl|]{1,4})',  # 설치: OO19 (OCR 오류 포함)
-            r'설치\s+([0-9OoIl|]+)',  # 설치 001
-            r'설치([0-9OoIl|]+)',  # 설치001
-        ]
-        
-        for search_text in search_texts:
-            for pattern in install_patterns_flexible:
-                matches = re.findall(pattern, search_text)
-                if matches:
-                    digit_str = matches[0]
-                    result = normalize_four_digit_minor(digit_str)
-                    if result and result != "0000":
-                        return result
-        
-        # ===== 우선순위 3: 'Minor' 영문 옆에 숫자 4자리 패턴 =====
-        minor_patterns_four_digit = [
-            r'(?:Minor|Mnor|Inor|Mior|Mmor|M1nor|M|nor|minor|mnor|inor|mior|mmor|m1nor)\s*[:：]?\s*([0-9OoIl|]{4})',  # Minor: 0019 (4자리)
-            r'(?:Minor|Mnor|Inor|minor|mnor|inor)\s+([0-9OoIl|]{4})',  # Minor 0019
-            r'(?:Minor|Mnor|Inor|minor|mnor|inor)([0-9OoIl|]{4})',  # Minor0019 (공백 없음)
-            r'([0-9OoIl|]{4})\s*(?:Minor|Mnor|Inor)',  # 0019 Minor (순서 반대)
-        ]
-        
-        for search_text in search_texts:
-            for pattern in minor_patterns_four_digit:
-                matches = re.findall(pattern, search_text, re.IGNORECASE)
-                if matches:
-                    value_str = matches[0]
-                    result = normalize_four_digit_minor(value_str)
-                    if result and result != "0000":
-                        return result
-        
-        # Minor 패턴 (4자리 미만도 시도 - 4자리로 패딩)
-        minor_patterns_flexible = [
-            r'(?:Minor|Mnor|Inor|Mior|Mmor|M1nor|minor|mnor|inor|mior|mmor|m1nor)\s*[:：]?\s*([0-9OoIl|]+)',  # Minor: 001
-            r'(?:Minor|Mnor|Inor|minor|mnor|inor)\s+([0-9OoIl|]+)',  # Minor 001
-            r'(?:Minor|Mnor|Inor|minor|mnor|inor)([0-9OoIl|]+)',  # Minor001 (공백 없음)
-        ]
-        
-        for search_text in search_texts:
-            for pattern in minor_patterns_flexible:
-                matches = re.findall(pattern, search_text, re.IGNORECASE)
-                if matches:
-                    value_str = matches[0]
-                    result = normalize_four_digit_minor(value_str)
-                    if result and result != "0000":
-                        return result
+            result = first_beacon_minor(BEACON_FLEXIBLE_PATTERNS, search_text)
+            if result:
+                return result
+        
+        # ===== 우선순위 2: '설치' 옆에 숫자 4자리 패턴 (4자리 미만도 시도 - 4자리로 패딩) =====
+        # ===== 우선순위 3: 'Minor' 영문 옆에 숫자 4자리 패턴 (4자리 미만도 시도 - 4자리로 패딩) =====
+        for patterns in (INSTALL_FOUR_DIGIT_PATTERNS, INSTALL_FLEXIBLE_PATTERNS,
+                         MINOR_FOUR_DIGIT_PATTERNS, MINOR_FLEXIBLE_PATTERNS):
+            for search_text in search_texts:
+                result = first_valid_minor(patterns, search_text)
+                if result:
+                    return result
         
         return None
     except Exception as e:
@@ -583,6 +569,25 @@ def format_time(seconds):
         minutes = int((seconds % 3600) // 60)
         return f"{hours}시간 {minutes}분"
 
+def fast_copy(src, dst):
+    """
+    파일을 output으로 복사 (기본은 shutil.copy2)
+    - USE_HARDLINKS(ORGANIZE_HARDLINK=1)이면 하드링크로 생성 (데이터 복사 없이 메타데이터만 생성)
+      다른 디스크이거나 하드링크를 지원하지 않으면(또는 대상이 이미 있으면) 복사로 대체
+    - 주의: 하드링크는 원본과 같은 데이터를 가리키므로 source를 지워도 output 파일은 남지만,
+      어느 한쪽을 제자리에서 수정하면(회전, 보정 등) 다른 쪽도 함께 바뀜
+    """
+    if USE_HARDLINKS:
+        try:
+            os.link(src, dst)
+            return
+        except OSError:
+            pass
+    try:
+        shutil.copy2(src, dst)
+    except shutil.SameFileError:
+        pass  # 이전 실행에서 이미 같은 파일로 하드링크됨
+
 def organize_files():
     """
     [단계 1] source 폴더의 이미지들을 파일명 규칙으로만 분류합니다.
@@ -612,11 +617,15 @@ def organize_files():
     unknown_folder = OUTPUT_DIR / "Unknown"
     unknown_existing_files = set()
     if unknown_folder.exists():
-        unknown_existing_files = {f.name for f in unknown_folder.iterdir() if f.is_file()}
+        with os.scandir(unknown_folder) as entries:
+            unknown_existing_files = {entry.name for entry in entries if entry.is_file()}
     
-    image_extensions = {'.jpg', '.jpeg', '.png', '.JPG', '.JPEG', '.PNG'}
-    image_files = sorted([f for f in SOURCE_DIR.iterdir() 
-                         if f.suffix in image_extensions and f.name not in unknown_existing_files])
+    # os.scandir로 한 번만 읽고 캐시된 파일 타입 사용 (항목마다 stat 호출 없음), Path는 통과한 파일만 생성
+    with os.scandir(SOURCE_DIR) as entries:
+        image_files = [Path(entry.path) for entry in entries
+                       if entry.is_file() and os.path.splitext(entry.name)[1].lower() in IMAGE_EXTENSIONS
+                       and entry.name not in unknown_existing_files]
+    image_files.sort(key=lambda f: f.name)
     
     if unknown_existing_files:
         print(f"ℹ️  Unknown 폴더에 이미 {len(unknown_existing_files)}개 파일이 있습니다. (건너뜀)")
@@ -643,22 +652,6 @@ def organize_files():
     unknown_files = []
     
     for idx, file_path in enumerate(image_files, 1):
-        file_start_time = time.time()
-        
-        # 진행률 표시
-        progress_bar = print_progress_bar(idx, total_files)
-        elapsed_time = time.time() - start_time
-        avg_time_per_file = elapsed_time / idx if idx > 0 else 0
-        remaining_files = total_files - idx
-        estimated_remaining_time = avg_time_per_file * remaining_files
-        
-        # 통계 정보 출력 (매 N개마다 또는 마지막 파일일 때)
-        if idx % stats_update_interval == 0 or idx == total_files:
-            print(f"\r{progress_bar} [{idx}/{total_files}] "
-                  f"파일명 분석 중: {file_path.name[:50]:<50} "
-                  f"| 경과: {format_time(elapsed_time)} "
-                  f"| 예상 남은 시간: {format_time(estimated_remaining_time)}", end="")
-        
         # 파일명에서만 Minor 값 추출 (OCR 없이)
         filename_minor = extract_minor_from_filename(file_path.name)
         
@@ -672,9 +665,9 @@ def organize_files():
                 target_folder = OUTPUT_DIR / f"Minor_{minor_value}"
                 target_folder.mkdir(exist_ok=True)
                 
-                # 파일 복사
+                # 파일 복사 (ORGANIZE_HARDLINK=1 이면 하드링크)
                 target_path = target_folder / file_path.name
-                shutil.copy2(file_path, target_path)
+                fast_copy(file_path, target_path)
                 
                 # 통계
                 if minor_value not in minor_counts:
@@ -688,6 +681,17 @@ def organize_files():
         else:
             # 파일명에서 추출 실패 또는 5자리 이상 -> Unknown으로
             unknown_files.append(file_path)
+        
+        # 통계 정보 출력 (매 N개마다 또는 마지막 파일일 때만, 처리 후 한 줄로 기록)
+        if idx % stats_update_interval == 0 or idx == total_files:
+            progress_bar = print_progress_bar(idx, total_files)
+            elapsed_time = time.time() - start_time
+            estimated_remaining_time = elapsed_time / idx * (total_files - idx)
+            sys.stdout.write(f"\r{progress_bar} [{idx}/{total_files}] "
+                             f"파일명 분석: {file_path.name[:50]:<50} "
+                             f"| 경과: {format_time(elapsed_time)} "
+                             f"| 예상 남은 시간: {format_time(estimated_remaining_time)}")
+            sys.stdout.flush()
     
     print(f"\n✓ 파일명 분류 완료: {processed}개 성공, {len(unknown_files)}개 Unknown")
     
@@ -708,7 +712,7 @@ def organize_files():
                     new_name = f"{base_name}_dup{counter}{extension}"
                     target_path = unknown_folder / new_name
                     counter += 1
-            shutil.copy2(file_path, target_path)
+            fast_copy(file_path, target_path)
         
         print(f"✓ Unknown 폴더로 이동 완료")
         print(f"  ℹ️  다음 단계(recheck_unknown.py)에서 OCR로 처리됩니다.")
@@ -8,35 +8,196 @@ Unknown 폴더의 이미지들을 재검사하여 Minor 값을 다시 확인하
 """
 import os
 import re
+import json
+import hashlib
 import shutil
+import sys
 import time
+import multiprocessing
+import importlib.util
 from pathlib import Path
 from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from PIL import Image as PILImage
 
 try:
-    import easyocr
     import cv2
-    import numpy as np
-    from PIL import Image as PILImage
-    USE_EASYOCR = True
     USE_IMAGE_PREPROCESSING = True
-    print("EasyOCR과 이미지 전처리를 사용합니다...")
-    reader = easyocr.Reader(['ko', 'en'], gpu=False)
-except ImportError as e:
-    if 'easyocr' in str(e):
+except ImportError:
+    print("Warning: opencv-python이 설치되지 않았습니다. 이미지 전처리 기능이 제한됩니다.")
+    print("설치: pip3 install opencv-python")
+    USE_IMAGE_PREPROCESSING = False
+
+# orjson이 있으면 OCR 캐시 읽기/쓰기에 사용 (없으면 표준 json)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# EasyOCR Reader는 모델 로드에 수 초가 걸리므로 OCR이 실제로 필요할 때 get_reader()에서 생성
+# (easyocr/torch import도 그때까지 미룸 - 파일명으로 모두 분류되면 로드하지 않음)
+reader = None
+
+def gpu_available():
+    """CUDA 또는 Apple MPS GPU 사용 가능 여부"""
+    try:
+        import torch
+    except ImportError:
+        return False
+    return torch.cuda.is_available() or torch.backends.mps.is_available()
+
+def check_easyocr_installed():
+    """easyocr/torch 설치 여부를 import 없이 확인하고, 없으면 안내 후 종료 (OCR 프로세스 풀 시작 전 확인용)"""
+    if importlib.util.find_spec('easyocr') is None or importlib.util.find_spec('torch') is None:
         print("Error: easyocr이 설치되지 않았습니다.")
         print("설치: pip3 install easyocr")
         exit(1)
-    elif 'cv2' in str(e):
-        print("Warning: opencv-python이 설치되지 않았습니다. 이미지 전처리 기능이 제한됩니다.")
-        print("설치: pip3 install opencv-python")
-        USE_IMAGE_PREPROCESSING = False
-    else:
-        USE_IMAGE_PREPROCESSING = False
+
+def get_reader():
+    """EasyOCR Reader를 처음 호출될 때 한 번만 생성하여 반환"""
+    global reader
+    if reader is None:
+        try:
+            import easyocr
+            import torch
+        except ImportError:
+            print("Error: easyocr이 설치되지 않았습니다.")
+            print("설치: pip3 install easyocr")
+            exit(1)
+        # GPU가 있으면 GPU로 OCR (CPU에서는 INT8 양자화 인식 모델 사용, quantize=True는 EasyOCR 기본값이지만 명시)
+        use_gpu = gpu_available()
+        print(f"EasyOCR Reader를 로드합니다... ({'GPU' if use_gpu else 'CPU'})")
+        reader = easyocr.Reader(['ko', 'en'], gpu=use_gpu, quantize=True,
+                                cudnn_benchmark=torch.cuda.is_available())
+    return reader
 
 SOURCE_DIR = Path("source")
 OUTPUT_DIR = Path("output")
 UNKNOWN_DIR = OUTPUT_DIR / "Unknown"
+IMAGE_EXTENSIONS = frozenset({'.jpg', '.jpeg', '.png'})  # 소문자로 비교 (.JPG 등 대소문자 무관)
+# 파일별 OCR 결과 캐시 (파일명|크기|수정 시각 -> Minor 값 또는 null), 다시 실행할 때 같은 파일은 OCR 생략
+# 파일 형식: {"tag": OCR_CACHE_TAG, "entries": {키: 값}}
+OCR_CACHE_PATH = OUTPUT_DIR / ".ocr_cache.json"
+
+# OCR 파라미터 (좌측 하단 텍스트 인식률 향상을 위해 임계값을 낮춤)
+# detail=1: 바운딩 박스와 신뢰도 정보 포함
+# text_threshold: 텍스트 감지 임계값 (낮을수록 더 많은 텍스트 감지, 특히 숫자, 한글)
+# contrast_ths / adjust_contrast: 대비가 낮은 텍스트도 감지하도록 자동 조정
+# width_ths / height_ths: 인접 텍스트 상자 병합 임계값
+# canvas_size: 텍스트 감지(CRAFT) 단계에서만 긴 변을 이 크기로 축소 (기본 2560, 연산량은 픽셀 수에 비례)
+#              글자 인식은 원본 해상도 그대로 하고 bbox도 원본 좌표로 돌려받음
+OCR_PARAMS = dict(
+    detail=1,
+    paragraph=False,
+    text_threshold=0.4,
+    contrast_ths=0.03,
+    adjust_contrast=0.2,
+    width_ths=0.3,
+    height_ths=0.3,
+    canvas_size=1280,
+)
+# OCR 캐시 구분용 지문: OCR_PARAMS나 OCR_CACHE_VERSION(Minor 추출 규칙을 바꾸면 올림)이 달라지면 이전 캐시는 무시됨
+OCR_CACHE_VERSION = 1
+OCR_CACHE_TAG = hashlib.sha1(repr((OCR_CACHE_VERSION, sorted(OCR_PARAMS.items()))).encode('utf-8')).hexdigest()
+# readtext_batched로 한 번에 OCR할 이미지 수 (같은 크기 이미지끼리만 묶임)
+# GPU 메모리에 맞게 환경 변수 OCR_BATCH_SIZE로 조정 가능
+OCR_BATCH_SIZE = max(1, int(os.environ.get("OCR_BATCH_SIZE", "8")))
+# CPU OCR 병렬 프로세스 수 (프로세스마다 Reader를 따로 로드하므로 메모리에 맞게 OCR_WORKERS로 조정)
+OCR_WORKERS = max(1, int(os.environ.get("OCR_WORKERS", str(min(4, os.cpu_count() or 1)))))
+
+# OCR 텍스트의 '설치' / 'Minor' 옆 3~4자리 숫자 패턴 (우선순위 순서, 모듈 로드 시 한 번만 컴파일)
+INSTALL_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r'설치\s*[:：]?\s*([0-9OoIl|]{3,4})',  # 설치: 307 또는 설치: 0307
+    r'설치\s+([0-9OoIl|]{3,4})',  # 설치 307
+    r'설치([0-9OoIl|]{3,4})',  # 설치307
+    r'([0-9OoIl|]{3,4})\s*설치',  # 307 설치
+))
+# Mnor, Inor 등 OCR 오인식 포함, 대소문자 무시
+MINOR_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'(?:Minor|Mnor|Inor)\s*[:：]?\s*([0-9OoIl|]{3,4})',  # Minor: 307
+    r'(?:Minor|Mnor|Inor)\s+([0-9OoIl|]{3,4})',  # Minor 307
+    r'(?:Minor|Mnor|Inor)([0-9OoIl|]{3,4})',  # Minor307
+))
+
+# 파일명 규칙 정규식 (파일마다 호출되므로 미리 컴파일)
+FILENAME_EXT_RE = re.compile(r'\.(?:jpe?g|png)$', re.IGNORECASE)
+FILENAME_DATE9_RE = re.compile(r'^(.+?)(25\d{7})$')
+FILENAME_DATE8_RE = re.compile(r'^(.+?)(\d{8})$')
+FILENAME_DATE6_RE = re.compile(r'^(.+?)(\d{6,})$')
+FILENAME_INSTALL_RE = re.compile(r'설치(\d+)')
+DIGITS_RE = re.compile(r'\d+')
+
+# OCR 숫자 오인식 보정표: O, o -> 0
+# I, l, | -> 1 / S -> 5 / Z -> 2 등은 문맥에 따라 다를 수 있어 너무 공격적으로 바꾸면
+# 오히려 문제가 될 수 있으므로 넣지 않음
+OCR_DIGIT_FIX = str.maketrans({'O': '0', 'o': '0'})
+
+# OCR 텍스트의 '비콘' 옆 숫자 패턴 (우선순위 순서, 모듈 로드 시 한 번만 컴파일)
+BEACON_FOUR_DIGIT_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    # 정확한 '비콘' 패턴 (직접 인접) - 최우선
+    # 3자리 또는 4자리 숫자 모두 처리 (3자리는 4자리로 패딩)
+    # 한글 '비콘' 인식 실패를 대비해 더 유연한 패턴 추가
+    r'비콘\s+([0-9OoIl|]{3,4})',  # 비콘 307 또는 비콘 0307 (가장 일반적인 형식)
+    r'비콘\s*[:：]?\s*([0-9OoIl|]{3,4})',  # 비콘: 307 또는 비콘: 0307
+    r'비콘\s*[:\s]*([0-9OoIl|]{3,4})',  # 비콘: 307 또는 비콘 307 (더 유연한 공백 처리)
+    r'비콘([0-9OoIl|]{3,4})',  # 비콘307 또는 비콘0307 (공백 없음)
+    r'([0-9OoIl|]{3,4})\s*비콘',  # 307 비콘 또는 0307 비콘 (순서 반대)
+    # '비콘' 앞에 단어가 있는 경우 (예: "공종 비콘 307" 또는 "공종 비콘 0307") - 중요!
+    r'\S+\s+비콘\s+([0-9OoIl|]{3,4})',  # 공종 비콘 307 또는 공종 비콘 0307
+    r'\S+\s+비콘\s*[:：]?\s*([0-9OoIl|]{3,4})',  # 공종 비콘: 307 또는 공종 비콘: 0307
+    r'\S+\s+비콘\s*[:\s]*([0-9OoIl|]{3,4})',  # 공종 비콘: 307 (더 유연한 공백 처리)
+    # '비콘'과 숫자 사이에 다른 단어가 있는 경우 (예: "비콘 공종 307")
+    r'비콘\s+\S+\s+([0-9OoIl|]{3,4})',  # 비콘 공종 307 또는 비콘 공종 0307
+    # OCR 오류 패턴 (비콕 등) - 한글 인식 실패 대비
+    r'비[콘콕]\s+([0-9OoIl|]{3,4})',  # 비콘 307 또는 비콕 307
+    r'비[콘콕]\s*[:：]?\s*([0-9OoIl|]{3,4})',  # 비콘: 307 또는 비콕: 307
+    r'비[콘콕]\s*[:\s]*([0-9OoIl|]{3,4})',  # 비콘: 307 (더 유연한 공백 처리)
+    r'비[콘콕]([0-9OoIl|]{3,4})',  # 비콘307 또는 비콕307
+    r'([0-9OoIl|]{3,4})\s*비[콘콕]',  # 307 비콘 또는 307 비콕
+    r'\S+\s+비[콘콕]\s+([0-9OoIl|]{3,4})',  # 공종 비콘 307 (OCR 오류 포함)
+    r'비[콘콕]\s+\S+\s+([0-9OoIl|]{3,4})',  # 비콘 공종 307 (OCR 오류 포함)
+    # 더 유연한 패턴 (한 글자 오류 허용, 한글 인식 실패 대비)
+    r'비[콘콕콘]\s+([0-9OoIl|]{3,4})',  # 비콘 307 (다양한 변형)
+    r'비[콘콕콘]\s*[:：]?\s*([0-9OoIl|]{3,4})',  # 비콘: 307
+    r'비[콘콕콘]\s*[:\s]*([0-9OoIl|]{3,4})',  # 비콘: 307 (더 유연한 공백 처리)
+    r'비[콘콕콘]([0-9OoIl|]{3,4})',  # 비콘307
+    r'\S+\s+비[콘콕콘]\s+([0-9OoIl|]{3,4})',  # 공종 비콘 307 (유연한 변형)
+    r'비[콘콕콘]\s+\S+\s+([0-9OoIl|]{3,4})',  # 비콘 공종 307 (유연한 변형)
+    # 한글 '비'만 인식된 경우 (콘 인식 실패)
+    r'비\s+([0-9OoIl|]{3,4})',  # 비 307
+    r'비\s*[:：]?\s*([0-9OoIl|]{3,4})',  # 비: 307
+    r'\S+\s+비\s+([0-9OoIl|]{3,4})',  # 공종 비 307
+    # 한글 '콘'만 인식된 경우 (비 인식 실패)
+    r'콘\s+([0-9OoIl|]{3,4})',  # 콘 307
+    r'콘\s*[:：]?\s*([0-9OoIl|]{3,4})',  # 콘: 307
+    r'\S+\s+콘\s+([0-9OoIl|]{3,4})',  # 공종 콘 307
+))
+# 비콘 패턴 (4자리 미만도 시도 - 4자리로 패딩)
+BEACON_FLEXIBLE_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    # 정확한 '비콘' 패턴 (직접 인접) - 최우선
+    r'비콘\s+([0-9OoIl|]+)',  # 비콘 001 (가장 일반적인 형식)
+    r'비콘\s*[:：]?\s*([0-9OoIl|]+)',  # 비콘: 001
+    r'비콘([0-9OoIl|]+)',  # 비콘001
+    # '비콘' 앞에 단어가 있는 경우 (예: "공종 비콘 0281") - 중요!
+    r'\S+\s+비콘\s+([0-9OoIl|]+)',  # 공종 비콘 0281 또는 XXX 비콘 0281
+    r'\S+\s+비콘\s*[:：]?\s*([0-9OoIl|]+)',  # 공종 비콘: 0281
+    # '비콘'과 숫자 사이에 다른 단어가 있는 경우 (예: "비콘 공종 0293")
+    r'비콘\s+\S+\s+([0-9OoIl|]+)',  # 비콘 공종 0293 또는 비콘 XXX 0293
+    # OCR 오류 패턴
+    r'비[콘콕]\s+([0-9OoIl|]+)',  # 비콘 001 또는 비콕 001
+    r'비[콘콕]\s*[:：]?\s*([0-9OoIl|]+)',  # 비콘: 001 또는 비콕: 001
+    r'비[콘콕]([0-9OoIl|]+)',  # 비콘001 또는 비콕001
+    r'\S+\s+비[콘콕]\s+([0-9OoIl|]+)',  # 공종 비콘 0281 (OCR 오류 포함)
+    r'비[콘콕]\s+\S+\s+([0-9OoIl|]+)',  # 비콘 공종 0293 (OCR 오류 포함)
+    # 더 유연한 패턴
+    r'비[콘콕콘]\s+([0-9OoIl|]+)',  # 비콘 001 (다양한 변형)
+    r'비[콘콕콘]\s*[:：]?\s*([0-9OoIl|]+)',  # 비콘: 001
+    r'비[콘콕콘]([0-9OoIl|]+)',  # 비콘001
+    r'\S+\s+비[콘콕콘]\s+([0-9OoIl|]+)',  # 공종 비콘 0281 (유연한 변형)
+    r'비[콘콕콘]\s+\S+\s+([0-9OoIl|]+)',  # 비콘 공종 0293 (유연한 변형)
+))
 
 def extract_minor_from_filename(filename):
     """
@@ -58,55 +219,45 @@ def extract_minor_from_filename(filename):
     - 8자리: 8자리 숫자 (예: 51104130)
     """
     # 확장자 제거
-    name_without_ext = re.sub(r'\.(jpg|jpeg|png|JPG|JPEG|PNG)$', '', filename)
+    name_without_ext = FILENAME_EXT_RE.sub('', filename)
     
     # 우선순위 1: 우측에서 9자리 날짜 패턴 제거 (25로 시작하는 9자리)
     # 예: 251104130, 251104077, 251104125
-    match = re.search(r'^(.+?)(25\d{7})$', name_without_ext)
+    match = FILENAME_DATE9_RE.search(name_without_ext)
     if match:
-        prefix = match.group(1)  # 날짜 제거 후 나머지
-        # "설치" 다음의 숫자 추출
-        install_match = re.search(r'설치(\d+)', prefix)
-        if install_match:
-            return install_match.group(1)
-        # "설치"가 없으면 마지막 숫자 추출
-        numbers = re.findall(r'\d+', prefix)
-        if numbers:
-            return numbers[-1]
+        minor = minor_from_filename_prefix(match.group(1))  # 날짜 제거 후 나머지
+        if minor:
+            return minor
     
     # 우선순위 2: 우측에서 8자리 날짜 패턴 제거
     # 예: 51104130, 1104120
-    match = re.search(r'^(.+?)(\d{8})$', name_without_ext)
-    if match:
-        prefix = match.group(1)
-        date = match.group(2)
-        # 날짜가 25로 시작하지 않는 경우만 (25로 시작하면 9자리 패턴에서 처리됨)
-        if not date.startswith('25'):
-            # "설치" 다음의 숫자 추출
-            install_match = re.search(r'설치(\d+)', prefix)
-            if install_match:
-                return install_match.group(1)
-            # "설치"가 없으면 마지막 숫자 추출
-            numbers = re.findall(r'\d+', prefix)
-            if numbers:
-                return numbers[-1]
+    match = FILENAME_DATE8_RE.search(name_without_ext)
+    # 날짜가 25로 시작하지 않는 경우만 (25로 시작하면 9자리 패턴에서 처리됨)
+    if match and not match.group(2).startswith('25'):
+        minor = minor_from_filename_prefix(match.group(1))
+        if minor:
+            return minor
     
     # 우선순위 3: 우측에서 6자리 이상 숫자 패턴 제거 (날짜로 추정)
     # 예: 251104, 51104130
-    match = re.search(r'^(.+?)(\d{6,})$', name_without_ext)
+    match = FILENAME_DATE6_RE.search(name_without_ext)
     if match:
-        prefix = match.group(1)
-        # "설치" 다음의 숫자 추출
-        install_match = re.search(r'설치(\d+)', prefix)
-        if install_match:
-            return install_match.group(1)
-        # "설치"가 없으면 마지막 숫자 추출
-        numbers = re.findall(r'\d+', prefix)
-        if numbers:
-            return numbers[-1]
+        minor = minor_from_filename_prefix(match.group(1))
+        if minor:
+            return minor
     
     return None
 
+def minor_from_filename_prefix(prefix):
+    """날짜를 제거한 파일명에서 "설치" 다음의 숫자, 없으면 마지막 숫자 반환"""
+    install_match = FILENAME_INSTALL_RE.search(prefix)
+    if install_match:
+        return install_match.group(1)
+    numbers = DIGITS_RE.findall(prefix)
+    if numbers:
+        return numbers[-1]
+    return None
+
 def preprocess_image(image_path):
     """
     OCR 정확도를 높이기 위한 이미지 전처리
@@ -130,18 +281,13 @@ def normalize_four_digit_minor(value_str):
     if not value_str:
         return None
     
-    # 일반적인 OCR 오류 패턴 수정
-    # O, o -> 0
-    value_str = value_str.replace('O', '0').replace('o', '0')
-    # I, l, | -> 1 (문맥에 따라 다를 수 있음)
-    # S -> 5
-    # Z -> 2
-    # 하지만 너무 공격적으로 바꾸면 오히려 문제가 될 수 있으므로 신중하게
+    # 일반적인 OCR 오류 패턴 수정 (OCR_DIGIT_FIX 참고, 한 번에 변환)
+    value_str = value_str.translate(OCR_DIGIT_FIX)
     
-    # 숫자만 추출
-    numbers = re.findall(r'\d+', value_str)
-    if numbers:
-        num_str = numbers[0]
+    # 숫자만 추출 (첫 번째 숫자 묶음)
+    number_match = DIGITS_RE.search(value_str)
+    if number_match:
+        num_str = number_match.group()
         # 4자리로 패딩하여 반환 (그대로 사용)
         if len(num_str) >= 4:
             # 4자리 이상이면 앞 4자리만 사용
@@ -152,6 +298,25 @@ def normalize_four_digit_minor(value_str):
     
     return None
 
+def first_valid_minor(patterns, text):
+    """패턴 목록을 우선순위대로 적용하여 각 패턴의 첫 매치가 "0000"이 아닌 Minor 값 반환"""
+    for pattern in patterns:
+        match = pattern.search(text)
+        if match:
+            result = normalize_four_digit_minor(match.group(1))
+            if result and result != "0000":
+                return result
+    return None
+
+def first_beacon_minor(patterns, text):
+    """
+    '비콘' 패턴 목록을 우선순위대로 적용하여 첫 매치가 "0000"이 아닌 Minor 값 반환
+    모든 패턴에 '비' 또는 '콘' 글자가 들어가므로, 둘 다 없는 텍스트는 정규식 없이 바로 건너뜀
+    """
+    if '비' not in text and '콘' not in text:
+        return None
+    return first_valid_minor(patterns, text)
+
 def extract_minor_value(image_path):
     """
     이미지에서 Minor 값을 추출합니다. (개선된 OCR 정밀도)
@@ -196,349 +361,378 @@ def extract_minor_value(image_path):
             img_width, img_height = 0, 0
         
         # 이미지 전처리 적용
-        processed_image_path = preprocess_image(image_path)
+        processed_image = preprocess_image(image_path)
         
         # OCR 수행 (최적화된 파라미터 사용 - 더 많은 텍스트 감지)
-        # detail=1: 바운딩 박스와 신뢰도 정보 포함
-        # text_threshold: 텍스트 감지 임계값 (낮을수록 더 많은 텍스트 감지)
-        # contrast_ths: 대비 임계값
-        # 좌측 하단 텍스트 인식률 향상을 위해 파라미터를 더 낮춤
-        results = reader.readtext(
-            processed_image_path,
-            detail=1,
-            paragraph=False,
-            text_threshold=0.4,  # 더 낮춰서 더 많은 텍스트 감지 (특히 숫자, 한글)
-            contrast_ths=0.03,   # 대비가 낮은 텍스트도 감지 (더 낮게)
-            adjust_contrast=0.2, # 대비 자동 조정 (더 강하게)
-            width_ths=0.3,      # 텍스트 너비 임계값 (더 낮게)
-            height_ths=0.3,     # 텍스트 높이 임계값 (더 낮게)
-        )
+        results = get_reader().readtext(processed_image, **OCR_PARAMS)
         
-        # 전처리된 임시 파일 삭제
-        if USE_IMAGE_PREPROCESSING and processed_image_path != str(image_path):
-            try:
-                temp_path = Path(processed_image_path)
-                if temp_path.exists():
-                    temp_path.unlink()
-            except:
-                pass
+        return extract_minor_from_ocr_results(results, img_width, img_height)
+    except Exception as e:
+        print(f"  ❌ 오류 발생: {e}")
+        return None
+
+def extract_minor_from_ocr_results(results, img_width, img_height):
+    """
+    OCR 결과 [(bbox, text, confidence), ...]에서 Minor 값을 찾습니다.
+    img_width, img_height: bbox 좌표 기준 이미지 크기 (좌측 하단 영역 계산용, 모르면 0)
+    처리 중 오류는 호출한 쪽에서 처리 (일괄 OCR에서는 오류 난 이미지를 캐시하지 않기 위해)
+    """
+    # 신뢰도 기반으로 텍스트 필터링 및 정렬
+    # 신뢰도가 높은 텍스트를 우선 사용 (임계값을 낮춰서 더 많은 텍스트 포함)
+    # 결과는 (bbox, text, confidence) 형식 - 신뢰도만 배열로 모아 한 번에 비교
+    confidences = np.fromiter((result[2] for result in results), dtype=np.float64, count=len(results))
+    kept_indices = np.flatnonzero(confidences >= 0.15)  # 신뢰도 15% 이상 사용 (더 낮게 설정하여 한글, 숫자도 포함)
+    filtered_results = [results[i] for i in kept_indices]
+    
+    # 좌측 하단 흰색 영역 정의 (우선순위 최고)
+    # 이미지의 하단 40%, 좌측 60% - 흰색 박스 영역에 집중 (더 넓게)
+    if img_width > 0 and img_height > 0 and filtered_results:
+        # 좌측 하단 영역을 더 넓게 정의 (흰색 박스 영역)
+        bottom_threshold = img_height * 0.6  # 하단 40% (y 좌표가 큰 값이 하단, 더 넓게)
+        left_threshold = img_width * 0.6  # 좌측 60% (흰색 박스가 좌측 하단에 위치, 더 넓게)
         
-        # 신뢰도 기반으로 텍스트 필터링 및 정렬
-        # 신뢰도가 높은 텍스트를 우선 사용 (임계값을 낮춰서 더 많은 텍스트 포함)
-        filtered_results = []
-        for result in results:
-            if len(result) >= 3:  # (bbox, text, confidence) 형식
-                confidence = result[2]
-                if confidence >= 0.15:  # 신뢰도 15% 이상 사용 (더 낮게 설정하여 한글, 숫자도 포함)
-                    filtered_results.append(result)
+        # 좌측 하단 영역의 텍스트 추출 (최우선)
+        bottom_left_texts = []
+        for result in filtered_results:
+            if len(result) >= 2:
+                bbox = result[0]
+                text = result[1]
+                if bbox and len(bbox) >= 4:
+                    # 바운딩 박스의 하단 점 계산
+                    # 이미지 좌표계: (0,0)이 좌측 상단, y가 아래로 증가
+                    min_x = min([p[0] for p in bbox if len(p) >= 2])
+                    max_x = max([p[0] for p in bbox if len(p) >= 2])
+                    max_y_point = max([p[1] for p in bbox if len(p) >= 2])
+                    min_y_point = min([p[1] for p in bbox if len(p) >= 2])
+                    # 바운딩 박스의 중심점도 계산 (더 정확한 위치 판단)
+                    center_x = (min_x + max_x) / 2
+                    center_y = (min_y_point + max_y_point) / 2
+                    
+                    # 좌측 하단 영역에 있는지 확인 (하단 30%, 좌측 50%)
+                    # 흰색 박스는 좌측 하단에 위치하므로 이 영역에 집중
+                    is_bottom_left = (max_y_point >= bottom_threshold and 
+                                     center_y >= bottom_threshold and
+                                     (center_x <= left_threshold or min_x <= left_threshold))
+                    
+                    if is_bottom_left:
+                        # 좌측 하단 영역에 있는 텍스트만 추출
+                        bottom_left_texts.append((result, max_y_point, min_x))  # (result, y, x) - 정렬용
         
-        # 좌측 하단 흰색 영역 정의 (우선순위 최고)
-        # 이미지의 하단 40%, 좌측 60% - 흰색 박스 영역에 집중 (더 넓게)
-        if img_width > 0 and img_height > 0 and filtered_results:
-            # 좌측 하단 영역을 더 넓게 정의 (흰색 박스 영역)
-            bottom_threshold = img_height * 0.6  # 하단 40% (y 좌표가 큰 값이 하단, 더 넓게)
-            left_threshold = img_width * 0.6  # 좌측 60% (흰색 박스가 좌측 하단에 위치, 더 넓게)
-            
-            # 좌측 하단 영역의 텍스트 추출 (최우선)
-            bottom_left_texts = []
-            for result in filtered_results:
-                if len(result) >= 2:
-                    bbox = result[0]
-                    text = result[1]
-                    if bbox and len(bbox) >= 4:
-                        # 바운딩 박스의 하단 점 계산
-                        # 이미지 좌표계: (0,0)이 좌측 상단, y가 아래로 증가
-                        min_x = min([p[0] for p in bbox if len(p) >= 2])
-                        max_x = max([p[0] for p in bbox if len(p) >= 2])
-                        max_y_point = max([p[1] for p in bbox if len(p) >= 2])
-                        min_y_point = min([p[1] for p in bbox if len(p) >= 2])
-                        # 바운딩 박스의 중심점도 계산 (더 정확한 위치 판단)
-                        center_x = (min_x + max_x) / 2
-                        center_y = (min_y_point + max_y_point) / 2
+        # 좌측 하단 영역의 텍스트를 y 좌표(하단 우선), x 좌표(좌측 우선) 순으로 정렬
+        bottom_left_texts.sort(key=lambda x: (-x[1], x[2]))  # y는 내림차순(하단 우선), x는 오름차순(좌측 우선)
+        
+        # 좌측 하단 텍스트를 공백으로 합치기 (흰색 박스 내 텍스트들이 함께 인식되도록)
+        bottom_left_text_parts = []
+        for item in bottom_left_texts:
+            text = item[0][1]
+            bottom_left_text_parts.append(text)
+        bottom_left_text = ' '.join(bottom_left_text_parts)
+        
+        # 좌측 하단 영역에서 "비콘" 텍스트와 숫자를 찾아서 조합 (최우선)
+        beacon_texts = []
+        number_texts = []
+        for item in bottom_left_texts:
+            text = item[0][1]
+            bbox = item[0][0]
+            # "비콘" 패턴 찾기
+            if re.search(r'비[콘콕콘]', text, re.IGNORECASE):
+                beacon_texts.append((item, text, bbox))
+            # 3자리 또는 4자리 숫자 패턴 찾기
+            if re.search(r'[0-9OoIl|]{3,4}', text):
+                number_texts.append((item, text, bbox))
+    else:
+        bottom_left_text = ""
+        beacon_texts = []
+        number_texts = []
+    
+    # ===== 우선순위 1: 좌측 하단 흰색 영역에서 '비콘' 옆에 숫자 패턴 =====
+    # 좌측 하단 흰색 영역에 집중하여 "비콘" 옆 숫자 인식 (최우선)
+    
+    # 먼저 좌측 하단 영역에서 "비콘"과 숫자가 분리되어 인식된 경우 처리 (최우선)
+    if img_width > 0 and img_height > 0 and beacon_texts and number_texts:
+        # "비콘" 텍스트와 숫자 텍스트가 근접한 경우 조합
+        for beacon_item, beacon_text, beacon_bbox in beacon_texts:
+            if beacon_bbox and len(beacon_bbox) >= 4:
+                beacon_center_x = sum([p[0] for p in beacon_bbox if len(p) >= 2]) / len([p for p in beacon_bbox if len(p) >= 2])
+                beacon_center_y = sum([p[1] for p in beacon_bbox if len(p) >= 2]) / len([p for p in beacon_bbox if len(p) >= 2])
+                
+                for num_item, num_text, num_bbox in number_texts:
+                    if num_bbox and len(num_bbox) >= 4:
+                        num_center_x = sum([p[0] for p in num_bbox if len(p) >= 2]) / len([p for p in num_bbox if len(p) >= 2])
+                        num_center_y = sum([p[1] for p in num_bbox if len(p) >= 2]) / len([p for p in num_bbox if len(p) >= 2])
                         
-                        # 좌측 하단 영역에 있는지 확인 (하단 30%, 좌측 50%)
-                        # 흰색 박스는 좌측 하단에 위치하므로 이 영역에 집중
-                        is_bottom_left = (max_y_point >= bottom_threshold and 
-                                         center_y >= bottom_threshold and
-                                         (center_x <= left_threshold or min_x <= left_threshold))
+                        # 거리 계산 (픽셀 단위)
+                        distance = ((beacon_center_x - num_center_x)**2 + (beacon_center_y - num_center_y)**2)**0.5
+                        # 이미지 크기의 20% 이내면 근접한 것으로 간주
+                        max_distance = min(img_width, img_height) * 0.2
                         
-                        if is_bottom_left:
-                            # 좌측 하단 영역에 있는 텍스트만 추출
-                            bottom_left_texts.append((result, max_y_point, min_x))  # (result, y, x) - 정렬용
-            
-            # 좌측 하단 영역의 텍스트를 y 좌표(하단 우선), x 좌표(좌측 우선) 순으로 정렬
-            bottom_left_texts.sort(key=lambda x: (-x[1], x[2]))  # y는 내림차순(하단 우선), x는 오름차순(좌측 우선)
-            
-            # 좌측 하단 텍스트를 공백으로 합치기 (흰색 박스 내 텍스트들이 함께 인식되도록)
-            bottom_left_text_parts = []
-            for item in bottom_left_texts:
-                text = item[0][1]
-                bottom_left_text_parts.append(text)
-            bottom_left_text = ' '.join(bottom_left_text_parts)
-            
-            # 좌측 하단 영역에서 "비콘" 텍스트와 숫자를 찾아서 조합 (최우선)
-            beacon_texts = []
-            number_texts = []
-            for item in bottom_left_texts:
-                text = item[0][1]
-                bbox = item[0][0]
-                # "비콘" 패턴 찾기
-                if re.search(r'비[콘콕콘]', text, re.IGNORECASE):
-                    beacon_texts.append((item, text, bbox))
-                # 3자리 또는 4자리 숫자 패턴 찾기
-                if re.search(r'[0-9OoIl|]{3,4}', text):
-                    number_texts.append((item, text, bbox))
-        else:
-            bottom_left_text = ""
-            beacon_texts = []
-            number_texts = []
+                        if distance <= max_distance:
+                            # "비콘"과 숫자를 조합하여 패턴 매칭 시도
+                            combined_text = f"{beacon_text} {num_text}"
+                            # 간단한 패턴으로 먼저 확인
+                            simple_match = re.search(r'비[콘콕콘]\s+([0-9OoIl|]{4})', combined_text, re.IGNORECASE)
+                            if simple_match:
+                                value_str = simple_match.group(1)
+                                result = normalize_four_digit_minor(value_str)
+                                if result and result != "0000":
+                                    return result
+    
+    # 좌측 하단 흰색 영역에서 먼저 검색 (최우선순위)
+    if bottom_left_text:
+        # 우선순위 1: 좌측 하단에서 숫자만 직접 찾기 (한글 '비콘' 인식 실패 대비)
+        # 좌측 하단 영역에 3-4자리 숫자가 있고, "공종", "위치", "일자" 같은 키워드가 있으면
+        # 그 근처의 숫자를 Minor로 사용 (흰색 박스 영역)
+        # "공종" 다음에 나오는 숫자를 우선적으로 찾기
+        gongjong_match = re.search(r'공종', bottom_left_text)
+        if gongjong_match:
+            # "공종" 다음에 나오는 3-4자리 숫자 찾기
+            after_gongjong = bottom_left_text[gongjong_match.end():]
+            number_match = re.search(r'([0-9OoIl|]{3,4})', after_gongjong)
+            if number_match:
+                value_str = number_match.group(1)
+                result = normalize_four_digit_minor(value_str)
+                if result and result != "0000":
+                    return result
         
-        # ===== 우선순위 1: 좌측 하단 흰색 영역에서 '비콘' 옆에 숫자 패턴 =====
-        # 좌측 하단 흰색 영역에 집중하여 "비콘" 옆 숫자 인식 (최우선)
+        # "공종"이 없으면 좌측 하단의 첫 번째 3-4자리 숫자 사용 (백업)
+        all_numbers = re.findall(r'([0-9OoIl|]{3,4})', bottom_left_text)
+        if all_numbers:
+            # 4자리 숫자를 우선, 없으면 3자리 숫자 사용
+            four_digit_numbers = [n for n in all_numbers if len(re.sub(r'[^0-9]', '', n)) >= 4]
+            if four_digit_numbers:
+                value_str = four_digit_numbers[0]
+            else:
+                value_str = all_numbers[0]
+            result = normalize_four_digit_minor(value_str)
+            if result and result != "0000":
+                return result
         
-        # 먼저 좌측 하단 영역에서 "비콘"과 숫자가 분리되어 인식된 경우 처리 (최우선)
-        if img_width > 0 and img_height > 0 and beacon_texts and number_texts:
-            # "비콘" 텍스트와 숫자 텍스트가 근접한 경우 조합
-            for beacon_item, beacon_text, beacon_bbox in beacon_texts:
-                if beacon_bbox and len(beacon_bbox) >= 4:
-                    beacon_center_x = sum([p[0] for p in beacon_bbox if len(p) >= 2]) / len([p for p in beacon_bbox if len(p) >= 2])
-                    beacon_center_y = sum([p[1] for p in beacon_bbox if len(p) >= 2]) / len([p for p in beacon_bbox if len(p) >= 2])
-                    
-                    for num_item, num_text, num_bbox in number_texts:
-                        if num_bbox and len(num_bbox) >= 4:
-                            num_center_x = sum([p[0] for p in num_bbox if len(p) >= 2]) / len([p for p in num_bbox if len(p) >= 2])
-                            num_center_y = sum([p[1] for p in num_bbox if len(p) >= 2]) / len([p for p in num_bbox if len(p) >= 2])
-                            
-                            # 거리 계산 (픽셀 단위)
-                            distance = ((beacon_center_x - num_center_x)**2 + (beacon_center_y - num_center_y)**2)**0.5
-                            # 이미지 크기의 20% 이내면 근접한 것으로 간주
-                            max_distance = min(img_width, img_height) * 0.2
-                            
-                            if distance <= max_distance:
-                                # "비콘"과 숫자를 조합하여 패턴 매칭 시도
-                                combined_text = f"{beacon_text} {num_text}"
-                                # 간단한 패턴으로 먼저 확인
-                                simple_match = re.search(r'비[콘콕콘]\s+([0-9OoIl|]{4})', combined_text, re.IGNORECASE)
-                                if simple_match:
-                                    value_str = simple_match.group(1)
-                                    result = normalize_four_digit_minor(value_str)
-                                    if result and result != "0000":
-                                        return result
+        # 우선순위 2: 좌측 하단 흰색 영역에서 "비콘" 패턴 검색
+        result = first_beacon_minor(BEACON_FOUR_DIGIT_PATTERNS, bottom_left_text)
+        if result:
+            return result
         
-        beacon_patterns_four_digit = [
-            # 정확한 '비콘' 패턴 (직접 인접) - 최우선
-            # 3자리 또는 4자리 숫자 모두 처리 (3자리는 4자리로 패딩)
-            # 한글 '비콘' 인식 실패를 대비해 더 유연한 패턴 추가
-            r'비콘\s+([0-9OoIl|]{3,4})',  # 비콘 307 또는 비콘 0307 (가장 일반적인 형식)
-            r'비콘\s*[:：]?\s*([0-9OoIl|]{3,4})',  # 비콘: 307 또는 비콘: 0307
-            r'비콘\s*[:\s]*([0-9OoIl|]{3,4})',  # 비콘: 307 또는 비콘 307 (더 유연한 공백 처리)
-            r'비콘([0-9OoIl|]{3,4})',  # 비콘307 또는 비콘0307 (공백 없음)
-            r'([0-9OoIl|]{3,4})\s*비콘',  # 307 비콘 또는 0307 비콘 (순서 반대)
-            # '비콘' 앞에 단어가 있는 경우 (예: "공종 비콘 307" 또는 "공종 비콘 0307") - 중요!
-            r'\S+\s+비콘\s+([0-9OoIl|]{3,4})',  # 공종 비콘 307 또는 공종 비콘 0307
-            r'\S+\s+비콘\s*[:：]?\s*([0-9OoIl|]{3,4})',  # 공종 비콘: 307 또는 공종 비콘: 0307
-            r'\S+\s+비콘\s*[:\s]*([0-9OoIl|]{3,4})',  # 공종 비콘: 307 (더 유연한 공백 처리)
-            # '비콘'과 숫자 사이에 다른 단어가 있는 경우 (예: "비콘 공종 307")
-            r'비콘\s+\S+\s+([0-9OoIl|]{3,4})',  # 비콘 공종 307 또는 비콘 공종 0307
-            # OCR 오류 패턴 (비콕 등) - 한글 인식 실패 대비
-            r'비[콘콕]\s+([0-9OoIl|]{3,4})',  # 비콘 307 또는 비콕 307
-            r'비[콘콕]\s*[:：]?\s*([0-9OoIl|]{3,4})',  # 비콘: 307 또는 비콕: 307
-            r'비[콘콕]\s*[:\s]*([0-9OoIl|]{3,4})',  # 비콘: 307 (더 유연한 공백 처리)
-            r'비[콘콕]([0-9OoIl|]{3,4})',  # 비콘307 또는 비콕307
-            r'([0-9OoIl|]{3,4})\s*비[콘콕]',  # 307 비콘 또는 307 비콕
-            r'\S+\s+비[콘콕]\s+([0-9OoIl|]{3,4})',  # 공종 비콘 307 (OCR 오류 포함)
-            r'비[콘콕]\s+\S+\s+([0-9OoIl|]{3,4})',  # 비콘 공종 307 (OCR 오류 포함)
-            # 더 유연한 패턴 (한 글자 오류 허용, 한글 인식 실패 대비)
-            r'비[콘콕콘]\s+([0-9OoIl|]{3,4})',  # 비콘 307 (다양한 변형)
-            r'비[콘콕콘]\s*[:：]?\s*([0-9OoIl|]{3,4})',  # 비콘: 307
-            r'비[콘콕콘]\s*[:\s]*([0-9OoIl|]{3,4})',  # 비콘: 307 (더 유연한 공백 처리)
-            r'비[콘콕콘]([0-9OoIl|]{3,4})',  # 비콘307
-            r'\S+\s+비[콘콕콘]\s+([0-9OoIl|]{3,4})',  # 공종 비콘 307 (유연한 변형)
-            r'비[콘콕콘]\s+\S+\s+([0-9OoIl|]{3,4})',  # 비콘 공종 307 (유연한 변형)
-            # 한글 '비'만 인식된 경우 (콘 인식 실패)
-            r'비\s+([0-9OoIl|]{3,4})',  # 비 307
-            r'비\s*[:：]?\s*([0-9OoIl|]{3,4})',  # 비: 307
-            r'\S+\s+비\s+([0-9OoIl|]{3,4})',  # 공종 비 307
-            # 한글 '콘'만 인식된 경우 (비 인식 실패)
-            r'콘\s+([0-9OoIl|]{3,4})',  # 콘 307
-            r'콘\s*[:：]?\s*([0-9OoIl|]{3,4})',  # 콘: 307
-            r'\S+\s+콘\s+([0-9OoIl|]{3,4})',  # 공종 콘 307
+        # 우선순위 3: 좌측 하단 영역에서 "비콘"과 숫자가 분리되어 있는 경우 직접 찾기
+        # 한글 '비콘'의 다양한 변형 패턴 시도
+        beacon_patterns_variants = [
+            r'비[콘콕콘]',  # 비콘, 비콕, 비콘
+            r'[비빕]\s*[콘콕]',  # 비 콘, 빕 콕 등
+            r'[비빕][콘콕]',  # 비콘, 빕콕 등
         ]
         
-        # 좌측 하단 흰색 영역에서 먼저 검색 (최우선순위)
-        if bottom_left_text:
-            # 우선순위 1: 좌측 하단에서 숫자만 직접 찾기 (한글 '비콘' 인식 실패 대비)
-            # 좌측 하단 영역에 3-4자리 숫자가 있고, "공종", "위치", "일자" 같은 키워드가 있으면
-            # 그 근처의 숫자를 Minor로 사용 (흰색 박스 영역)
-            # "공종" 다음에 나오는 숫자를 우선적으로 찾기
-            gongjong_match = re.search(r'공종', bottom_left_text)
-            if gongjong_match:
-                # "공종" 다음에 나오는 3-4자리 숫자 찾기
-                after_gongjong = bottom_left_text[gongjong_match.end():]
-                number_match = re.search(r'([0-9OoIl|]{3,4})', after_gongjong)
+        for beacon_pattern in beacon_patterns_variants:
+            beacon_match = re.search(beacon_pattern, bottom_left_text, re.IGNORECASE)
+            if beacon_match:
+                # "비콘" 다음에 나오는 3자리 또는 4자리 숫자 찾기
+                after_beacon = bottom_left_text[beacon_match.end():]
+                number_match = re.search(r'([0-9OoIl|]{3,4})', after_beacon)
                 if number_match:
                     value_str = number_match.group(1)
                     result = normalize_four_digit_minor(value_str)
                     if result and result != "0000":
                         return result
-            
-            # "공종"이 없으면 좌측 하단의 첫 번째 3-4자리 숫자 사용 (백업)
-            all_numbers = re.findall(r'([0-9OoIl|]{3,4})', bottom_left_text)
-            if all_numbers:
-                # 4자리 숫자를 우선, 없으면 3자리 숫자 사용
-                four_digit_numbers = [n for n in all_numbers if len(re.sub(r'[^0-9]', '', n)) >= 4]
-                if four_digit_numbers:
-                    value_str = four_digit_numbers[0]
-                else:
-                    value_str = all_numbers[0]
-                result = normalize_four_digit_minor(value_str)
-                if result and result != "0000":
-                    return result
-            
-            # 우선순위 2: 좌측 하단 흰색 영역에서 "비콘" 패턴 검색
-            for pattern in beacon_patterns_four_digit:
-                matches = re.findall(pattern, bottom_left_text)
-                if matches:
-                    value_str = matches[0]
-                    result = normalize_four_digit_minor(value_str)
-                    if result and result != "0000":
-                        return result
-            
-            # 우선순위 3: 좌측 하단 영역에서 "비콘"과 숫자가 분리되어 있는 경우 직접 찾기
-            # 한글 '비콘'의 다양한 변형 패턴 시도
-            beacon_patterns_variants = [
-                r'비[콘콕콘]',  # 비콘, 비콕, 비콘
-                r'[비빕]\s*[콘콕]',  # 비 콘, 빕 콕 등
-                r'[비빕][콘콕]',  # 비콘, 빕콕 등
-            ]
-            
-            for beacon_pattern in beacon_patterns_variants:
-                beacon_match = re.search(beacon_pattern, bottom_left_text, re.IGNORECASE)
-                if beacon_match:
-                    # "비콘" 다음에 나오는 3자리 또는 4자리 숫자 찾기
-                    after_beacon = bottom_left_text[beacon_match.end():]
-                    number_match = re.search(r'([0-9OoIl|]{3,4})', after_beacon)
-                    if number_match:
-                        value_str = number_match.group(1)
-                        result = normalize_four_digit_minor(value_str)
-                        if result and result != "0000":
-                            return result
-                    
-                    # "비콘" 앞에 있는 3자리 또는 4자리 숫자 찾기 (순서 반대)
-                    before_beacon = bottom_left_text[:beacon_match.start()]
-                    number_match = re.search(r'([0-9OoIl|]{3,4})\s*$', before_beacon)
-                    if number_match:
-                        value_str = number_match.group(1)
-                        result = normalize_four_digit_minor(value_str)
-                        if result and result != "0000":
-                            return result
-        
-        # 좌측 하단 텍스트가 없는 경우 전체 이미지에서 검색 (백업)
-        if not bottom_left_text:
-            # 전체 텍스트 준비
-            full_text = ' '.join([result[1] for result in filtered_results])
-            
-            # 전체 텍스트에서 "공종" 다음 숫자 검색
-            gongjong_match = re.search(r'공종', full_text)
-            if gongjong_match:
-                after_gongjong = full_text[gongjong_match.end():]
-                number_match = re.search(r'([0-9OoIl|]{3,4})', after_gongjong)
+                
+                # "비콘" 앞에 있는 3자리 또는 4자리 숫자 찾기 (순서 반대)
+                before_beacon = bottom_left_text[:beacon_match.start()]
+                number_match = re.search(r'([0-9OoIl|]{3,4})\s*$', before_beacon)
                 if number_match:
                     value_str = number_match.group(1)
                     result = normalize_four_digit_minor(value_str)
                     if result and result != "0000":
                         return result
-            
-            # 전체 텍스트에서 "비콘" 패턴 검색
-            for pattern in beacon_patterns_four_digit:
-                matches = re.findall(pattern, full_text)
-                if matches:
-                    value_str = matches[0]
-                    result = normalize_four_digit_minor(value_str)
-                    if result and result != "0000":
-                        return result
-            
-            # 전체 텍스트에서 flexible 패턴 검색
-            for pattern in beacon_patterns_flexible:
-                matches = re.findall(pattern, full_text)
-                if matches:
-                    value_str = matches[0]
-                    result = normalize_four_digit_minor(value_str)
-                    if result and result != "0000":
-                        return result
-        
-        # 비콘 패턴 (4자리 미만도 시도 - 4자리로 패딩)
-        beacon_patterns_flexible = [
-            # 정확한 '비콘' 패턴 (직접 인접) - 최우선
-            r'비콘\s+([0-9OoIl|]+)',  # 비콘 001 (가장 일반적인 형식)
-            r'비콘\s*[:：]?\s*([0-9OoIl|]+)',  # 비콘: 001
-            r'비콘([0-9OoIl|]+)',  # 비콘001
-            # '비콘' 앞에 단어가 있는 경우 (예: "공종 비콘 0281") - 중요!
-            r'\S+\s+비콘\s+([0-9OoIl|]+)',  # 공종 비콘 0281 또는 XXX 비콘 0281
-            r'\S+\s+비콘\s*[:：]?\s*([0-9OoIl|]+)',  # 공종 비콘: 0281
-            # '비콘'과 숫자 사이에 다른 단어가 있는 경우 (예: "비콘 공종 0293")
-            r'비콘\s+\S+\s+([0-9OoIl|]+)',  # 비콘 공종 0293 또는 비콘 XXX 0293
-            # OCR 오류 패턴
-            r'비[콘콕]\s+([0-9OoIl|]+)',  # 비콘 001 또는 비콕 001
-            r'비[콘콕]\s*[:：]?\s*([0-9OoIl|]+)',  # 비콘: 001 또는 비콕: 001
-            r'비[콘콕]([0-9OoIl|]+)',  # 비콘001 또는 비콕001
-            r'\S+\s+비[콘콕]\s+([0-9OoIl|]+)',  # 공종 비콘 0281 (OCR 오류 포함)
-            r'비[콘콕]\s+\S+\s+([0-9OoIl|]+)',  # 비콘 공종 0293 (OCR 오류 포함)
-            # 더 유연한 패턴
-            r'비[콘콕콘]\s+([0-9OoIl|]+)',  # 비콘 001 (다양한 변형)
-            r'비[콘콕콘]\s*[:：]?\s*([0-9OoIl|]+)',  # 비콘: 001
-            r'비[콘콕콘]([0-9OoIl|]+)',  # 비콘001
-            r'\S+\s+비[콘콕콘]\s+([0-9OoIl|]+)',  # 공종 비콘 0281 (유연한 변형)
-            r'비[콘콕콘]\s+\S+\s+([0-9OoIl|]+)',  # 비콘 공종 0293 (유연한 변형)
-        ]
-        
-        # 좌측 하단 흰색 영역에서 flexible 패턴 검색 (최우선순위)
-        if bottom_left_text:
-            for pattern in beacon_patterns_flexible:
-                matches = re.findall(pattern, bottom_left_text)
-                if matches:
-                    value_str = matches[0]
-                    result = normalize_four_digit_minor(value_str)
-                    if result and result != "0000":
-                        return result
+    
+    # 좌측 하단 텍스트가 없는 경우 전체 이미지에서 검색 (백업)
+    if not bottom_left_text:
+        # 전체 텍스트 준비
+        full_text = ' '.join([result[1] for result in filtered_results])
         
-        # ===== 우선순위 2: 좌측 하단에서 '설치' 옆에 숫자 패턴 =====
-        if bottom_left_text:
-            install_patterns = [
-                r'설치\s*[:：]?\s*([0-9OoIl|]{3,4})',  # 설치: 307 또는 설치: 0307
-                r'설치\s+([0-9OoIl|]{3,4})',  # 설치 307
-                r'설치([0-9OoIl|]{3,4})',  # 설치307
-                r'([0-9OoIl|]{3,4})\s*설치',  # 307 설치
-            ]
-            
-            for pattern in install_patterns:
-                matches = re.findall(pattern, bottom_left_text)
-                if matches:
-                    value_str = matches[0]
-                    result = normalize_four_digit_minor(value_str)
-                    if result and result != "0000":
-                        return result
+        # 전체 텍스트에서 "공종" 다음 숫자 검색
+        gongjong_match = re.search(r'공종', full_text)
+        if gongjong_match:
+            after_gongjong = full_text[gongjong_match.end():]
+            number_match = re.search(r'([0-9OoIl|]{3,4})', after_gongjong)
+            if number_match:
+                value_str = number_match.group(1)
+                result = normalize_four_digit_minor(value_str)
+                if result and result != "0000":
+                    return result
         
-        # ===== 우선순위 3: 좌측 하단에서 'Minor' 영문 옆에 숫자 패턴 =====
-        if bottom_left_text:
-            minor_patterns = [
-                r'(?:Minor|Mnor|Inor|minor|mnor|inor)\s*[:：]?\s*([0-9OoIl|]{3,4})',  # Minor: 307
-                r'(?:Minor|Mnor|Inor|minor|mnor|inor)\s+([0-9OoIl|]{3,4})',  # Minor 307
-                r'(?:Minor|Mnor|Inor|minor|mnor|inor)([0-9OoIl|]{3,4})',  # Minor307
-            ]
-            
-            for pattern in minor_patterns:
-                matches = re.findall(pattern, bottom_left_text, re.IGNORECASE)
-                if matches:
-                    value_str = matches[0]
-                    result = normalize_four_digit_minor(value_str)
-                    if result and result != "0000":
-                        return result
+        # 전체 텍스트에서 "비콘" 패턴 검색
+        result = first_beacon_minor(BEACON_FOUR_DIGIT_PATTERNS, full_text)
+        if result:
+            return result
         
-        return None
+        # 전체 텍스트에서 flexible 패턴 검색
+        result = first_beacon_minor(BEACON_FLEXIBLE_PATTERNS, full_text)
+        if result:
+            return result
+    
+    # 비콘 패턴 (4자리 미만도 시도 - 4자리로 패딩)
+    # 좌측 하단 흰색 영역에서 flexible 패턴 검색 (최우선순위)
+    if bottom_left_text:
+        result = first_beacon_minor(BEACON_FLEXIBLE_PATTERNS, bottom_left_text)
+        if result:
+            return result
+    
+    # ===== 우선순위 2: 좌측 하단에서 '설치' 옆에 숫자 패턴 =====
+    # ===== 우선순위 3: 좌측 하단에서 'Minor' 영문 옆에 숫자 패턴 =====
+    if bottom_left_text:
+        for patterns in (INSTALL_PATTERNS, MINOR_PATTERNS):
+            result = first_valid_minor(patterns, bottom_left_text)
+            if result:
+                return result
+    
+    return None
+
+def read_image_size(image_path):
+    """
+    이미지 헤더만 읽어 OCR 입력 기준 (너비, 높이) 반환 (실패 시 (0, 0))
+    EasyOCR(cv2)는 EXIF 회전을 적용해서 읽으므로 90도 회전(방향 5~8)이면 가로세로를 바꿈
+    """
+    try:
+        with PILImage.open(image_path) as img:
+            width, height = img.size
+            if img.getexif().get(0x0112) in (5, 6, 7, 8):
+                return height, width
+            return width, height
+    except Exception:
+        return 0, 0
+
+def init_ocr_worker(num_threads):
+    """OCR 프로세스 초기화: 프로세스 수만큼 CPU 코어를 나눠서 torch 스레드 과다 경쟁 방지"""
+    import torch
+    torch.set_num_threads(num_threads)
+
+def ocr_minor_batch(job):
+    """
+    같은 크기 이미지 묶음을 reader.readtext_batched로 한 번에 OCR (프로세스 풀 작업 함수)
+    job: (이미지 경로 목록, 너비, 높이)
+    반환: 이미지별 Minor 값, None(찾지 못함) 또는 예외 객체(OCR/추출 오류, 캐시하지 않음) 목록
+    """
+    batch, img_width, img_height = job
+    # 크기를 아는 묶음은 원본 크기 그대로 지정 (리사이즈 없이 한 번에 감지, bbox 좌표도 원본 기준)
+    size_params = dict(n_width=img_width, n_height=img_height) if img_width and img_height else {}
+    try:
+        results_list = get_reader().readtext_batched(
+            [preprocess_image(image_path) for image_path in batch],
+            batch_size=len(batch),
+            **size_params,
+            **OCR_PARAMS,
+        )
     except Exception as e:
-        print(f"  ❌ 오류 발생: {e}")
+        print(f"\n  ❌ OCR 오류 발생: {e}")
+        return [e] * len(batch)
+    
+    minor_values = []
+    for results in results_list:
+        try:
+            minor_values.append(extract_minor_from_ocr_results(results, img_width, img_height))
+        except Exception as e:
+            print(f"\n  ❌ 오류 발생: {e}")
+            minor_values.append(e)
+    return minor_values
+
+def load_ocr_cache():
+    """OCR 결과 캐시를 읽어 dict로 반환 (없거나 손상되었거나 OCR 설정이 달라진 경우 빈 dict)"""
+    try:
+        data = OCR_CACHE_PATH.read_bytes()
+        cache = orjson.loads(data) if orjson else json.loads(data)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cache, dict) or cache.get('tag') != OCR_CACHE_TAG:
+        return {}
+    return cache.get('entries', {})
+
+def save_ocr_cache(cache):
+    """OCR 결과 캐시 저장 (임시 파일에 쓴 뒤 교체하므로 중간에 끊겨도 기존 캐시가 깨지지 않음)"""
+    cache = {'tag': OCR_CACHE_TAG, 'entries': cache}
+    data = orjson.dumps(cache) if orjson else json.dumps(cache, ensure_ascii=False).encode('utf-8')
+    tmp_path = OCR_CACHE_PATH.with_suffix('.tmp')
+    try:
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, OCR_CACHE_PATH)
+    except OSError as e:
+        print(f"\n⚠ 경고: OCR 캐시 저장 실패: {e}")
+
+def ocr_cache_key(image_path):
+    """OCR 캐시 키 (파일명|크기|수정 시각, os.stat 한 번), 파일을 읽을 수 없으면 None"""
+    try:
+        st = os.stat(image_path)
+    except OSError:
         return None
+    return f"{image_path.name}|{st.st_size}|{int(st.st_mtime)}"
+
+def run_ocr_jobs(jobs):
+    """
+    OCR 묶음 작업을 실행하여 (작업, ocr_minor_batch 결과 목록)을 하나씩 반환하는 제너레이터
+    CPU에서는 묶음들을 여러 프로세스로 나눠 병렬 OCR (GPU는 현재 프로세스에서 처리)
+    """
+    if OCR_WORKERS == 1 or len(jobs) < 2 or gpu_available():
+        for job in jobs:
+            yield job, ocr_minor_batch(job)
+        return
+    
+    # 설치되지 않았으면 워커 초기화가 실패하여 BrokenProcessPool이 나므로 풀을 만들기 전에 확인
+    check_easyocr_installed()
+    
+    # torch가 초기화된 프로세스를 fork하면 멈출 수 있으므로 spawn 사용 (각 프로세스가 Reader를 한 번씩 로드)
+    max_workers = min(OCR_WORKERS, len(jobs))
+    with ProcessPoolExecutor(max_workers=max_workers,
+                             mp_context=multiprocessing.get_context('spawn'),
+                             initializer=init_ocr_worker,
+                             initargs=(max(1, (os.cpu_count() or 1) // max_workers),)) as executor:
+        # map은 제출 순서대로 결과를 돌려주므로 (뒤 묶음이 먼저 끝나도 앞 묶음을 기다림) 파일 처리 순서가 항상 같음
+        yield from zip(jobs, executor.map(ocr_minor_batch, jobs))
+
+def iter_minor_values(image_paths):
+    """
+    이미지별 Minor 값을 (경로, Minor 값 또는 None)으로 하나씩 반환하는 제너레이터
+    - 파일명 규칙으로 확인되는 파일은 OCR 없이 바로 반환
+    - 이전 실행의 OCR 캐시에 있는 파일(파일명, 크기, 수정 시각 일치)도 OCR 없이 반환
+    - 나머지는 크기가 같은 이미지끼리 묶어 일괄 OCR
+    """
+    cache = load_ocr_cache()
+    by_filename = []
+    by_cache = []
+    cache_keys = {}
+    size_groups = {}
+    for image_path in image_paths:
+        filename_minor = extract_minor_from_filename(image_path.name)
+        if filename_minor and len(filename_minor) < 5:
+            by_filename.append((image_path, f"{int(filename_minor):04d}"))
+            continue
+        key = ocr_cache_key(image_path)
+        if key is not None and key in cache:
+            by_cache.append((image_path, cache[key]))
+        else:
+            cache_keys[image_path] = key
+            size_groups.setdefault(read_image_size(image_path), []).append(image_path)
+    
+    needs_ocr = sum(len(group) for group in size_groups.values())
+    print(f"  파일명으로 확인: {len(by_filename)}개 | 캐시: {len(by_cache)}개 | OCR 필요: {needs_ocr}개\n")
+    yield from by_filename
+    yield from by_cache
+    
+    jobs = []
+    for (img_width, img_height), group in size_groups.items():
+        # 크기를 모르는 이미지는 묶지 않고 한 장씩 처리
+        batch_size = OCR_BATCH_SIZE if img_width and img_height else 1
+        for start in range(0, len(group), batch_size):
+            jobs.append((group[start:start + batch_size], img_width, img_height))
+    
+    # 중간에 중단되어도 그때까지의 OCR 결과는 캐시에 남김
+    try:
+        for (batch, _, _), minor_values in run_ocr_jobs(jobs):
+            for image_path, minor_value in zip(batch, minor_values):
+                if isinstance(minor_value, Exception):
+                    # OCR/추출 오류는 캐시하지 않음 (다음 실행에서 다시 시도)
+                    minor_value = None
+                elif cache_keys[image_path] is not None:
+                    cache[cache_keys[image_path]] = minor_value
+                yield image_path, minor_value
+    finally:
+        if jobs:
+            save_ocr_cache(cache)
 
 def print_progress_bar(current, total, bar_length=40):
     """프로그레스 바 출력"""
@@ -559,12 +753,11 @@ def format_time(seconds):
         return f"{hours}시간 {minutes}분"
 
 def count_image_files(directory):
-    """디렉토리의 이미지 파일 개수를 세는 함수"""
-    image_extensions = {'.jpg', '.jpeg', '.png', '.JPG', '.JPEG', '.PNG'}
+    """디렉토리의 이미지 파일 개수를 세는 함수 (os.walk는 내부적으로 os.scandir 사용, Path 생성 없음)"""
     if not directory.exists():
         return 0
-    return len([f for f in directory.rglob('*') 
-                if f.is_file() and f.suffix in image_extensions])
+    return sum(1 for _, _, files in os.walk(directory)
+               for name in files if os.path.splitext(name)[1].lower() in IMAGE_EXTENSIONS)
 
 def verify_file_location(file_path, current_minor_value):
     """
@@ -612,8 +805,6 @@ def recheck_unknown_files():
     print(f"시작 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
     
     # 1. source와 output 파일 수 비교
-    image_extensions = {'.jpg', '.jpeg', '.png', '.JPG', '.JPEG', '.PNG'}
-    
     source_count = count_image_files(SOURCE_DIR)
     output_count = count_image_files(OUTPUT_DIR)
     
@@ -646,18 +837,20 @@ def recheck_unknown_files():
     print("="*70)
     
     all_output_files = []
-    for folder in OUTPUT_DIR.iterdir():
-        if folder.is_dir() and folder.name != 'Unknown':  # Unknown 폴더 제외
-            for file_path in folder.iterdir():
-                if file_path.is_file() and file_path.suffix in image_extensions:
-                    # 현재 폴더명에서 Minor 값 추출
-                    folder_name = folder.name
-                    if folder_name.startswith('Minor_'):
-                        current_minor = folder_name.replace('Minor_', '')
-                    else:
-                        current_minor = None
-                    
-                    all_output_files.append((file_path, current_minor))
+    with os.scandir(OUTPUT_DIR) as folders:
+        for folder in folders:
+            if folder.is_dir() and folder.name != 'Unknown':  # Unknown 폴더 제외
+                # 현재 폴더명에서 Minor 값 추출
+                folder_name = folder.name
+                if folder_name.startswith('Minor_'):
+                    current_minor = folder_name.replace('Minor_', '')
+                else:
+                    current_minor = None
+                
+                with os.scandir(folder.path) as entries:
+                    for entry in entries:
+                        if entry.is_file() and os.path.splitext(entry.name)[1].lower() in IMAGE_EXTENSIONS:
+                            all_output_files.append((Path(entry.path), current_minor))
     
     print(f"📁 총 {len(all_output_files)}개 파일을 검증합니다... (Unknown 폴더 제외)\n")
     
@@ -769,8 +962,10 @@ def recheck_unknown_files():
         print("✅ Unknown 폴더가 존재하지 않습니다.")
         return
     
-    unknown_files = sorted([f for f in UNKNOWN_DIR.iterdir() 
-                           if f.is_file() and f.suffix in image_extensions])
+    with os.scandir(UNKNOWN_DIR) as entries:
+        unknown_files = [Path(entry.path) for entry in entries
+                         if entry.is_file() and os.path.splitext(entry.name)[1].lower() in IMAGE_EXTENSIONS]
+    unknown_files.sort(key=lambda f: f.name)
     
     if not unknown_files:
         print("✅ Unknown 폴더에 재검사할 이미지가 없습니다.")
@@ -787,25 +982,20 @@ def recheck_unknown_files():
     # 통계 출력을 위한 변수
     stats_update_interval = 3  # 3개 파일마다 통계 업데이트
     
-    for idx, file_path in enumerate(unknown_files, 1):
-        file_start_time = time.time()
-        
-        # 진행률 표시
-        progress_bar = print_progress_bar(idx, total_unknown_files)
-        elapsed_time = time.time() - ocr_start_time
-        avg_time_per_file = elapsed_time / idx if idx > 0 else 0
-        remaining_files = total_unknown_files - idx
-        estimated_remaining_time = avg_time_per_file * remaining_files
-        
-        # 통계 정보 출력
-        if idx % stats_update_interval == 0 or idx == total_unknown_files:
-            print(f"\r{progress_bar} [{idx}/{total_unknown_files}] "
-                  f"재검사 중: {file_path.name[:50]:<50} "
-                  f"| 경과: {format_time(elapsed_time)} "
-                  f"| 예상 남은 시간: {format_time(estimated_remaining_time)}", end="")
+    # 파일명으로 확인되지 않는 파일은 같은 크기끼리 묶어서 일괄 OCR
+    file_start_time = time.time()
+    for idx, (file_path, minor_value) in enumerate(iter_minor_values(unknown_files), 1):
+        # 이전 파일 이후 걸린 시간 (일괄 OCR은 묶음의 첫 파일에 시간이 몰림)
+        now = time.time()
+        file_time, file_start_time = now - file_start_time, now
         
-        # Minor 값 추출
-        minor_value = extract_minor_value(file_path)
+        # 통계 정보는 매 N개마다 또는 마지막 파일일 때만 계산하여, 처리 결과와 함께 한 줄로 출력
+        show_stats = idx % stats_update_interval == 0 or idx == total_unknown_files
+        if show_stats:
+            progress_bar = print_progress_bar(idx, total_unknown_files)
+            elapsed_time = now - ocr_start_time
+            estimated_remaining_time = elapsed_time / idx * (total_unknown_files - idx)
+            line_end = "" if idx < total_unknown_files else "\n"
         
         if minor_value:
             # Minor 값을 확실히 4자리로 보장
@@ -857,20 +1047,22 @@ def recheck_unknown_files():
             moved_by_ocr += 1
             
             # 상세 정보 출력
-            if idx % stats_update_interval == 0 or idx == total_unknown_files:
-                file_time = time.time() - file_start_time
-                print(f"\r{progress_bar} [{idx}/{total_unknown_files}] "
-                      f"✓ {file_path.name[:40]:<40} → Minor_{minor_value:<15} "
-                      f"({file_time:.1f}초)", end="" if idx < total_unknown_files else "\n")
+            if show_stats:
+                sys.stdout.write(f"\r{progress_bar} [{idx}/{total_unknown_files}] "
+                                 f"✓ {file_path.name[:40]:<40} → Minor_{minor_value:<15} "
+                                 f"({file_time:.1f}초) "
+                                 f"| 예상 남은 시간: {format_time(estimated_remaining_time)}{line_end}")
+                sys.stdout.flush()
         else:
             # 여전히 Minor 값을 찾지 못한 경우
             still_unknown.append(file_path.name)
             
-            if idx % stats_update_interval == 0 or idx == total_unknown_files:
-                file_time = time.time() - file_start_time
-                print(f"\r{progress_bar} [{idx}/{total_unknown_files}] "
-                      f"⚠ {file_path.name[:40]:<40} → Unknown (유지) "
-                      f"({file_time:.1f}초)", end="" if idx < total_unknown_files else "\n")
+            if show_stats:
+                sys.stdout.write(f"\r{progress_bar} [{idx}/{total_unknown_files}] "
+                                 f"⚠ {file_path.name[:40]:<40} → Unknown (유지) "
+                                 f"({file_time:.1f}초) "
+                                 f"| 예상 남은 시간: {format_time(estimated_remaining_time)}{line_end}")
+                sys.stdout.flush()
     
     # OCR 재검사 결과 출력
     ocr_total_time = time.time() - ocr_start_time